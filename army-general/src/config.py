@@ -26,6 +26,16 @@ class AppConfig:
     # Full command templates
     secretary_run_command_template: str
     army_man_run_command_template: str
+    army_man_serve_command_template: str
+
+    # Scheduling
+    army_man_execution_mode: str
+    max_parallel_army_men: int
+    use_git_worktrees: bool
+    worktree_directory: str
+    pipeline_secretary_goals: bool
+    goal_ledger_filename: str
+    max_goal_attempts: int
 
     # Logging
     default_log_directory: str
@@ -61,9 +71,17 @@ class AppConfig:
         self.secretary_output_file = yaml_config.get("secretary_output_file")
         self.secretary_run_command_template = yaml_config.get("secretary_run_command_template")
         self.army_man_run_command_template = yaml_config.get("army_man_run_command_template")
+        self.army_man_serve_command_template = yaml_config.get("army_man_serve_command_template")
+        self.army_man_execution_mode = yaml_config.get("army_man_execution_mode", "subprocess")
         self.default_log_directory = yaml_config.get("default_log_directory")
         self.default_log_filename = yaml_config.get("default_log_filename")
         self.log_level = yaml_config.get("log_level")
+        self.max_parallel_army_men = yaml_config.get("max_parallel_army_men", 1)
+        self.use_git_worktrees = bool(yaml_config.get("use_git_worktrees", False))
+        self.worktree_directory = yaml_config.get("worktree_directory", "worktrees")
+        self.pipeline_secretary_goals = bool(yaml_config.get("pipeline_secretary_goals", False))
+        self.goal_ledger_filename = yaml_config.get("goal_ledger_filename", "goal-ledger.sqlite")
+        self.max_goal_attempts = yaml_config.get("max_goal_attempts", 1)
 
         # Load new flags, defaulting to False if not present
         self.log_secretary_output = bool(yaml_config.get("log_secretary_output", False))
@@ -81,6 +99,24 @@ class AppConfig:
             return "" 
         return os.path.join(self.root_git_path, self.secretary_output_file)
 
+    @property
+    def worktree_directory_path(self) -> str:
+        """
+        Constructs the full path to the directory holding per-goal worktrees.
+        Relative paths are resolved against the army-general directory.
+        """
+        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        return os.path.join(base_dir, self.worktree_directory)
+
+    @property
+    def goal_ledger_path(self) -> str:
+        """
+        Constructs the full path to the goal ledger database.
+        Relative paths are resolved against the army-general directory.
+        """
+        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        return os.path.join(base_dir, self.goal_ledger_filename)
+
     def validate(self) -> None:
         """
         Validates the loaded configuration settings.
@@ -96,12 +132,24 @@ class AppConfig:
             raise ValueError("secretary_run_command_template is not set in config.yaml.")
         if not self.army_man_run_command_template:
             raise ValueError("army_man_run_command_template is not set in config.yaml.")
+        if self.army_man_execution_mode not in ("subprocess", "worker"):
+            raise ValueError("army_man_execution_mode must be 'subprocess' or 'worker' in config.yaml.")
+        if self.army_man_execution_mode == "worker" and not self.army_man_serve_command_template:
+            raise ValueError("army_man_serve_command_template must be set in config.yaml when army_man_execution_mode is 'worker'.")
         if not self.default_log_directory:
             raise ValueError("default_log_directory is not set in config.yaml.")
         if not self.default_log_filename:
             raise ValueError("default_log_filename is not set in config.yaml.")
         if not self.log_level:
             raise ValueError("log_level is not set in config.yaml.")
+        if not isinstance(self.max_parallel_army_men, int) or self.max_parallel_army_men < 1:
+            raise ValueError("max_parallel_army_men must be a positive integer in config.yaml.")
+        if self.use_git_worktrees and not self.worktree_directory:
+            raise ValueError("worktree_directory must be set in config.yaml when use_git_worktrees is enabled.")
+        if not self.goal_ledger_filename:
+            raise ValueError("goal_ledger_filename is not set in config.yaml.")
+        if not isinstance(self.max_goal_attempts, int) or self.max_goal_attempts < 1:
+            raise ValueError("max_goal_attempts must be a positive integer in config.yaml.")
 
         # No validation needed for log_secretary_output and log_army_man_output
         # as they default to False and are boolean.
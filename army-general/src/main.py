@@ -6,14 +6,23 @@ It loads configuration, then orchestrates the execution of Secretary and
 Army Man components to process development tasks.
 """
 import asyncio
+import functools
+import json
 import logging
 import os
+import re
 import subprocess
+from collections import deque
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 
 from config import AppConfig
+from services.army_man_worker_pool import ArmyManWorkerError, ArmyManWorkerPool
 from services.git_service import GitService
+from services.goal_ledger import GoalLedger
+from services.goal_scheduler import GoalScheduler
+from services.worktree_manager import WorktreeManager
 from utils.logging_setup import LoggingSetup
 
 # 1. Initialize AppConfig first
@@ -32,50 +41,140 @@ logger.info(f"\n\n======== Logging initialized via LoggingSetup & AppConfig. Dat
 logger.debug("Debug level test message for detailed log from main.py.")
 
 
-def _log_subprocess_details(
-    process_name: str,
-    stdout_content: str | bytes,
-    stderr_content: str | bytes,
-    return_code: int
+# Matches the cost line the Army Man prints in its final summary
+ARMY_MAN_COST_PATTERN = re.compile(r"Total Aider Cost: \$([0-9]+(?:\.[0-9]+)?)")
+
+# Child output lines can be long (aider diffs), so raise asyncio's 64 KiB line limit
+SUBPROCESS_STREAM_LIMIT_BYTES = 1024 * 1024
+
+# Stderr lines repeated at ERROR when a child fails, since they were streamed at WARNING before its exit code was known
+SUBPROCESS_STDERR_TAIL_LINES = 50
+
+
+async def _stream_subprocess_output(
+    stream: asyncio.StreamReader,
+    log_prefix: str,
+    log_level: int,
+    log_enabled: bool,
+    on_line: Callable[[str], None] | None = None
 ) -> None:
-    """Logs the stdout and stderr from a subprocess if log_flag is True.
+    """Reads a child's stream line by line as it is produced, logging each line if enabled.
+
+    The stream is always drained, even when logging is disabled, so the child never blocks on a full pipe.
+
+    Args:
+        stream: The stdout or stderr stream of the child process.
+        log_prefix: Prefix for every logged line (e.g., "[SECRETARY STDOUT]").
+        log_level: Level used to log each line.
+        log_enabled: Whether lines are written to the General's log at all.
+        on_line: Optional callback invoked with every decoded line, whether or not it is logged.
+    """
+    while True:
+        try:
+            raw_line = await stream.readline()
+        except ValueError:
+            # asyncio already discarded the over-long line; keep reading instead of stalling the child
+            logger.warning(f"{log_prefix}: (line longer than {SUBPROCESS_STREAM_LIMIT_BYTES} bytes skipped)")
+            continue
+        if not raw_line:
+            return
+        line = raw_line.decode('utf-8', errors='replace').rstrip()
+        if on_line:
+            on_line(line)
+        if log_enabled:
+            logger.log(log_level, f"{log_prefix}: {line}")
+
+
+async def _run_subprocess(
+    process_name: str,
+    command_to_run: str,
+    cwd: str,
+    log_output: bool,
+    on_stdout_line: Callable[[str], None] | None = None
+) -> bool:
+    """Runs a child process, streaming its stdout and stderr into the General's log while it runs.
 
     Args:
         process_name: Name of the subprocess (e.g., "Secretary") for log prefixes.
-        stdout_content: The stdout content (str or bytes) from the subprocess.
-        stderr_content: The stderr content (str or bytes) from the subprocess.
-        return_code: The return code of the subprocess, used to determine
-                     log level for stderr (ERROR if non-zero, WARNING if zero).
+        command_to_run: The fully formatted command line from the config template.
+        cwd: Directory the command is run from.
+        log_output: Whether the child's output is written to the General's log.
+        on_stdout_line: Optional callback invoked with every stdout line.
+
+    Returns:
+        True if the child exited with code 0, False otherwise.
+    """
+    prefix = process_name.upper()
+    try:
+        # Command templates are full command lines (quoting included), so hand them to the shell as-is
+        process = await asyncio.create_subprocess_shell(
+            command_to_run,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=SUBPROCESS_STREAM_LIMIT_BYTES
+        )
+    except OSError as e:
+        logger.error(f"Run {process_name} command could not be started: {command_to_run} - {e}")
+        return False
+
+    if log_output:
+        logger.info(f"--- Streaming output from {process_name} (pid {process.pid}) ---")
+
+    stderr_tail: deque[str] = deque(maxlen=SUBPROCESS_STDERR_TAIL_LINES)
+    await asyncio.gather(
+        _stream_subprocess_output(process.stdout, f"[{prefix} STDOUT]", logging.INFO, log_output, on_stdout_line),
+        _stream_subprocess_output(process.stderr, f"[{prefix} STDERR]", logging.WARNING, log_output, stderr_tail.append),
+    )
+    return_code = await process.wait()
+
+    if log_output:
+        logger.info(f"--- End of output from {process_name} ---")
+
+    if return_code != 0:
+        logger.error(f"Run {process_name} failed with exit code: {return_code}")
+        if log_output and stderr_tail:
+            logger.error(f"Last {len(stderr_tail)} stderr line(s) of {process_name}:")
+            for line in stderr_tail:
+                logger.error(f"[{prefix} STDERR]: {line}")
+        return False
+    return True
+
+
+def _parse_published_goal_folder(line: str) -> str | None:
+    """Returns the goal folder announced by a streaming Secretary stdout line, or None for any other line."""
+    if not line.startswith("{"):
+        return None
+    try:
+        payload = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    goal_folder = payload.get("goal_folder") if isinstance(payload, dict) else None
+    return goal_folder if isinstance(goal_folder, str) and goal_folder else None
+
+async def _run_secretary(on_goal_folder: Callable[[str], None] | None = None) -> bool:
+    """
+    Runs the Secretary to turn the backlog into goal folders.
+
+    Args:
+        on_goal_folder: When given, the Secretary runs in streaming mode and this callback
+                        is invoked with each goal folder as soon as the Secretary publishes it.
     """
-    logger.info(f"--- Start of output from {process_name} ---")
-
-    # Process stdout
-    stdout_str = stdout_content.decode('utf-8', errors='replace') if isinstance(stdout_content, bytes) else stdout_content
-    if stdout_str and stdout_str.strip():
-        for line in stdout_str.splitlines():
-            logger.info(f"[{process_name.upper()} STDOUT]: {line}")
-    else:
-        logger.info(f"[{process_name.upper()} STDOUT]: (empty)")
-
-    # Process stderr
-    stderr_str = stderr_content.decode('utf-8', errors='replace') if isinstance(stderr_content, bytes) else stderr_content
-    if stderr_str and stderr_str.strip():
-        log_level = logging.ERROR if return_code != 0 else logging.WARNING
-        for line in stderr_str.splitlines():
-            logger.log(log_level, f"[{process_name.upper()} STDERR]: {line}")
-    else:
-        # Log as INFO if stderr is empty, consistent with previous behavior for empty streams
-        logger.info(f"[{process_name.upper()} STDERR]: (empty)")
-
-    logger.info(f"--- End of output from {process_name} ---")
-
-
-def _run_secretary() -> bool:
     # Implement Secretary execution:
     #    - Construct command and execute using app_config.secretary_run_command_template.
     command_to_run = app_config.secretary_run_command_template.format(
         target_folder=app_config.root_git_path
     )
+    on_stdout_line = None
+    if on_goal_folder:
+        command_to_run += " --stream_goals"
+
+        def _handle_stdout_line(line: str) -> None:
+            goal_folder = _parse_published_goal_folder(line)
+            if goal_folder:
+                on_goal_folder(goal_folder)
+
+        on_stdout_line = _handle_stdout_line
     logger.info(f"Constructed Secretary run command: {command_to_run}")
 
     # Current project root directory
@@ -83,140 +182,247 @@ def _run_secretary() -> bool:
     secretary_directory = os.path.join(current_root_directory, "army-secretary")
     logger.info(f"Secretary directory: {secretary_directory}")
 
-    # Run Secretary
-    try:
-        process = subprocess.run(
-            command_to_run,
-            cwd=secretary_directory,
-            capture_output=True,
-            text=True,        # Ensure text=True for str output
-            check=True,       # Ensure check=True to raise CalledProcessError on non-zero
-            encoding='utf-8'
-        )
-        if app_config.log_secretary_output:
-            # If check=True, we only reach here if returncode is 0
-            _log_subprocess_details(
-                process_name="Secretary",
-                stdout_content=process.stdout, # Will be str
-                stderr_content=process.stderr, # Will be str
-                return_code=process.returncode # Will be 0 here
-            )
-        logger.info("Secretary completed successfully.")
-        return True
-    except subprocess.CalledProcessError as e:
-        # Log the primary error message first
-        logger.error(f"Run Secretary failed with CalledProcessError: {e.returncode} - {e}")
-        # Then log the detailed output if flag is set
-        if app_config.log_secretary_output:
-            _log_subprocess_details(
-                process_name="Secretary",
-                stdout_content=e.stdout, # Will be bytes
-                stderr_content=e.stderr, # Will be bytes
-                return_code=e.returncode
-            )
-        return False
-    except FileNotFoundError:
-        logger.error(f"Run Secretary command not found: {command_to_run}")
+    if not await _run_subprocess("Secretary", command_to_run, secretary_directory, app_config.log_secretary_output, on_stdout_line):
         return False
+    logger.info("Secretary completed successfully.")
+    return True
 
-def _run_army_man(folder: str) -> bool:
+def _read_secretary_output_file(secretary_output_file: str) -> list[str]:
+    """Reads the goal folders listed in the Secretary's output file; returns an empty list if it cannot be read."""
+    if not os.path.exists(secretary_output_file):
+        logger.error(f"Secretary output file does not exist at the expected path: {secretary_output_file}.")
+        logger.error("\n\n\n ERROR: Are you sure BACKLOG.md was filled out with tasks?\n\n")
+        return []
+
+    logger.info(f"Reading Secretary output file: {secretary_output_file}")
+    try:
+        with open(secretary_output_file) as file:
+            folders = [line.strip() for line in file if line.strip()]
+        logger.info(f"Successfully read and parsed Secretary output file. Found {len(folders)} folders.")
+        return folders
+    except Exception as e: # Catch any exception during file open/read
+        logger.error(f"Failed to read or parse secretary output file {secretary_output_file}: {e}")
+        return []
+
+def _army_man_directory() -> str:
+    # Current project root directory
+    current_root_directory = Path(__file__).resolve().parent.parent.parent
+    return os.path.join(current_root_directory, "army-man-small-tweak")
+
+async def _run_army_man(
+    folder: str,
+    root_git_path: str,
+    on_cost: Callable[[float], None] | None = None,
+    worker_pool: ArmyManWorkerPool | None = None
+) -> bool:
     """
     Run the Army Man to work on a goal in the folder provided.  Implemented similar to _run_secretary
+
+    Args:
+        folder: The goal folder the Army Man works on.
+        root_git_path: The checkout the Army Man commits to (the main repo or a goal worktree).
+        on_cost: Optional callback invoked with the total aider cost the Army Man reports.
+        worker_pool: When given, the goal runs on a warm worker instead of a new process.
     """
+    process_name = f"Army Man {os.path.basename(os.path.normpath(folder))}"
+    if worker_pool is not None:
+        try:
+            goal_summary = await worker_pool.run_goal(folder, root_git_path)
+        except ArmyManWorkerError as e:
+            logger.error(f"{process_name} failed: {e}")
+            return False
+        if on_cost and goal_summary.get("total_aider_cost") is not None:
+            on_cost(float(goal_summary["total_aider_cost"]))
+        # The worker stays alive, so its summary reports the error path that a subprocess reports by exit code
+        if goal_summary.get("error_message"):
+            logger.error(f"{process_name} finished with error: {goal_summary['error_message']}")
+            return False
+        logger.info(f"{process_name} completed successfully.")
+        return True
+
     command_to_run = app_config.army_man_run_command_template.format(
-        target_folder=app_config.root_git_path,
+        target_folder=root_git_path,
         goal_path=folder
     )
     logger.info(f"Constructed Army Man run command: {command_to_run}")
-    logger.info("Executing Army Man...")
 
-    # Current project root directory
-    current_root_directory = Path(__file__).resolve().parent.parent.parent
-    army_man_directory = os.path.join(current_root_directory, "army-man-small-tweak")
+    army_man_directory = _army_man_directory()
     logger.info(f"Army Man directory: {army_man_directory}")
 
-    # Run Secretary
-    try:
-        logger.info("Running Army Man...")
-        process = subprocess.run(
-            command_to_run,
-            cwd=army_man_directory,
-            capture_output=True,
-            text=True,        # Ensure text=True
-            check=True,       # Ensure check=True
-            encoding='utf-8'
-        )
-        if app_config.log_army_man_output:
-            _log_subprocess_details(
-                process_name="Army Man",
-                stdout_content=process.stdout,
-                stderr_content=process.stderr,
-                return_code=process.returncode
-            )
-        logger.info("Army Man completed successfully.")
-        return True
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Run Army Man failed with CalledProcessError: {e.returncode} - {e}")
-        if app_config.log_army_man_output:
-            _log_subprocess_details(
-                process_name="Army Man",
-                stdout_content=e.stdout,
-                stderr_content=e.stderr,
-                return_code=e.returncode
-            )
+    def _capture_cost(line: str) -> None:
+        match = ARMY_MAN_COST_PATTERN.search(line)
+        if match and on_cost:
+            on_cost(float(match.group(1)))
+
+    # Prefix streamed lines with the goal so concurrent Army Men can be told apart
+    logger.info(f"Running {process_name}...")
+    if not await _run_subprocess(process_name, command_to_run, army_man_directory, app_config.log_army_man_output, _capture_cost):
         return False
-    except FileNotFoundError:
-        logger.error(f"Run Army Man command not found: {command_to_run}")
+    logger.info(f"{process_name} completed successfully.")
+    return True
+
+async def _run_army_man_in_worktree(
+    folder: str,
+    worktree_manager: WorktreeManager,
+    on_cost: Callable[[float], None] | None = None,
+    worker_pool: ArmyManWorkerPool | None = None
+) -> bool:
+    """
+    Runs the Army Man inside an isolated worktree, then merges its branch back.
+    A failed goal's branch is not merged, so half-done commits stay off the main branch; it is kept for review.
+    """
+    try:
+        worktree = await asyncio.to_thread(worktree_manager.create_worktree, folder)
+    except (ValueError, subprocess.CalledProcessError) as e:
+        logger.error(f"Failed to create a worktree for goal {folder}: {e}")
         return False
 
+    merged = False
+    try:
+        if not await _run_army_man(worktree.goal_path, worktree.path, on_cost, worker_pool):
+            logger.warning(f"Not merging {worktree.branch_name} because its goal failed. Branch kept for manual review.")
+            return False
+        merged = await asyncio.to_thread(worktree_manager.merge_worktree, worktree)
+        return merged
+    finally:
+        await asyncio.to_thread(worktree_manager.remove_worktree, worktree, merged)
+
+async def _work_on_goal(
+    folder: str,
+    worktree_manager: WorktreeManager | None,
+    goal_ledger: GoalLedger,
+    worker_pool: ArmyManWorkerPool | None = None
+) -> bool:
+    """
+    Works on one goal and records its outcome in the goal ledger; awaited concurrently by the scheduler's workers.
+    """
+    reported_costs: list[float] = []
+
+    goal_ledger.mark_running(folder)
+    try:
+        if worktree_manager is None:
+            succeeded = await _run_army_man(folder, app_config.root_git_path, reported_costs.append, worker_pool)
+        else:
+            succeeded = await _run_army_man_in_worktree(folder, worktree_manager, reported_costs.append, worker_pool)
+    except Exception as e:
+        goal_ledger.mark_finished(folder, succeeded=False, error=str(e))
+        raise
+
+    cost = reported_costs[-1] if reported_costs else None
+    goal_ledger.mark_finished(folder, succeeded=succeeded, cost=cost, error=None if succeeded else "Army Man run failed")
+    return succeeded
+
+async def _run_goals_pipelined(
+    scheduler: GoalScheduler,
+    worktree_manager: WorktreeManager,
+    goal_ledger: GoalLedger,
+    resumable_goals: list[str]
+) -> dict[str, bool]:
+    """
+    Starts Army Men on goal folders while the Secretary is still creating the rest.
+    Goal branches are not merged until the Secretary exits, since it keeps committing to the main checkout.
+    """
+    def _queue_published_goal(folder: str) -> None:
+        if not goal_ledger.enqueue_goals([folder]):
+            logger.info(f"Goal {folder} is already in the goal ledger; not queueing it again.")
+            return
+        if scheduler.submit(folder):
+            logger.info(f"Queued goal published by the Secretary: {folder}")
+
+    scheduler.start()
+    worktree_manager.hold_merges()
+    try:
+        for folder in resumable_goals:
+            scheduler.submit(folder)
+
+        logger.info("Attempting to run Secretary in streaming mode...")
+        if await _run_secretary(on_goal_folder=_queue_published_goal):
+            # Catches folders the Secretary created but could not publish
+            for folder in _read_secretary_output_file(app_config.secretary_output_file_path):
+                _queue_published_goal(folder)
+        else:
+            logger.error("Secretary execution failed. Only goals it already published will be worked on.")
+    finally:
+        worktree_manager.release_merges()
+
+    return await scheduler.finish()
+
 async def run() -> None:
     logger.info("Army General orchestration started.")
 
     secretary_output_file = app_config.secretary_output_file_path
     secretary_executed_successfully = False 
 
+    goal_ledger = GoalLedger(app_config.goal_ledger_path)
+    worker_pool: ArmyManWorkerPool | None = None
     try:
-        logger.info("Attempting to run Secretary...")
-        if not _run_secretary():
-            logger.error("Secretary execution failed. Further processing of its output will be skipped.")
+        num_interrupted_goals = goal_ledger.requeue_interrupted_goals()
+        if num_interrupted_goals:
+            logger.warning(f"Goal ledger has {num_interrupted_goals} goal(s) left running by an interrupted run; they are pending again.")
+        previously_unfinished_goals = goal_ledger.get_resumable_goals(app_config.max_goal_attempts)
+        if previously_unfinished_goals:
+            logger.info(f"Goal ledger has {len(previously_unfinished_goals)} unfinished goal(s) from earlier runs; they will be resumed.")
+
+        worktree_manager: WorktreeManager | None = None
+        if app_config.use_git_worktrees:
+            try:
+                worktree_manager = WorktreeManager(app_config.root_git_path, app_config.worktree_directory_path)
+            except ValueError as e:
+                logger.error(f"Failed to set up goal worktrees: {e}")
+                return # Exits run(), 'finally' block will execute.
+        elif app_config.max_parallel_army_men > 1:
+            logger.warning("Running Army Men in parallel without use_git_worktrees. Goals share one checkout and may commit each other's files.")
+
+        if app_config.army_man_execution_mode == "worker":
+            worker_pool = ArmyManWorkerPool(
+                size=app_config.max_parallel_army_men,
+                command=app_config.army_man_serve_command_template,
+                cwd=_army_man_directory(),
+                log_output=app_config.log_army_man_output
+            )
+            logger.info(f"Running Army Men on up to {app_config.max_parallel_army_men} long-lived worker(s).")
+
+        scheduler = GoalScheduler(
+            max_parallel=app_config.max_parallel_army_men,
+            run_goal=functools.partial(_work_on_goal, worktree_manager=worktree_manager, goal_ledger=goal_ledger, worker_pool=worker_pool)
+        )
+
+        if app_config.pipeline_secretary_goals and worktree_manager is None:
+            logger.warning("pipeline_secretary_goals requires use_git_worktrees. Waiting for the Secretary to finish before starting Army Men.")
+
+        if app_config.pipeline_secretary_goals and worktree_manager is not None:
+            goal_results = await _run_goals_pipelined(scheduler, worktree_manager, goal_ledger, previously_unfinished_goals)
+            if not goal_results:
+                logger.warning("No unfinished goals in the goal ledger. No Army Man tasks to perform.")
+                return # Exits run(), 'finally' block will execute.
         else:
-            secretary_executed_successfully = True
-
-        # Proceed only if Secretary was successful
-        if not secretary_executed_successfully:
-            logger.warning("Skipping processing of Secretary's output file due to earlier errors.")
-            return # Exits run(), 'finally' block will execute.
-
-        logger.info(f"Expecting Secretary output file at: {secretary_output_file}")
-        if not os.path.exists(secretary_output_file):
-            logger.error(f"Secretary output file does not exist at the expected path: {secretary_output_file}.")
-            logger.error("\n\n\n ERROR: Are you sure BACKLOG.md was filled out with tasks?\n\n")
-            return # Exits run(), 'finally' block will execute.
-
-        # Parse the folders from the file
-        folders = []
-        try: # Nested try for file reading
-            with open(secretary_output_file) as file:
-                folders = [line.strip() for line in file if line.strip()]
-            logger.info(f"Successfully read and parsed Secretary output file. Found {len(folders)} folders.")
-        except Exception as e: # Catch any exception during file open/read
-            logger.error(f"Failed to read or parse secretary output file {secretary_output_file}: {e}")
-            return # Exits run(), 'finally' block will execute.
-
-        if not folders:
-            logger.warning("No folders found in Secretary output. No Army Man tasks to perform.")
-            return # Exits run(), 'finally' block will execute.
-
-        num_goals_worked_on = 0
-        for folder_index, folder in enumerate(folders):
-            logger.info(f"Processing folder {folder_index + 1}/{len(folders)}: {folder}")
-            if _run_army_man(folder): # Assumes _run_army_man() returns bool
-                num_goals_worked_on += 1
-                logger.info(f"Successfully completed Army Man task for folder: {folder}")
+            logger.info("Attempting to run Secretary...")
+            if not await _run_secretary():
+                logger.error("Secretary execution failed. Further processing of its output will be skipped.")
+            else:
+                secretary_executed_successfully = True
+
+            folders = []
+            if not secretary_executed_successfully:
+                logger.warning("Skipping processing of Secretary's output file due to earlier errors.")
             else:
-                logger.warning(f"Army Man task failed for folder: {folder}. Continuing with next folder if any.")
+                folders = _read_secretary_output_file(secretary_output_file)
 
-        logger.info(f"Completed processing all folders. Total goals worked on: {num_goals_worked_on}/{len(folders)}.")
+            num_new_goals = goal_ledger.enqueue_goals(folders)
+            if folders and num_new_goals < len(folders):
+                logger.info(f"{len(folders) - num_new_goals} folder(s) from the Secretary were already in the goal ledger.")
+
+            goals_to_run = goal_ledger.get_resumable_goals(app_config.max_goal_attempts)
+            if not goals_to_run:
+                logger.warning("No unfinished goals in the goal ledger. No Army Man tasks to perform.")
+                return # Exits run(), 'finally' block will execute.
+
+            goal_results = await scheduler.run(goals_to_run)
+
+        num_goals_worked_on = sum(1 for succeeded in goal_results.values() if succeeded)
+
+        logger.info(f"Completed processing all folders. Total goals worked on: {num_goals_worked_on}/{len(goal_results)}.")
+        logger.info(f"Goal ledger status counts: {goal_ledger.get_status_counts()}")
 
     finally:
         # Cleanup: Attempt to delete the secretary_output_file.
@@ -239,6 +445,10 @@ async def run() -> None:
             # It could mean Secretary failed before creating it, or it was (unexpectedly) already cleaned.
             logger.info(f"Secretary output file {secretary_output_file} was not found during cleanup. This may be normal if Secretary did not produce it or if it was already handled.")
 
+        if worker_pool is not None:
+            await worker_pool.close()
+        goal_ledger.close()
+
     logger.info("Army General finished all operations.") # This is after the try-finally structure.
 
 if __name__ == "__main__":
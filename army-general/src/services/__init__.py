@@ -1,3 +1,7 @@
+from .army_man_worker_pool import ArmyManWorker, ArmyManWorkerError, ArmyManWorkerPool
 from .git_service import GitService
+from .goal_ledger import GoalLedger, GoalStatus
+from .goal_scheduler import GoalScheduler
+from .worktree_manager import GoalWorktree, WorktreeManager
 
-__all__ = [ "GitService" ]
+__all__ = [ "ArmyManWorker", "ArmyManWorkerError", "ArmyManWorkerPool", "GitService", "GoalLedger", "GoalStatus", "GoalScheduler", "GoalWorktree", "WorktreeManager" ]
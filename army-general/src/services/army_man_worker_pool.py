@@ -0,0 +1,165 @@
+"""
+Keeps long-lived Army Man worker processes (`main.py --serve`) warm for the whole run.
+
+Each worker imports its dependencies, compiles the graph and opens model connections
+once, then works on goals sent to it as JSON lines on stdin. Responses come back as
+JSON lines on stdout; everything the worker logs arrives on stderr.
+"""
+import asyncio
+import json
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Worker stderr carries full aider output, so lines can be long
+STREAM_LIMIT_BYTES = 1024 * 1024
+
+
+class ArmyManWorkerError(Exception):
+    """Raised when a worker cannot run a goal, e.g. because its process died."""
+
+
+class ArmyManWorker:
+    """
+    One `--serve` process, started on first use and restarted if it dies.
+    """
+
+    def __init__(self, worker_name: str, command: str, cwd: str, log_output: bool) -> None:
+        """
+        Args:
+            worker_name: Name used to prefix the worker's logged output.
+            command: Full command line that starts the worker in serve mode.
+            cwd: Directory the command is run from.
+            log_output: Whether the worker's stderr is written to the General's log.
+        """
+        self.worker_name = worker_name
+        self.command = command
+        self.cwd = cwd
+        self.log_output = log_output
+        self._process: asyncio.subprocess.Process | None = None
+        self._stderr_task: asyncio.Task | None = None
+        self._next_request_id = 1
+
+    async def _ensure_started(self) -> asyncio.subprocess.Process:
+        if self._process is not None and self._process.returncode is None:
+            return self._process
+
+        logger.info(f"Starting {self.worker_name}: {self.command}")
+        # Command templates are full command lines (quoting included), so hand them to the shell as-is
+        self._process = await asyncio.create_subprocess_shell(
+            self.command,
+            cwd=self.cwd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=STREAM_LIMIT_BYTES
+        )
+        self._stderr_task = asyncio.create_task(self._drain_stderr(self._process))
+        return self._process
+
+    async def _drain_stderr(self, process: asyncio.subprocess.Process) -> None:
+        # Always drained, even when not logged, so the worker never blocks on a full pipe
+        prefix = f"[{self.worker_name.upper()}]"
+        while True:
+            try:
+                raw_line = await process.stderr.readline()
+            except ValueError:
+                logger.warning(f"{prefix}: (line longer than {STREAM_LIMIT_BYTES} bytes skipped)")
+                continue
+            if not raw_line:
+                return
+            if self.log_output:
+                logger.info(f"{prefix}: {raw_line.decode('utf-8', errors='replace').rstrip()}")
+
+    async def _send(self, method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        process = await self._ensure_started()
+        request_id = self._next_request_id
+        self._next_request_id += 1
+
+        request = {"id": request_id, "method": method}
+        if params is not None:
+            request["params"] = params
+        try:
+            process.stdin.write((json.dumps(request) + "\n").encode("utf-8"))
+            await process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            raise ArmyManWorkerError(f"{self.worker_name} is not accepting requests: {e}") from e
+
+        while True:
+            try:
+                raw_line = await process.stdout.readline()
+            except ValueError as e:
+                raise ArmyManWorkerError(f"{self.worker_name} sent an oversized response line.") from e
+            if not raw_line:
+                return_code = await process.wait()
+                raise ArmyManWorkerError(f"{self.worker_name} exited with code {return_code} before answering.")
+
+            line = raw_line.decode("utf-8", errors="replace").strip()
+            try:
+                response = json.loads(line)
+            except json.JSONDecodeError:
+                logger.debug(f"[{self.worker_name.upper()} STDOUT]: {line}")
+                continue
+            if isinstance(response, dict) and response.get("id") == request_id:
+                return response
+
+    async def run_goal(self, goal_path: str, root_git_path: str) -> dict[str, Any]:
+        """
+        Runs one goal on this worker.
+
+        Returns:
+            The worker's summary of the goal's final state.
+
+        Raises:
+            ArmyManWorkerError: If the worker died or reported an error for the goal.
+        """
+        response = await self._send("run_goal", {"goal_path": goal_path, "root_git_path": root_git_path})
+        if "error" in response:
+            raise ArmyManWorkerError(f"{self.worker_name} failed goal {goal_path}: {response['error']}")
+        return response.get("result") or {}
+
+    async def close(self) -> None:
+        """Asks the worker to shut down, killing it if it does not exit."""
+        if self._process is None:
+            return
+        if self._process.returncode is None:
+            try:
+                await asyncio.wait_for(self._send("shutdown"), timeout=10)
+                await asyncio.wait_for(self._process.wait(), timeout=10)
+            except (ArmyManWorkerError, asyncio.TimeoutError):
+                logger.warning(f"{self.worker_name} did not shut down cleanly; killing it.")
+                self._process.kill()
+                await self._process.wait()
+        if self._stderr_task:
+            await self._stderr_task
+        logger.info(f"{self.worker_name} stopped.")
+
+
+class ArmyManWorkerPool:
+    """
+    Hands each goal to an idle worker; at most `size` workers are ever started.
+    """
+
+    def __init__(self, size: int, command: str, cwd: str, log_output: bool) -> None:
+        self.workers = [
+            ArmyManWorker(f"Army Man Worker {worker_number}", command, cwd, log_output)
+            for worker_number in range(1, max(1, size) + 1)
+        ]
+        self._idle_workers: asyncio.Queue[ArmyManWorker] = asyncio.Queue()
+        for worker in self.workers:
+            self._idle_workers.put_nowait(worker)
+
+    async def run_goal(self, goal_path: str, root_git_path: str) -> dict[str, Any]:
+        """
+        Runs one goal on the next idle worker. See `ArmyManWorker.run_goal`.
+        """
+        worker = await self._idle_workers.get()
+        try:
+            logger.info(f"{worker.worker_name} picked up goal: {goal_path}")
+            return await worker.run_goal(goal_path, root_git_path)
+        finally:
+            self._idle_workers.put_nowait(worker)
+
+    async def close(self) -> None:
+        await asyncio.gather(*(worker.close() for worker in self.workers))
@@ -5,7 +5,8 @@ import subprocess
 class GitService:
     def __init__(self, repo_path: str):
         self.repo_path = repo_path
-        if not os.path.isdir(os.path.join(repo_path, '.git')):
+        # Linked worktrees have a '.git' file instead of a directory
+        if not os.path.exists(os.path.join(repo_path, '.git')):
             raise ValueError(f"'{repo_path}' is not a valid Git repository.")
 
     def _run_git_command(self, command: list[str]) -> str:
@@ -50,6 +51,59 @@ class GitService:
         except (subprocess.CalledProcessError, ValueError):
             return None
 
+    def get_current_branch(self) -> str | None:
+        try:
+            return self._run_git_command(["rev-parse", "--abbrev-ref", "HEAD"])
+        except subprocess.CalledProcessError:
+            return None
+
+    def add_worktree(self, worktree_path: str, branch_name: str, start_point: str = "HEAD") -> None:
+        self._run_git_command(["worktree", "add", "-b", branch_name, worktree_path, start_point])
+
+    def remove_worktree(self, worktree_path: str) -> bool:
+        try:
+            self._run_git_command(["worktree", "remove", "--force", worktree_path])
+            return True
+        except subprocess.CalledProcessError:
+            # Fall back to pruning in case the directory was already deleted by hand
+            try:
+                self._run_git_command(["worktree", "prune"])
+            except subprocess.CalledProcessError:
+                pass
+            return False
+
+    def branch_exists(self, branch_name: str) -> bool:
+        try:
+            self._run_git_command(["rev-parse", "--verify", "--quiet", f"refs/heads/{branch_name}"])
+            return True
+        except subprocess.CalledProcessError:
+            return False
+
+    def delete_branch(self, branch_name: str) -> bool:
+        try:
+            self._run_git_command(["branch", "-D", branch_name])
+            return True
+        except subprocess.CalledProcessError:
+            return False
+
+    def fast_forward_merge(self, branch_name: str) -> bool:
+        try:
+            self._run_git_command(["merge", "--ff-only", branch_name])
+            return True
+        except subprocess.CalledProcessError:
+            return False
+
+    def rebase_onto(self, upstream: str) -> bool:
+        try:
+            self._run_git_command(["rebase", upstream])
+            return True
+        except subprocess.CalledProcessError:
+            try:
+                self._run_git_command(["rebase", "--abort"])
+            except subprocess.CalledProcessError:
+                pass
+            return False
+
     def commit_changes(self, commit_message: str) -> bool:
         try:
             # TODO: Add a check to see if there's any files to commit. If there's not, then return gracefully while returning True but log a warning
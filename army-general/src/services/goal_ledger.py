@@ -0,0 +1,135 @@
+"""
+SQLite-backed run ledger that records the state of every goal the General works on.
+
+The Secretary's output file only lives for one General run, so the ledger is
+what lets a crashed or interrupted run resume where it stopped and skip goals
+that already finished instead of paying for them twice.
+"""
+import logging
+import os
+import sqlite3
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+class GoalStatus:
+    """Allowed values of the ledger's status column."""
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class GoalLedger:
+    """
+    Stores per-goal status, attempt count, start/end times and cost in a local SQLite file.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        """
+        Args:
+            db_path: Path to the SQLite file; created if it does not exist.
+        """
+        self.db_path = db_path
+        db_directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(db_directory, exist_ok=True)
+
+        self._connection = sqlite3.connect(db_path)
+        self._connection.row_factory = sqlite3.Row
+        with self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS goals (
+                    goal_path TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    enqueued_at TEXT NOT NULL,
+                    started_at TEXT,
+                    finished_at TEXT,
+                    cost REAL,
+                    last_error TEXT
+                )
+                """
+            )
+
+    def _now(self) -> str:
+        return datetime.now().isoformat(timespec="seconds")
+
+    def enqueue_goals(self, goal_paths: list[str]) -> int:
+        """
+        Records new goals as pending. Goals already in the ledger keep their current state.
+
+        Returns:
+            The number of goals that were newly added.
+        """
+        enqueued_at = self._now()
+        with self._connection:
+            cursor = self._connection.executemany(
+                "INSERT OR IGNORE INTO goals (goal_path, status, enqueued_at) VALUES (?, ?, ?)",
+                [(goal_path, GoalStatus.PENDING, enqueued_at) for goal_path in goal_paths],
+            )
+        return cursor.rowcount
+
+    def requeue_interrupted_goals(self) -> int:
+        """
+        Puts goals left running by a crashed or interrupted run back to pending and takes back the
+        attempt `mark_running` counted, so they resume without using up `max_attempts`.
+        Call before this run starts any goal.
+
+        Returns:
+            The number of goals that were re-queued.
+        """
+        with self._connection:
+            cursor = self._connection.execute(
+                "UPDATE goals SET status = ?, attempts = MAX(attempts - 1, 0), started_at = NULL WHERE status = ?",
+                (GoalStatus.PENDING, GoalStatus.RUNNING),
+            )
+        return cursor.rowcount
+
+    def get_resumable_goals(self, max_attempts: int) -> list[str]:
+        """
+        Returns goals that still need work, oldest first: pending goals and failed goals
+        with attempts remaining.
+        """
+        rows = self._connection.execute(
+            """
+            SELECT goal_path FROM goals
+            WHERE status = ? OR (status = ? AND attempts < ?)
+            ORDER BY enqueued_at, rowid
+            """,
+            (GoalStatus.PENDING, GoalStatus.FAILED, max_attempts),
+        ).fetchall()
+        return [row["goal_path"] for row in rows]
+
+    def mark_running(self, goal_path: str) -> None:
+        with self._connection:
+            self._connection.execute(
+                """
+                UPDATE goals
+                SET status = ?, attempts = attempts + 1, started_at = ?, finished_at = NULL, last_error = NULL
+                WHERE goal_path = ?
+                """,
+                (GoalStatus.RUNNING, self._now(), goal_path),
+            )
+
+    def mark_finished(self, goal_path: str, succeeded: bool, cost: float | None = None, error: str | None = None) -> None:
+        """
+        Records the outcome of a goal's latest attempt. Costs add up across attempts.
+        """
+        with self._connection:
+            self._connection.execute(
+                """
+                UPDATE goals
+                SET status = ?, finished_at = ?, cost = COALESCE(cost, 0) + COALESCE(?, 0), last_error = ?
+                WHERE goal_path = ?
+                """,
+                (GoalStatus.DONE if succeeded else GoalStatus.FAILED, self._now(), cost, error, goal_path),
+            )
+
+    def get_status_counts(self) -> dict[str, int]:
+        rows = self._connection.execute("SELECT status, COUNT(*) AS num_goals FROM goals GROUP BY status").fetchall()
+        return {row["status"]: row["num_goals"] for row in rows}
+
+    def close(self) -> None:
+        self._connection.close()
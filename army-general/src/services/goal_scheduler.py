@@ -0,0 +1,106 @@
+"""
+Runs Army Man goals concurrently with a bounded pool of asyncio workers.
+
+The scheduler only decides *when* a goal runs; how a goal is worked on is
+delegated to the `run_goal` coroutine supplied by the caller.
+"""
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+
+class GoalScheduler:
+    """
+    Feeds goal folders to a fixed number of workers and records per-goal success.
+    """
+
+    def __init__(self, max_parallel: int, run_goal: Callable[[str], Awaitable[bool]]) -> None:
+        """
+        Args:
+            max_parallel: Maximum number of goals worked on at the same time.
+            run_goal: Coroutine function that works on one goal folder and returns True on success.
+        """
+        self.max_parallel = max(1, max_parallel)
+        self.run_goal = run_goal
+        self.results: dict[str, bool] = {}
+
+    async def _worker(self, worker_id: int) -> None:
+        while True:
+            item = await self._queue.get()
+            try:
+                if item is None:
+                    return
+                folder_index, folder = item
+                logger.info(f"[Worker {worker_id}] Processing folder {folder_index + 1}/{self._num_submitted}: {folder}")
+                try:
+                    succeeded = await self.run_goal(folder)
+                except Exception as e:
+                    # One goal blowing up must not take the rest of the night down with it
+                    logger.error(f"[Worker {worker_id}] Unexpected error while working on {folder}: {e}", exc_info=True)
+                    succeeded = False
+                self.results[folder] = succeeded
+                if succeeded:
+                    logger.info(f"[Worker {worker_id}] Successfully completed Army Man task for folder: {folder}")
+                else:
+                    logger.warning(f"[Worker {worker_id}] Army Man task failed for folder: {folder}. Continuing with next folder if any.")
+            finally:
+                self._queue.task_done()
+
+    def start(self, num_workers: int | None = None) -> None:
+        """
+        Starts the workers so goals can be submitted while they are still being produced.
+
+        Args:
+            num_workers: Number of workers to start; defaults to `max_parallel`.
+        """
+        num_workers = min(num_workers or self.max_parallel, self.max_parallel)
+        self._queue = asyncio.Queue()
+        self._num_submitted = 0
+        self._submitted_folders: set[str] = set()
+        self._workers = [asyncio.create_task(self._worker(worker_id + 1)) for worker_id in range(num_workers)]
+        logger.info(f"Started {num_workers} goal worker(s).")
+
+    def submit(self, folder: str) -> bool:
+        """
+        Queues a goal folder for the next free worker. Folders already submitted are ignored.
+
+        Returns:
+            True if the folder was queued, False if it had already been submitted.
+        """
+        if folder in self._submitted_folders:
+            return False
+        self._submitted_folders.add(folder)
+        self._queue.put_nowait((self._num_submitted, folder))
+        self._num_submitted += 1
+        return True
+
+    async def finish(self) -> dict[str, bool]:
+        """
+        Signals that no more goals will be submitted and waits for the queued ones to finish.
+
+        Returns:
+            A mapping of goal folder to whether its Army Man run succeeded.
+        """
+        for _ in self._workers:
+            self._queue.put_nowait(None)
+        await asyncio.gather(*self._workers)
+        return self.results
+
+    async def run(self, folders: Iterable[str]) -> dict[str, bool]:
+        """
+        Works on every folder with at most `max_parallel` goals in flight.
+
+        Args:
+            folders: Goal folders in the order they should be started.
+
+        Returns:
+            A mapping of goal folder to whether its Army Man run succeeded.
+        """
+        folders = list(folders)
+        logger.info(f"Scheduling {len(folders)} goal(s).")
+        self.start(num_workers=len(folders) or 1)
+        for folder in folders:
+            self.submit(folder)
+        return await self.finish()
@@ -0,0 +1,154 @@
+"""
+Gives every Army Man goal its own `git worktree` on a throwaway branch.
+
+Army Men run aider with `--auto-commits` and commit with `git add .`, so two
+goals sharing one checkout would commit each other's files and race on the
+index lock. Each goal instead works in an isolated worktree, and finished
+branches are merged back into the main checkout one at a time.
+"""
+import logging
+import os
+import re
+import subprocess
+import threading
+from typing import NamedTuple
+
+from .git_service import GitService
+
+logger = logging.getLogger(__name__)
+
+BRANCH_PREFIX = "sleepy-army"
+
+
+class GoalWorktree(NamedTuple):
+    """Location of one goal's isolated checkout."""
+    path: str
+    branch_name: str
+    goal_path: str
+
+
+class WorktreeManager:
+    """
+    Creates, merges back and removes per-goal worktrees of the main repository.
+    """
+
+    def __init__(self, repo_path: str, worktrees_directory: str) -> None:
+        """
+        Args:
+            repo_path: Path to the main checkout the General operates on.
+            worktrees_directory: Directory that will hold one sub-directory per goal worktree.
+        """
+        self.repo_path = os.path.abspath(repo_path)
+        self.worktrees_directory = os.path.abspath(worktrees_directory)
+        self.git_service = GitService(self.repo_path)
+
+        self.base_branch = self.git_service.get_current_branch()
+        if not self.base_branch or self.base_branch == "HEAD":
+            raise ValueError(f"'{self.repo_path}' must have a branch checked out to merge goal worktrees back into.")
+
+        # Worktree creation and merges both touch the main repository's refs and index
+        self._git_lock = threading.Lock()
+        # Cleared while another process (the streaming Secretary) still commits to the main checkout
+        self._merges_allowed = threading.Event()
+        self._merges_allowed.set()
+
+        os.makedirs(self.worktrees_directory, exist_ok=True)
+
+    def _worktree_name(self, goal_folder: str) -> str:
+        folder_name = os.path.basename(os.path.normpath(goal_folder))
+        return re.sub(r"[^A-Za-z0-9._-]+", "-", folder_name).strip("-.") or "goal"
+
+    def create_worktree(self, goal_folder: str) -> GoalWorktree:
+        """
+        Creates a worktree on a fresh branch starting at the main checkout's HEAD.
+
+        Args:
+            goal_folder: Absolute goal folder path inside the main checkout.
+
+        Returns:
+            The worktree, including the goal folder path translated into it.
+
+        Raises:
+            ValueError: If the goal folder is not inside the main checkout.
+            subprocess.CalledProcessError: If git fails to create the worktree.
+        """
+        relative_goal_path = os.path.relpath(os.path.abspath(goal_folder), self.repo_path)
+        if relative_goal_path.startswith(os.pardir):
+            raise ValueError(f"Goal folder '{goal_folder}' is not inside the repository '{self.repo_path}'.")
+
+        worktree_name = self._worktree_name(goal_folder)
+        worktree_path = os.path.join(self.worktrees_directory, worktree_name)
+        branch_name = f"{BRANCH_PREFIX}/{worktree_name}"
+
+        with self._git_lock:
+            # Leftovers from an interrupted run would make `git worktree add` fail
+            if os.path.exists(worktree_path):
+                logger.warning(f"Removing stale worktree at {worktree_path}")
+                self.git_service.remove_worktree(worktree_path)
+            if self.git_service.branch_exists(branch_name):
+                logger.warning(f"Deleting stale goal branch {branch_name}")
+                self.git_service.delete_branch(branch_name)
+
+            self.git_service.add_worktree(worktree_path, branch_name)
+
+        logger.info(f"Created worktree {worktree_path} on branch {branch_name}")
+        return GoalWorktree(
+            path=worktree_path,
+            branch_name=branch_name,
+            goal_path=os.path.join(worktree_path, relative_goal_path),
+        )
+
+    def hold_merges(self) -> None:
+        """Makes `merge_worktree` wait until `release_merges` is called."""
+        self._merges_allowed.clear()
+
+    def release_merges(self) -> None:
+        """Lets held and future merges proceed."""
+        self._merges_allowed.set()
+
+    def merge_worktree(self, worktree: GoalWorktree) -> bool:
+        """
+        Brings a finished goal branch into the main checkout.
+
+        Tries a fast-forward first; if other goals were merged in the meantime the
+        branch is rebased onto the main branch and fast-forwarded again.
+
+        Returns:
+            True if the goal's commits are now on the main branch, False otherwise.
+        """
+        if not self._merges_allowed.is_set():
+            logger.info(f"Waiting for merges to be released before merging {worktree.branch_name}")
+            self._merges_allowed.wait()
+
+        with self._git_lock:
+            if self.git_service.fast_forward_merge(worktree.branch_name):
+                logger.info(f"Fast-forwarded {self.base_branch} to {worktree.branch_name}")
+                return True
+
+            logger.info(f"{worktree.branch_name} cannot be fast-forwarded; rebasing onto {self.base_branch}")
+            try:
+                worktree_git_service = GitService(worktree.path)
+            except ValueError as e:
+                logger.error(f"Cannot open worktree for rebase: {e}")
+                return False
+
+            if not worktree_git_service.rebase_onto(self.base_branch):
+                logger.error(f"Rebase of {worktree.branch_name} onto {self.base_branch} failed. Branch kept for manual review.")
+                return False
+
+            if self.git_service.fast_forward_merge(worktree.branch_name):
+                logger.info(f"Rebased and fast-forwarded {self.base_branch} to {worktree.branch_name}")
+                return True
+
+        logger.error(f"Could not fast-forward {self.base_branch} to {worktree.branch_name} after rebase. Branch kept for manual review.")
+        return False
+
+    def remove_worktree(self, worktree: GoalWorktree, delete_branch: bool = True) -> None:
+        """
+        Removes a goal's worktree and, optionally, its branch.
+        """
+        with self._git_lock:
+            if not self.git_service.remove_worktree(worktree.path):
+                logger.warning(f"Failed to remove worktree {worktree.path}. Manual cleanup might be required.")
+            if delete_branch and not self.git_service.delete_branch(worktree.branch_name):
+                logger.warning(f"Failed to delete goal branch {worktree.branch_name}.")
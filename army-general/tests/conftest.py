@@ -0,0 +1,22 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+# The General runs from src/ and imports its packages top-level (`from config import ...`)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+
+@pytest.fixture
+def general_main(tmp_path, monkeypatch):
+    """
+    The General's main module, imported without validating config.yml's machine-specific paths
+    or writing log files, with root_git_path pointed at an empty directory.
+    """
+    with pytest.MonkeyPatch.context() as import_patch:
+        import_patch.setattr("config.AppConfig.validate", lambda self: None)
+        import_patch.setattr("utils.logging_setup.LoggingSetup.setup_logging", lambda self: None)
+        main = sys.modules.get("main") or importlib.import_module("main")
+    monkeypatch.setattr(main.app_config, "root_git_path", str(tmp_path))
+    return main
@@ -0,0 +1,35 @@
+from services.goal_ledger import GoalLedger, GoalStatus
+
+
+def test_goal_interrupted_by_a_crash_resumes_without_using_an_attempt(tmp_path):
+    ledger_path = str(tmp_path / "goal-ledger.sqlite")
+    ledger = GoalLedger(ledger_path)
+    ledger.enqueue_goals(["ai-goals/a", "ai-goals/b"])
+    ledger.mark_running("ai-goals/a")
+    ledger.mark_finished("ai-goals/a", succeeded=True)
+    ledger.mark_running("ai-goals/b")
+    ledger.close()  # The General crashes while goal b is running
+
+    restarted_ledger = GoalLedger(ledger_path)
+    assert restarted_ledger.requeue_interrupted_goals() == 1
+    assert restarted_ledger.get_resumable_goals(max_attempts=1) == ["ai-goals/b"]
+
+    restarted_ledger.mark_running("ai-goals/b")
+    restarted_ledger.mark_finished("ai-goals/b", succeeded=False, error="Army Man run failed")
+    assert restarted_ledger.get_resumable_goals(max_attempts=1) == []
+    assert restarted_ledger.get_status_counts() == {GoalStatus.DONE: 1, GoalStatus.FAILED: 1}
+    restarted_ledger.close()
+
+
+def test_failed_goals_are_retried_until_max_attempts(tmp_path):
+    ledger = GoalLedger(str(tmp_path / "goal-ledger.sqlite"))
+    ledger.enqueue_goals(["ai-goals/a"])
+    assert ledger.enqueue_goals(["ai-goals/a"]) == 0
+
+    for _ in range(2):
+        assert ledger.get_resumable_goals(max_attempts=2) == ["ai-goals/a"]
+        ledger.mark_running("ai-goals/a")
+        ledger.mark_finished("ai-goals/a", succeeded=False, cost=0.5)
+
+    assert ledger.get_resumable_goals(max_attempts=2) == []
+    ledger.close()
@@ -0,0 +1,104 @@
+import asyncio
+import functools
+
+from services.goal_ledger import GoalLedger, GoalStatus
+from services.goal_scheduler import GoalScheduler
+
+
+class FakeArmyMan:
+    """Stands in for `_run_army_man`, recording start order and how many goals run at once."""
+
+    def __init__(self, failing_goals=(), crashing_goals=()):
+        self.failing_goals = set(failing_goals)
+        self.crashing_goals = set(crashing_goals)
+        self.started_goals: list[str] = []
+        self.num_running = 0
+        self.max_num_running = 0
+
+    async def __call__(self, folder, root_git_path, on_cost=None, worker_pool=None):
+        self.started_goals.append(folder)
+        self.num_running += 1
+        self.max_num_running = max(self.max_num_running, self.num_running)
+        try:
+            await asyncio.sleep(0.01)
+            if folder in self.crashing_goals:
+                raise RuntimeError(f"{folder} crashed")
+            if on_cost:
+                on_cost(0.25)
+            return folder not in self.failing_goals
+        finally:
+            self.num_running -= 1
+
+
+class FakeWorktreeManager:
+    def __init__(self):
+        self.events: list[str] = []
+
+    def hold_merges(self):
+        self.events.append("hold")
+
+    def release_merges(self):
+        self.events.append("release")
+
+
+def _make_scheduler(general_main, goal_ledger, max_parallel):
+    return GoalScheduler(
+        max_parallel=max_parallel,
+        run_goal=functools.partial(general_main._work_on_goal, worktree_manager=None, goal_ledger=goal_ledger),
+    )
+
+
+def test_runs_goals_in_order_with_at_most_max_parallel_at_once(general_main, tmp_path, monkeypatch):
+    fake_army_man = FakeArmyMan()
+    monkeypatch.setattr(general_main, "_run_army_man", fake_army_man)
+    goal_ledger = GoalLedger(str(tmp_path / "goal-ledger.sqlite"))
+    folders = [f"ai-goals/goal-{index}" for index in range(6)]
+    goal_ledger.enqueue_goals(folders)
+
+    results = asyncio.run(_make_scheduler(general_main, goal_ledger, max_parallel=2).run(folders))
+
+    assert results == {folder: True for folder in folders}
+    assert fake_army_man.started_goals == folders
+    assert fake_army_man.max_num_running == 2
+    assert goal_ledger.get_status_counts() == {GoalStatus.DONE: 6}
+    goal_ledger.close()
+
+
+def test_a_failing_or_crashing_goal_does_not_stop_the_others(general_main, tmp_path, monkeypatch):
+    fake_army_man = FakeArmyMan(failing_goals={"ai-goals/b"}, crashing_goals={"ai-goals/c"})
+    monkeypatch.setattr(general_main, "_run_army_man", fake_army_man)
+    goal_ledger = GoalLedger(str(tmp_path / "goal-ledger.sqlite"))
+    folders = ["ai-goals/a", "ai-goals/b", "ai-goals/c", "ai-goals/d"]
+    goal_ledger.enqueue_goals(folders)
+
+    results = asyncio.run(_make_scheduler(general_main, goal_ledger, max_parallel=3).run(folders))
+
+    assert results == {"ai-goals/a": True, "ai-goals/b": False, "ai-goals/c": False, "ai-goals/d": True}
+    assert goal_ledger.get_status_counts() == {GoalStatus.DONE: 2, GoalStatus.FAILED: 2}
+    assert goal_ledger.get_resumable_goals(max_attempts=2) == ["ai-goals/b", "ai-goals/c"]
+    goal_ledger.close()
+
+
+def test_pipelined_run_starts_resumed_goals_first_and_skips_republished_ones(general_main, tmp_path, monkeypatch):
+    fake_army_man = FakeArmyMan()
+    monkeypatch.setattr(general_main, "_run_army_man", fake_army_man)
+    worktree_manager = FakeWorktreeManager()
+
+    async def fake_secretary(on_goal_folder=None):
+        worktree_manager.events.append("secretary")
+        for folder in ("ai-goals/new-1", "ai-goals/resumed", "ai-goals/new-2"):
+            on_goal_folder(folder)
+        return True
+
+    monkeypatch.setattr(general_main, "_run_secretary", fake_secretary)
+    goal_ledger = GoalLedger(str(tmp_path / "goal-ledger.sqlite"))
+    goal_ledger.enqueue_goals(["ai-goals/resumed"])
+
+    results = asyncio.run(general_main._run_goals_pipelined(
+        _make_scheduler(general_main, goal_ledger, max_parallel=1), worktree_manager, goal_ledger, ["ai-goals/resumed"]
+    ))
+
+    assert fake_army_man.started_goals == ["ai-goals/resumed", "ai-goals/new-1", "ai-goals/new-2"]
+    assert all(results.values()) and len(results) == 3
+    assert worktree_manager.events == ["hold", "secretary", "release"]
+    goal_ledger.close()
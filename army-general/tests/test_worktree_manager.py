@@ -0,0 +1,79 @@
+import asyncio
+import subprocess
+
+import pytest
+
+from services.worktree_manager import WorktreeManager
+
+
+def _git(repo_path, *args) -> str:
+    return subprocess.run(["git"] + list(args), cwd=repo_path, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def _commit_file(repo_path, filename, content):
+    (repo_path / filename).write_text(content, encoding="utf-8")
+    _git(repo_path, "add", filename)
+    _git(repo_path, "commit", "-q", "-m", f"Write {filename}")
+
+
+@pytest.fixture
+def repo_path(tmp_path, monkeypatch):
+    # The rebase in merge_worktree commits, so git needs an identity
+    for variable, value in (("NAME", "test"), ("EMAIL", "test@example.com")):
+        monkeypatch.setenv(f"GIT_AUTHOR_{variable}", value)
+        monkeypatch.setenv(f"GIT_COMMITTER_{variable}", value)
+    repo_path = tmp_path / "repo"
+    (repo_path / "ai-goals" / "goal-a").mkdir(parents=True)
+    (repo_path / "ai-goals" / "goal-b").mkdir(parents=True)
+    _git(repo_path, "init", "-q", "-b", "main")
+    _commit_file(repo_path, "README.md", "shared\n")
+    return repo_path
+
+
+def test_goal_branches_are_fast_forwarded_or_rebased_onto_main(repo_path, tmp_path):
+    worktree_manager = WorktreeManager(str(repo_path), str(tmp_path / "worktrees"))
+    first = worktree_manager.create_worktree(str(repo_path / "ai-goals" / "goal-a"))
+    second = worktree_manager.create_worktree(str(repo_path / "ai-goals" / "goal-b"))
+    assert first.goal_path == str(tmp_path / "worktrees" / "goal-a" / "ai-goals" / "goal-a")
+
+    _commit_file(tmp_path / "worktrees" / "goal-a", "a.txt", "a\n")
+    _commit_file(tmp_path / "worktrees" / "goal-b", "b.txt", "b\n")
+
+    assert worktree_manager.merge_worktree(first)
+    assert worktree_manager.merge_worktree(second)
+    worktree_manager.remove_worktree(first)
+    worktree_manager.remove_worktree(second)
+
+    assert _git(repo_path, "log", "--format=%s", "main").splitlines() == ["Write b.txt", "Write a.txt", "Write README.md"]
+    assert not (tmp_path / "worktrees" / "goal-a").exists()
+    assert _git(repo_path, "branch", "--list", "sleepy-army/*") == ""
+
+
+def test_conflicting_branch_is_kept_for_review(repo_path, tmp_path):
+    worktree_manager = WorktreeManager(str(repo_path), str(tmp_path / "worktrees"))
+    first = worktree_manager.create_worktree(str(repo_path / "ai-goals" / "goal-a"))
+    second = worktree_manager.create_worktree(str(repo_path / "ai-goals" / "goal-b"))
+    _commit_file(tmp_path / "worktrees" / "goal-a", "README.md", "from goal a\n")
+    _commit_file(tmp_path / "worktrees" / "goal-b", "README.md", "from goal b\n")
+
+    assert worktree_manager.merge_worktree(first)
+    assert not worktree_manager.merge_worktree(second)
+    worktree_manager.remove_worktree(second, delete_branch=False)
+
+    assert (repo_path / "README.md").read_text(encoding="utf-8") == "from goal a\n"
+    assert _git(repo_path, "branch", "--list", "sleepy-army/goal-b") != ""
+
+
+def test_failed_goal_is_not_merged(general_main, repo_path, tmp_path, monkeypatch):
+    async def failing_army_man(folder, root_git_path, on_cost=None, worker_pool=None):
+        _commit_file(tmp_path / "worktrees" / "goal-a", "half-done.txt", "partial\n")
+        return False
+
+    monkeypatch.setattr(general_main, "_run_army_man", failing_army_man)
+    worktree_manager = WorktreeManager(str(repo_path), str(tmp_path / "worktrees"))
+
+    assert not asyncio.run(general_main._run_army_man_in_worktree(str(repo_path / "ai-goals" / "goal-a"), worktree_manager))
+
+    assert not (repo_path / "half-done.txt").exists()
+    assert not (tmp_path / "worktrees" / "goal-a").exists()
+    assert _git(repo_path, "log", "--format=%s", "sleepy-army/goal-a").splitlines()[0] == "Write half-done.txt"
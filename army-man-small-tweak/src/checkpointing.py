@@ -0,0 +1,150 @@
+"""
+SQLite checkpoints kept in the repository's shared git directory, so rerunning a goal resumes
+after its last successful node, also when every run happens in a new, later removed, worktree.
+"""
+import logging
+import os
+import re
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import aiosqlite
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from langgraph.graph.state import CompiledStateGraph
+from langgraph.types import StateSnapshot
+
+from src.config import AppConfig
+from src.nodes import initialize_workflow_node
+from src.services.git_service import GitService
+from src.state import WorkflowState
+
+logger = logging.getLogger(__name__)
+
+# Resuming before these nodes is the same as starting over, so the goal starts fresh instead
+RESTART_NODES = {"__start__", "initialize_workflow"}
+
+# Absolute paths initialize_workflow_node stores; they point into the checkout of the run that wrote them
+GOAL_PATH_STATE_KEYS = (
+    "goal_folder_path",
+    "workspace_folder_path",
+    "manifest_template_path",
+    "task_description_path",
+    "manifest_output_path",
+    "changelog_output_path",
+)
+
+# Types stored in WorkflowState, beyond builtins, that checkpoints may rebuild
+CHECKPOINT_STATE_TYPES = [
+    ("src.pydantic_models.core_schemas", "ManifestData"),
+    ("src.pydantic_models.core_schemas", "Artifact"),
+]
+
+
+def get_checkpoint_thread_id(app_config: AppConfig) -> str:
+    """
+    The goal folder relative to its checkout, e.g. 'ai-goals/fix-footer', which is the same in
+    the main checkout and in every worktree the goal is run in.
+    """
+    goal_path = os.path.realpath(app_config.goal_root_path)
+    try:
+        relative_goal_path = os.path.relpath(goal_path, os.path.realpath(app_config.goal_git_path))
+    except ValueError:
+        # On another drive than the checkout (Windows)
+        relative_goal_path = ".."
+    if relative_goal_path.startswith(".."):
+        return goal_path.replace(os.sep, "/")
+    return relative_goal_path.replace(os.sep, "/")
+
+
+def get_checkpoint_database_path(app_config: AppConfig) -> str:
+    """One database per goal inside the main checkout's .git directory, untouched by worktree removal and git itself."""
+    checkpoint_directory = os.path.join(
+        GitService(app_config.goal_git_path).get_common_git_directory(), app_config.checkpoint_directory_name
+    )
+    database_name = re.sub(r"[^A-Za-z0-9._-]+", "__", get_checkpoint_thread_id(app_config)).strip("_")
+    return os.path.join(checkpoint_directory, f"{database_name}.sqlite")
+
+
+@asynccontextmanager
+async def open_goal_checkpointer(app_config: AppConfig) -> AsyncIterator[AsyncSqliteSaver]:
+    """Opens the goal's checkpoint database, see `get_checkpoint_database_path`."""
+    database_path = get_checkpoint_database_path(app_config)
+    os.makedirs(os.path.dirname(database_path), exist_ok=True)
+    logger.debug(f"Using checkpoint database {database_path}")
+
+    async with aiosqlite.connect(database_path) as connection:
+        checkpointer = AsyncSqliteSaver(connection, serde=JsonPlusSerializer(allowed_msgpack_modules=CHECKPOINT_STATE_TYPES))
+        await checkpointer.setup()
+        yield checkpointer
+
+
+async def find_resume_snapshot(app_graph: CompiledStateGraph, thread_config: dict) -> Optional[StateSnapshot]:
+    """
+    Finds the checkpoint the goal's previous run should continue from: the newest one without
+    an error that still has nodes to run. An interrupted run continues at its pending node, and
+    a run that ended on the error path reruns the node that failed.
+
+    Returns:
+        The snapshot to resume from, or None if the previous run succeeded, failed before any
+        real work, or there is no previous run.
+    """
+    async for snapshot in app_graph.aget_state_history(thread_config):
+        if snapshot.values.get("error_message"):
+            continue
+        if not snapshot.next or snapshot.next[0] in RESTART_NODES:
+            return None
+        return snapshot
+    return None
+
+
+async def ainvoke_with_checkpoints(
+    app_graph: CompiledStateGraph,
+    initial_state: WorkflowState,
+    runnable_config: dict,
+    thread_id: str
+) -> WorkflowState:
+    """
+    Runs the graph on the goal's checkpoint thread, resuming the previous run when possible.
+    Otherwise the thread's old checkpoints are deleted and the goal starts from `initial_state`.
+    A resumed run gets its paths re-resolved, since the previous run may have used another worktree.
+
+    Args:
+        app_graph: The graph, compiled with a checkpointer.
+        initial_state: State a fresh run starts from.
+        runnable_config: Config with the services in "configurable".
+        thread_id: The goal's checkpoint thread, see `get_checkpoint_thread_id`.
+
+    Returns:
+        The final workflow state.
+    """
+    thread_config = {**runnable_config, "configurable": {**runnable_config["configurable"], "thread_id": thread_id}}
+
+    resume_snapshot = await find_resume_snapshot(app_graph, thread_config)
+    current_paths_state = initialize_workflow_node(dict(initial_state), runnable_config)
+    if resume_snapshot is not None and current_paths_state.get("error_message"):
+        # Let a fresh run report why the goal's paths are no longer valid
+        resume_snapshot = None
+    if resume_snapshot is None:
+        await app_graph.checkpointer.adelete_thread(thread_id)
+        return await app_graph.ainvoke(initial_state, config=thread_config)
+
+    logger.overview(
+        f"Resuming goal from its checkpoint before '{', '.join(resume_snapshot.next)}' "
+        f"(last completed step: {resume_snapshot.values.get('current_step_name')})."
+    )
+    resume_checkpoint_config = resume_snapshot.config
+    changed_paths = {
+        key: current_paths_state[key]
+        for key in GOAL_PATH_STATE_KEYS
+        if key in resume_snapshot.values and resume_snapshot.values[key] != current_paths_state[key]
+    }
+    if changed_paths:
+        logger.info(f"Updating checkpointed paths for this checkout: {changed_paths}")
+        resume_checkpoint_config = await app_graph.aupdate_state(resume_snapshot.config, changed_paths)
+
+    resume_config = {
+        **thread_config,
+        "configurable": {**thread_config["configurable"], **resume_checkpoint_config["configurable"]},
+    }
+    return await app_graph.ainvoke(None, config=resume_config)
@@ -1,10 +1,10 @@
 """Pydantic model for application configuration."""
 import logging
 import os
-from typing import Optional
+from typing import Literal, Optional
 
 from omegaconf import MissingMandatoryValue, OmegaConf
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, Field, ValidationError
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +12,7 @@ class AppConfig(BaseModel):
     goal_root_path: str
     goal_git_path: str # Path to the root of the Git repo that contains the goal_root_path
     task_description_filename: str
+    task_sidecar_filename: Optional[str] = "task.json" # Structured task record written by the Secretary
     manifest_output_filename: str
     changelog_output_filename: str
     log_subdirectory_name: str
@@ -25,10 +26,36 @@ class AppConfig(BaseModel):
     aider_summary_model: str
     task_description_extraction_model: str
 
+    # Opt-in LLM response cache, stored in the workspace root
+    llm_response_cache_enabled: bool = False
+    llm_response_cache_filename: str = "llm-response-cache.sqlite"
+    llm_response_cache_ttl_hours: float = Field(default=168, gt=0)
+    llm_response_cache_max_bytes: int = Field(default=50 * 1024 * 1024, gt=0)
+
+    # Retries for rate limits, timeouts and 5xx errors from the LLM API
+    llm_max_retries: int = Field(default=3, ge=0)
+    llm_retry_base_delay_seconds: float = Field(default=1.0, ge=0)
+    llm_retry_max_delay_seconds: float = Field(default=30.0, ge=0)
+
+    # "tool" forces an output tool call with the response schema; "prompt" puts the schema in the prompt
+    llm_structured_output_mode: Literal["prompt", "tool"] = "tool"
+
+    # LangGraph checkpoints in the repository's shared git directory under checkpoint_directory_name;
+    # a rerun resumes after the last successful node
+    checkpointing_enabled: bool = True
+    checkpoint_directory_name: str = "army-man-checkpoints"
+
+    # Chrome trace of node and service call timings in goal_root_path/log_subdirectory_name; None disables it
+    trace_filename: Optional[str] = "trace.json"
+
     @property
     def workspace_root_path(self) -> str:
         return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+    @property
+    def llm_response_cache_path(self) -> str:
+        return os.path.join(self.workspace_root_path, self.llm_response_cache_filename)
+
     @classmethod
     def load_from_yaml(cls, config_path: str = "config.yml", root_git_path: Optional[str] = None, goal_path: Optional[str] = None) -> "AppConfig":
         """
@@ -13,6 +13,7 @@ from src.nodes import (
     validate_inputs_node,
 )
 from src.state import WorkflowState
+from src.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -53,14 +54,18 @@ def build_graph() -> StateGraph:
     """
     graph_builder = StateGraph(WorkflowState)
 
-    # Add nodes
-    graph_builder.add_node("initialize_workflow", initialize_workflow_node)
-    graph_builder.add_node("validate_inputs", validate_inputs_node)
-    graph_builder.add_node("manifest_create_node", manifest_create_node)
-    graph_builder.add_node("execute_small_tweak", execute_small_tweak_node)
-    graph_builder.add_node("manifest_update_node", manifest_update_node)
-    graph_builder.add_node("error_path", error_path_node)
-    graph_builder.add_node("success_path", success_path_node)
+    # Add nodes, each timed as a span in the goal's trace
+    nodes = {
+        "initialize_workflow": initialize_workflow_node,
+        "validate_inputs": validate_inputs_node,
+        "manifest_create_node": manifest_create_node,
+        "execute_small_tweak": execute_small_tweak_node,
+        "manifest_update_node": manifest_update_node,
+        "error_path": error_path_node,
+        "success_path": success_path_node,
+    }
+    for node_name, node in nodes.items():
+        graph_builder.add_node(node_name, traced("node", node_name)(node))
 
     # Set entry point
     graph_builder.set_entry_point("initialize_workflow")
@@ -1,57 +1,90 @@
 """Main application entry point for the PoC7 Orchestrator."""
 import argparse
 import logging
+import sys
 import traceback
 
-import nest_asyncio
 from dotenv import load_dotenv
 
 from src.config import AppConfig
-from src.graph_builder import build_graph
-from src.services import (
-    AiderService,
-    ChangelogService,
-    GitService,
-    LlmPromptService,  # Added import
-    WriteFileFromTemplateService,
-)
-from src.state import WorkflowState
-from src.utils.logging_setup import setup_logging
+from src.runner import ArmyManRunner
+from src.serve import serve
+from src.services.git_service import find_git_root
+from src.utils.logging_setup import setup_batch_logging, setup_logging
 
 # Load the .env file
 load_dotenv()
 
-# Apply nest_asyncio *before* any async operations can start
-# Required for our hacky way of using asyncio.run() in different places just for pydantic ai
-nest_asyncio.apply() # <-- Apply the patch
-
-def main():
-    print("PoC7 LangGraph Orchestrator Starting...")
+def read_goals_file(goals_file_path: str) -> list[str]:
+    """Reads one goal folder per line, e.g. the Secretary's new-goal-folders.txt. Blank lines and '#' comments are skipped."""
+    with open(goals_file_path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.strip().startswith("#")]
+
+def run_batch(app_config: AppConfig, goal_paths: list[str], root_git_path: str | None, max_concurrent_goals: int) -> bool:
+    """
+    Runs all goals in this process with one runner. Without --root_git_path each goal uses the
+    checkout its folder is in (e.g. a worktree), so goals in different checkouts can run concurrently.
+    Returns True if every goal succeeded.
+    """
+    setup_batch_logging()
+    logger = logging.getLogger(__name__)
+
+    runner = ArmyManRunner(app_config=app_config)
+    goal_app_configs = [
+        runner.config_for_goal(
+            goal_path=goal_path,
+            root_git_path=root_git_path or find_git_root(goal_path) or app_config.goal_git_path
+        )
+        for goal_path in goal_paths
+    ]
+    final_states = runner.run_goals(goal_app_configs, max_concurrent_goals=max_concurrent_goals)
+
+    succeeded_count = sum(1 for final_state in final_states if final_state and not final_state.get("error_message"))
+    logger.overview(f"Batch finished: {succeeded_count}/{len(goal_paths)} goal(s) succeeded.")
+    for goal_path, final_state in zip(goal_paths, final_states):
+        if final_state is None or final_state.get("error_message"):
+            logger.overview(f"  - Failed: {goal_path}")
+    return succeeded_count == len(goal_paths)
+
+def main() -> int:
+    """Returns the process exit code: 0 if the goal(s) succeeded, 1 otherwise, so callers like the General can rely on it."""
+    # Set up argument parsing
+    parser = argparse.ArgumentParser(description="PoC7 LangGraph Orchestrator")
+    parser.add_argument("--root_git_path", type=str, help="Override the goal_git_path from the config YAML.")
+    parser.add_argument("--goal_path", type=str, help="Override the goal_root_path from the config YAML.")
+    parser.add_argument("--serve", action="store_true", help="Stay alive and run goals received as JSON lines on stdin (see src/serve.py).")
+    parser.add_argument("--goal_paths", type=str, nargs="+", help="Run several goals in this process with one compiled graph.")
+    parser.add_argument("--goals_file", type=str, help="File listing one goal folder per line, e.g. new-goal-folders.txt; runs them like --goal_paths.")
+    parser.add_argument("--max_concurrent_goals", type=int, default=1, help="How many of the --goal_paths/--goals_file goals run at the same time (default 1).")
+    args = parser.parse_args()
+    if args.max_concurrent_goals < 1:
+        parser.error("--max_concurrent_goals must be at least 1.")
+
+    # In serve mode stdout is reserved for responses
+    print("PoC7 LangGraph Orchestrator Starting...", file=sys.stderr if args.serve else sys.stdout)
     logger = logging.getLogger(__name__) # Define logger early for initialization errors
 
     try:
-        # Set up argument parsing
-        parser = argparse.ArgumentParser(description="PoC7 LangGraph Orchestrator")
-        parser.add_argument("--root_git_path", type=str, help="Override the goal_git_path from the config YAML.")
-        parser.add_argument("--goal_path", type=str, help="Override the goal_root_path from the config YAML.")
-        args = parser.parse_args()
-
         # Load configuration using the AppConfig class method
         app_config = AppConfig.load_from_yaml(root_git_path=args.root_git_path, goal_path=args.goal_path)
 
+        if args.serve:
+            # Each goal sets up its own log files; until then only log to stderr
+            logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+            serve(app_config)
+            return 0
+
+        goal_paths = list(args.goal_paths or [])
+        if args.goals_file:
+            goal_paths.extend(read_goals_file(args.goals_file))
+        if args.goal_paths is not None or args.goals_file:
+            return 0 if run_batch(app_config, goal_paths, args.root_git_path, args.max_concurrent_goals) else 1
+
         setup_logging(app_config=app_config)
-        # You can now use app_config throughout your application
-        logger.overview(f"Workspace root: {app_config.workspace_root_path}")
-        logger.overview(f"Goal root: {app_config.goal_root_path}")
-
-        # Instantiate Services
-        changelog_service = ChangelogService(app_config=app_config)
-        repo_path = app_config.goal_git_path        
-        git_service = GitService(repo_path=repo_path)
-        write_file_service = WriteFileFromTemplateService()
-        llm_prompt_service = LlmPromptService(app_config=app_config)
-        aider_service = AiderService(app_config=app_config, llm_prompt_service=llm_prompt_service)
-        logger.debug("Services instantiated.")
+
+        # Compiles the graph and creates the services shared across goals
+        runner = ArmyManRunner(app_config=app_config)
+        logger.debug("Runner created.")
 
     except Exception as e:
         # Use the logger if setup_logging has been called, otherwise print
@@ -61,61 +94,17 @@ def main():
         else:
             print(f"CRITICAL: Failed to initialize application due to configuration error: {e}")
             print(f"Callstack:\n{traceback.format_exc()}")
-        return  # Exit if configuration fails
-
-    # Define LangGraph graph
-    graph_builder = build_graph()
-    logger.debug("Graph builder created.")
-
-    # Compile graph
-    app_graph = graph_builder.compile()
-    logger.debug("Graph compiled.")
-
-    # Prepare initial WorkflowState
-
-    # TODO: Do this initialization inside of the state.py class instead and change this to update the last event summary
-    initial_state: WorkflowState = {
-        "current_step_name": None,
-        "goal_folder_path": None,
-        "workspace_folder_path": None,
-        "task_description_path": None,
-        "task_description_content": None,
-        "manifest_template_path": None,
-        "changelog_template_path": None,
-        "manifest_output_path": None,
-        "changelog_output_path": None,
-        "last_event_summary": "Workflow initiated.",
-        "aider_last_exit_code": None,
-        "error_message": None,
-        "is_manifest_generated": False,
-        "is_changelog_entry_added": False,
-    }
-
-    # Prepare RunnableConfig
-    runnable_config = {
-        "configurable": {
-            "app_config": app_config,
-            "aider_service": aider_service,
-            "changelog_service": changelog_service,
-            "git_service": git_service,
-            "write_file_service": write_file_service,
-            "llm_prompt_service": llm_prompt_service, # Add LlmPromptService to config
-        }
-    }
-    logger.debug("RunnableConfig prepared.")
-
-    # Invoke graph execution
-    logger.overview("Invoking graph execution...")
-    final_state = app_graph.invoke(initial_state, config=runnable_config)
-
-    # logger.info(f"Final workflow state: {final_state}")
-    # Output only the current_step_name, last_event_summary, error_message, is_manifest_generated, and is_changelog_entry_added each on separate lines with helpful indentation and labels
-    logger.overview("PoC7 LangGraph Orchestrator finished.")
-    logger.overview(f"  - Current Step Name: {final_state.get('current_step_name', 'N/A')}")
-    logger.overview(f"  - Last Event Summary: {final_state.get('last_event_summary', 'N/A')}")
-    logger.overview(f"  - Error Message: {final_state.get('error_message', 'N/A')}")
-    logger.overview(f"  - Is Manifest Generated: {final_state.get('is_manifest_generated', 'N/A')}")
-    logger.overview(f"  - Is Changelog Entry Added: {final_state.get('is_changelog_entry_added', 'N/A')}")
+        return 1  # Exit if configuration fails
+
+    try:
+        final_state = runner.run_goal(app_config, configure_logging=False)
+    except ValueError as e:
+        logger.critical(f"Failed to run goal: {e}")
+        logger.critical(f"Callstack:\n{traceback.format_exc()}")
+        return 1
+
+    # The graph ends on the error path instead of raising, so report its error through the exit code
+    return 1 if final_state.get("error_message") else 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,29 @@
+"""Defines Pydantic models describing commits read back from git."""
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class CommitFileStat(BaseModel):
+    """Line counts for one file in a commit, as reported by `git log --numstat`."""
+    path: str
+    lines_added: Optional[int] = Field(default=None, description="None for binary files.")
+    lines_deleted: Optional[int] = Field(default=None, description="None for binary files.")
+
+
+class CommitInfo(BaseModel):
+    """One commit with its subject line and per-file stats."""
+    commit_hash: str
+    message: str
+    files: list[CommitFileStat] = Field(default_factory=list)
+
+    @property
+    def short_hash(self) -> str:
+        return self.commit_hash[:7]
+
+    def format_stats(self) -> str:
+        """Returns e.g. '2 file(s), +10 -3'."""
+        lines_added = sum(file_stat.lines_added or 0 for file_stat in self.files)
+        lines_deleted = sum(file_stat.lines_deleted or 0 for file_stat in self.files)
+        return f"{len(self.files)} file(s), +{lines_added} -{lines_deleted}"
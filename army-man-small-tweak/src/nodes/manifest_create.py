@@ -1,5 +1,4 @@
 """Contains logic for the manifest_create_node."""
-import asyncio
 import logging
 from datetime import datetime
 
@@ -8,14 +7,16 @@ from src.pydantic_models.core_schemas import Artifact, ManifestConfigLLM, Manife
 from src.services.changelog_service import ChangelogService
 from src.services.git_service import GitService
 from src.services.llm_prompt_service import LlmPromptService
+from src.services.task_description_extractor import extract_manifest_config
 from src.services.write_file_from_template_service import WriteFileFromTemplateService
 from src.state import WorkflowState
 
 logger = logging.getLogger(__name__)
 
-def manifest_create_node(state: WorkflowState, config) -> WorkflowState:
+async def manifest_create_node(state: WorkflowState, config) -> WorkflowState:
     """
-    Generates the goal manifest file. It extracts data using LlmPromptService,
+    Generates the goal manifest file. It builds the manifest fields from the Secretary's task sidecar
+    when that names the target file, and otherwise extracts data using LlmPromptService,
     populates a ManifestData Pydantic model, stores this model in the workflow state,
     and then renders the manifest file using WriteFileFromTemplateService.
     Records the event in the changelog upon success.
@@ -47,52 +48,57 @@ def manifest_create_node(state: WorkflowState, config) -> WorkflowState:
             state['manifest_data'] = None
             return state
 
-        logger.info("Attempting to extract structured data from task description using LLM.")
+        manifest_config_llm = extract_manifest_config(
+            task_description_content, state.get('goal_folder_path'), app_config.task_sidecar_filename
+        )
+        if manifest_config_llm:
+            logger.info(f"Using task sidecar for manifest data: {manifest_config_llm.goal_title}")
+            state['last_event_summary'] = f"Task sidecar provided manifest data for: {manifest_config_llm.goal_title}"
+
+        if not manifest_config_llm:
+            logger.info("Attempting to extract structured data from task description using LLM.")
 
-        system_prompt = f"""
+            system_prompt = """
 You are an expert in analyzing software development task descriptions.
 Your goal is to extract specific pieces of information and structure them according to the provided JSON schema.
-The JSON schema to use for your response is:
-{ManifestConfigLLM.model_json_schema()}
-Ensure your output is a valid JSON object that conforms to this schema.
 From the user's task description, extract:
 1.  `goal_title`: A concise title for the overall goal or task.
 2.  `task_description`: The full, original task description provided by the user.
 3.  `small_tweak_file_path`: The specific file path, relative to the git repository root, that is the target of this task.
 """
-        user_prompt = task_description_content
+            user_prompt = task_description_content
 
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
-        ]
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ]
 
-        try:
-            manifest_config_llm = asyncio.run(llm_prompt_service.get_structured_output(
-                messages=messages,
-                output_pydantic_model_type=ManifestConfigLLM,
-                llm_model_name=app_config.task_description_extraction_model
-            ))
-        except Exception as e:
-            error_msg = f"[ManifestCreate] Error during LLM call: {e}"
-            logger.error(error_msg, exc_info=True)
-            state['error_message'] = error_msg
-            state['last_event_summary'] = "Error: LLM call failed during manifest creation."
-            state['is_manifest_generated'] = False
-            state['manifest_data'] = None
-            return state
+            try:
+                manifest_config_llm = await llm_prompt_service.get_structured_output(
+                    messages=messages,
+                    output_pydantic_model_type=ManifestConfigLLM,
+                    llm_model_name=app_config.task_description_extraction_model
+                )
+            except Exception as e:
+                error_msg = f"[ManifestCreate] Error during LLM call: {e}"
+                logger.error(error_msg, exc_info=True)
+                state['error_message'] = error_msg
+                state['last_event_summary'] = "Error: LLM call failed during manifest creation."
+                state['is_manifest_generated'] = False
+                state['manifest_data'] = None
+                return state
 
-        if not manifest_config_llm:
-            error_msg = "[ManifestCreate] LLM did not return structured data (ManifestConfigLLM is None)."
-            logger.error(error_msg)
-            state['error_message'] = error_msg
-            state['last_event_summary'] = "Error: LLM failed to parse task description for manifest."
-            state['is_manifest_generated'] = False
-            state['manifest_data'] = None
-            return state
+            if not manifest_config_llm:
+                error_msg = "[ManifestCreate] LLM did not return structured data (ManifestConfigLLM is None)."
+                logger.error(error_msg)
+                state['error_message'] = error_msg
+                state['last_event_summary'] = "Error: LLM failed to parse task description for manifest."
+                state['is_manifest_generated'] = False
+                state['manifest_data'] = None
+                return state
 
-        logger.info(f"LLM successfully extracted data: {manifest_config_llm.goal_title}")
-        state['last_event_summary'] = f"LLM extracted manifest data for: {manifest_config_llm.goal_title}"
+            logger.info(f"LLM successfully extracted data: {manifest_config_llm.goal_title}")
+            state['last_event_summary'] = f"LLM extracted manifest data for: {manifest_config_llm.goal_title}"
         state['small_tweak_file_path'] = manifest_config_llm.small_tweak_file_path
 
         # Populate ManifestData Pydantic model
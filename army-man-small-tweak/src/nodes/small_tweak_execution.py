@@ -1,4 +1,5 @@
 """Contains logic for the execute_small_tweak_node."""
+import asyncio
 import logging
 import os
 from pathlib import Path
@@ -6,17 +7,20 @@ from typing import Optional
 
 from src.config import AppConfig
 from src.models.aider_summary import AiderRunSummary
+from src.models.git_commit import CommitInfo
 from src.services.aider_service import AiderExecutionResult, AiderService
 from src.services.changelog_service import ChangelogService
+from src.services.git_service import GitService
 from src.state import WorkflowState
 
 logger = logging.getLogger(__name__)
 
-def execute_small_tweak_node(state: WorkflowState, config) -> WorkflowState:
+async def execute_small_tweak_node(state: WorkflowState, config) -> WorkflowState:
     """
     Executes a "Small Tweak" using AiderService based on instructions in
-    task_description_path. It then uses an LLM to summarize Aider's output
-    and updates WorkflowState with the outcome and extracted details.
+    task_description_path. Success is decided from the commits aider made, read
+    back from git. Aider's output is summarized (parsed directly, with an LLM as
+    fallback) for cost and errors, and WorkflowState is updated with the outcome.
     """
     state['current_step_name'] = "Execute Small Tweak"
     logger.info(f"Executing node: {state['current_step_name']}")
@@ -26,12 +30,13 @@ def execute_small_tweak_node(state: WorkflowState, config) -> WorkflowState:
     state['error_message'] = None
     state['last_event_summary'] = "Small Tweak execution started."
     state['aider_run_summary'] = None # To store the AiderRunSummary object
+    state['aider_commits'] = None
 
     try:
         services_config = config["configurable"]
         app_config: AppConfig = services_config["app_config"]
         aider_service: AiderService = services_config["aider_service"]
-        # git_service: GitService = services_config["git_service"] # Keep for now, might be needed for fallback or verification
+        git_service: GitService = services_config["git_service"]
         changelog_service: ChangelogService = services_config["changelog_service"]
 
         task_description_path_str = state.get('task_description_path')
@@ -121,8 +126,14 @@ def execute_small_tweak_node(state: WorkflowState, config) -> WorkflowState:
             "--config", ".aider.sleepy.conf.yml"
         ]
 
+        # Commits aider makes are read back from git afterwards, so remember where HEAD was
+        before_commit_hash = git_service.get_last_commit_hash()
+        logger.info(f"HEAD before aider run: {before_commit_hash or 'N/A (no commits yet)'}")
+
         logger.info("Invoking AiderService to execute small tweak.")
-        aider_result: AiderExecutionResult = aider_service.execute(
+        # Aider is a blocking subprocess; run it in a thread so the event loop stays free for other goals
+        aider_result: AiderExecutionResult = await asyncio.to_thread(
+            aider_service.execute,
             command_args=command_args,
             files_to_add=files_to_edit_or_add_to_context
         )
@@ -131,9 +142,21 @@ def execute_small_tweak_node(state: WorkflowState, config) -> WorkflowState:
         logger.debug(f"Aider STDOUT:\n{aider_result.stdout}")
         logger.debug(f"Aider STDERR:\n{aider_result.stderr}")
 
-        # Attempt to get a structured summary from LLM regardless of aider exit code
+        new_commits: Optional[list[CommitInfo]] = git_service.get_commits_since(before_commit_hash)
+        if new_commits is None:
+            logger.warning("Could not read aider's commits from git; falling back to the aider output summary.")
+        else:
+            state['aider_commits'] = [commit.model_dump() for commit in new_commits]
+            for commit in new_commits:
+                logger.info(f"Aider commit {commit.short_hash} - {commit.message} ({commit.format_stats()})")
+
+        # Attempt to get a structured summary regardless of aider exit code
         # as even on failure, stderr might contain useful info for the summary.
-        aider_run_summary_obj: Optional[AiderRunSummary] = aider_service.get_summary(aider_result)
+        # Once git shows the commits, the summary is only needed for cost and errors, so skip the LLM.
+        aider_run_summary_obj: Optional[AiderRunSummary] = await aider_service.get_summary(
+            aider_result,
+            allow_llm_fallback=not new_commits
+        )
         state['aider_run_summary'] = aider_run_summary_obj.model_dump() if aider_run_summary_obj else None
 
         # Update total_aider_cost with cumulative cost from Aider runs.
@@ -148,17 +171,26 @@ def execute_small_tweak_node(state: WorkflowState, config) -> WorkflowState:
         event_summary = ""
         error_message = ""
 
-        if aider_run_summary_obj:
-            is_code_change_committed = bool(aider_run_summary_obj.commit_hash)
+        if new_commits is not None or aider_run_summary_obj:
+            if new_commits is not None:
+                is_code_change_committed = bool(new_commits)
+            else:
+                is_code_change_committed = bool(aider_run_summary_obj.commit_hash)
 
             # If the code change was committed by aider, then it's considered a success and we record it in the changelog
             if is_code_change_committed:
 
                 cumulative_cost = state.get('total_aider_cost') or 0.0
 
-                changes_str = "\n  - ".join(aider_run_summary_obj.changes_made) if aider_run_summary_obj.changes_made else aider_run_summary_obj.raw_output_summary
-                event_summary = f"{changes_str}\n\n"
-                event_summary += f"  - Commit: {aider_run_summary_obj.commit_hash or 'N/A'} - {aider_run_summary_obj.commit_message or 'N/A'}\n"
+                if new_commits:
+                    event_summary = "".join(
+                        f"  - Commit: {commit.short_hash} - {commit.message} ({commit.format_stats()})\n"
+                        for commit in new_commits
+                    )
+                else:
+                    changes_str = "\n  - ".join(aider_run_summary_obj.changes_made) if aider_run_summary_obj.changes_made else aider_run_summary_obj.raw_output_summary
+                    event_summary = f"{changes_str}\n\n"
+                    event_summary += f"  - Commit: {aider_run_summary_obj.commit_hash or 'N/A'} - {aider_run_summary_obj.commit_message or 'N/A'}\n"
                 event_summary += f"  - Aider Cost: ${cumulative_cost:.4f}\n"
                 state['last_event_summary'] = event_summary
 
@@ -0,0 +1,216 @@
+"""Importable entry point that runs the small tweak workflow on one goal after another in the same process."""
+import asyncio
+import logging
+import os
+from typing import Optional, TextIO
+
+from src.checkpointing import ainvoke_with_checkpoints, get_checkpoint_thread_id, open_goal_checkpointer
+from src.config import AppConfig
+from src.graph_builder import build_graph
+from src.services import (
+    AiderService,
+    ChangelogService,
+    GitService,
+    LlmPromptService,
+    WriteFileFromTemplateService,
+)
+from src.state import WorkflowState
+from src.utils.logging_setup import goal_logging, setup_logging
+from src.utils.tracing import goal_tracing
+
+logger = logging.getLogger(__name__)
+
+
+def create_initial_state() -> WorkflowState:
+    """Returns the state every goal's graph run starts from."""
+    # TODO: Do this initialization inside of the state.py class instead and change this to update the last event summary
+    return {
+        "current_step_name": None,
+        "goal_folder_path": None,
+        "workspace_folder_path": None,
+        "task_description_path": None,
+        "task_description_content": None,
+        "manifest_template_path": None,
+        "changelog_template_path": None,
+        "manifest_output_path": None,
+        "changelog_output_path": None,
+        "last_event_summary": "Workflow initiated.",
+        "aider_last_exit_code": None,
+        "error_message": None,
+        "is_manifest_generated": False,
+        "is_changelog_entry_added": False,
+    }
+
+
+def log_final_state(final_state: WorkflowState) -> None:
+    """Writes the outcome of a goal to the overview log."""
+    # logger.info(f"Final workflow state: {final_state}")
+    # Output only the current_step_name, last_event_summary, error_message, is_manifest_generated, and is_changelog_entry_added each on separate lines with helpful indentation and labels
+    logger.overview("PoC7 LangGraph Orchestrator finished.")
+    logger.overview(f"  - Current Step Name: {final_state.get('current_step_name', 'N/A')}")
+    logger.overview(f"  - Last Event Summary: {final_state.get('last_event_summary', 'N/A')}")
+    logger.overview(f"  - Error Message: {final_state.get('error_message', 'N/A')}")
+    logger.overview(f"  - Is Manifest Generated: {final_state.get('is_manifest_generated', 'N/A')}")
+    logger.overview(f"  - Is Changelog Entry Added: {final_state.get('is_changelog_entry_added', 'N/A')}")
+    # The General parses this line to record per-goal cost in its goal ledger
+    total_aider_cost = final_state.get('total_aider_cost')
+    logger.overview(f"  - Total Aider Cost: ${total_aider_cost:.4f}" if total_aider_cost is not None else "  - Total Aider Cost: N/A")
+
+
+def _goal_path_overrides(goal_path: Optional[str], root_git_path: Optional[str]) -> dict[str, str]:
+    overrides = {}
+    if goal_path is not None:
+        overrides["goal_root_path"] = goal_path
+    if root_git_path is not None:
+        overrides["goal_git_path"] = root_git_path
+    return overrides
+
+
+class ArmyManRunner:
+    """
+    Holds the compiled graph and the goal-independent services so many goals can be
+    worked on without paying for imports, graph compilation and config loading each time.
+    Services bound to a goal's folder or checkout are cheap and are created per goal.
+    """
+
+    def __init__(self, app_config: AppConfig, console_stream: Optional[TextIO] = None):
+        """
+        Args:
+            app_config: Base configuration; each goal overrides its goal and git paths.
+            console_stream: Stream console logging is written to when a goal configures logging.
+        """
+        self.app_config = app_config
+        self.console_stream = console_stream
+        self.app_graph = build_graph().compile()
+        self.llm_prompt_service = LlmPromptService(app_config=app_config)
+        self.write_file_service = WriteFileFromTemplateService()
+        logger.debug("ArmyManRunner created with a compiled graph and shared services.")
+
+    def config_for_goal(self, goal_path: Optional[str] = None, root_git_path: Optional[str] = None) -> AppConfig:
+        """Returns a copy of the base configuration pointing at the given goal and checkout."""
+        return self.app_config.model_copy(update=_goal_path_overrides(goal_path, root_git_path))
+
+    def run_goal(self, app_config: AppConfig, configure_logging: bool = True) -> WorkflowState:
+        """
+        Runs the workflow for the goal described by `app_config` in a new event loop.
+        See `arun_goal`.
+        """
+        async def run_and_close() -> WorkflowState:
+            try:
+                return await self.arun_goal(app_config, configure_logging=configure_logging)
+            finally:
+                # The pooled LLM client belongs to this event loop, which ends with the goal
+                await self.aclose()
+
+        return asyncio.run(run_and_close())
+
+    async def arun_goal(self, app_config: AppConfig, configure_logging: bool = True) -> WorkflowState:
+        """
+        Runs the workflow for the goal described by `app_config` on the running event loop.
+
+        Args:
+            app_config: Configuration for this goal, usually from `config_for_goal`.
+            configure_logging: Whether to point the log files at this goal's folder first.
+
+        Returns:
+            The final workflow state.
+        """
+        if configure_logging:
+            setup_logging(app_config=app_config, console_stream=self.console_stream)
+        logger.overview(f"Workspace root: {app_config.workspace_root_path}")
+        logger.overview(f"Goal root: {app_config.goal_root_path}")
+
+        runnable_config = {
+            "configurable": {
+                "app_config": app_config,
+                "aider_service": AiderService(app_config=app_config, llm_prompt_service=self.llm_prompt_service),
+                "changelog_service": ChangelogService(app_config=app_config),
+                "git_service": GitService(repo_path=app_config.goal_git_path),
+                "write_file_service": self.write_file_service,
+                "llm_prompt_service": self.llm_prompt_service,
+            }
+        }
+        logger.debug("RunnableConfig prepared.")
+
+        logger.overview("Invoking graph execution...")
+        with goal_tracing(app_config):
+            if app_config.checkpointing_enabled:
+                async with open_goal_checkpointer(app_config) as checkpointer:
+                    final_state = await ainvoke_with_checkpoints(
+                        self.app_graph.copy(update={"checkpointer": checkpointer}),
+                        create_initial_state(),
+                        runnable_config,
+                        get_checkpoint_thread_id(app_config)
+                    )
+            else:
+                final_state = await self.app_graph.ainvoke(create_initial_state(), config=runnable_config)
+        log_final_state(final_state)
+        return final_state
+
+    def run_goals(self, goal_app_configs: list[AppConfig], max_concurrent_goals: int = 1) -> list[Optional[WorkflowState]]:
+        """
+        Runs several goals on one event loop in a new event loop.
+        See `arun_goals`.
+        """
+        async def run_and_close() -> list[Optional[WorkflowState]]:
+            try:
+                return await self.arun_goals(goal_app_configs, max_concurrent_goals)
+            finally:
+                await self.aclose()
+
+        return asyncio.run(run_and_close())
+
+    async def arun_goals(self, goal_app_configs: list[AppConfig], max_concurrent_goals: int = 1) -> list[Optional[WorkflowState]]:
+        """
+        Runs several goals through the shared graph and services, up to `max_concurrent_goals`
+        at a time. Goals that share a git checkout still run one after another, since aider and
+        the nodes commit to it. Each goal logs to its own log files; call `setup_batch_logging` first.
+
+        Args:
+            goal_app_configs: One configuration per goal, usually from `config_for_goal`.
+            max_concurrent_goals: How many goals may run at the same time.
+
+        Returns:
+            The final state of each goal in input order, or None for a goal that raised.
+        """
+        concurrency_limit = asyncio.Semaphore(max_concurrent_goals)
+        checkout_locks: dict[str, asyncio.Lock] = {}
+
+        async def run_one(goal_app_config: AppConfig) -> Optional[WorkflowState]:
+            checkout_lock = checkout_locks.setdefault(os.path.abspath(goal_app_config.goal_git_path), asyncio.Lock())
+            async with checkout_lock, concurrency_limit:
+                with goal_logging(goal_app_config):
+                    try:
+                        return await self.arun_goal(goal_app_config, configure_logging=False)
+                    except Exception as e:
+                        logger.error(f"Goal {goal_app_config.goal_root_path} failed with an unexpected error: {e}", exc_info=True)
+                        return None
+
+        logger.info(f"Running {len(goal_app_configs)} goal(s), up to {max_concurrent_goals} at a time.")
+        return await asyncio.gather(*(run_one(goal_app_config) for goal_app_config in goal_app_configs))
+
+    async def aclose(self) -> None:
+        """Releases the pooled LLM connections; await it before the event loop the goals ran on ends."""
+        await self.llm_prompt_service.aclose()
+
+
+_default_runner: Optional[ArmyManRunner] = None
+
+
+def run_goal(app_config: AppConfig, goal_path: Optional[str] = None, root_git_path: Optional[str] = None) -> WorkflowState:
+    """
+    Runs one goal using a process-wide runner that is built on first use and reused afterwards.
+
+    Args:
+        app_config: Base configuration; also used to build the runner on the first call.
+        goal_path: Optional goal folder overriding `goal_root_path`.
+        root_git_path: Optional checkout overriding `goal_git_path`.
+
+    Returns:
+        The final workflow state.
+    """
+    global _default_runner
+    if _default_runner is None:
+        _default_runner = ArmyManRunner(app_config)
+    goal_app_config = app_config.model_copy(update=_goal_path_overrides(goal_path, root_git_path))
+    return _default_runner.run_goal(goal_app_config)
@@ -0,0 +1,112 @@
+"""
+Long-lived worker mode: runs goals received as JSON lines on stdin with one warm ArmyManRunner.
+
+Protocol (one JSON object per line):
+    request:  {"id": 1, "method": "run_goal", "params": {"goal_path": "...", "root_git_path": "..."}}
+    response: {"id": 1, "result": {...final state summary...}} or {"id": 1, "error": "message"}
+    request:  {"id": 2, "method": "shutdown"} ends the loop after responding.
+
+Stdout carries nothing but responses; logging and stray prints go to stderr.
+"""
+import asyncio
+import json
+import logging
+import sys
+from typing import Any, Optional, TextIO
+
+from src.config import AppConfig
+from src.runner import ArmyManRunner
+from src.state import WorkflowState
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_STATE_KEYS = [
+    "current_step_name",
+    "last_event_summary",
+    "error_message",
+    "is_manifest_generated",
+    "is_changelog_entry_added",
+    "total_aider_cost",
+]
+
+
+def summarize_final_state(final_state: WorkflowState) -> dict[str, Any]:
+    """Returns the JSON-serializable part of the final state the General cares about."""
+    return {key: final_state.get(key) for key in SUMMARY_STATE_KEYS}
+
+
+def _write_response(response_stream: TextIO, request_id: Any, result: Any = None, error: Optional[str] = None) -> None:
+    response = {"id": request_id}
+    if error is not None:
+        response["error"] = error
+    else:
+        response["result"] = result
+    response_stream.write(json.dumps(response) + "\n")
+    response_stream.flush()
+
+
+def serve(app_config: AppConfig, request_stream: Optional[TextIO] = None, response_stream: Optional[TextIO] = None) -> None:
+    """
+    Answers run_goal requests until stdin closes or a shutdown request arrives.
+
+    Args:
+        app_config: Base configuration; each request overrides the goal and git paths.
+        request_stream: Where requests are read from; defaults to stdin.
+        response_stream: Where responses are written; defaults to the real stdout.
+    """
+    request_stream = request_stream or sys.stdin
+    response_stream = response_stream or sys.stdout
+    # Services print errors directly; keep those from corrupting the response stream
+    sys.stdout = sys.stderr
+
+    runner = ArmyManRunner(app_config=app_config, console_stream=sys.stderr)
+    logger.info("Army Man worker ready for goals.")
+
+    # One event loop for the worker's lifetime, so pooled LLM connections are reused across goals
+    event_loop = asyncio.new_event_loop()
+    try:
+        for line in request_stream:
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as e:
+                _write_response(response_stream, None, error=f"Invalid JSON request: {e}")
+                continue
+            if not isinstance(request, dict):
+                _write_response(response_stream, None, error="Request must be a JSON object.")
+                continue
+
+            request_id = request.get("id")
+            method = request.get("method")
+            if method == "shutdown":
+                _write_response(response_stream, request_id, result="ok")
+                break
+            if method != "run_goal":
+                _write_response(response_stream, request_id, error=f"Unknown method: {method}")
+                continue
+
+            params = request.get("params") or {}
+            goal_path = params.get("goal_path")
+            if not goal_path:
+                _write_response(response_stream, request_id, error="run_goal requires params.goal_path.")
+                continue
+
+            try:
+                goal_app_config = runner.config_for_goal(goal_path=goal_path, root_git_path=params.get("root_git_path"))
+                final_state = event_loop.run_until_complete(runner.arun_goal(goal_app_config))
+            except Exception as e:
+                # A broken goal must not take the warm worker down with it
+                logger.error(f"Goal {goal_path} failed with an unexpected error: {e}", exc_info=True)
+                _write_response(response_stream, request_id, error=str(e))
+                continue
+
+            _write_response(response_stream, request_id, result=summarize_final_state(final_state))
+    finally:
+        event_loop.run_until_complete(runner.aclose())
+        event_loop.run_until_complete(event_loop.shutdown_asyncgens())
+        event_loop.close()
+
+    logger.info("Army Man worker shutting down.")
@@ -0,0 +1,163 @@
+"""Deterministic parser that builds an AiderRunSummary from aider's console output."""
+import re
+from typing import Optional
+
+from src.models.aider_summary import AiderRunSummary
+
+# Without a console aider wraps its output at 79 characters, splitting long paths across lines
+AIDER_WRAP_WIDTH = 79
+
+COMMIT_PATTERN = re.compile(r"^Commit ([0-9a-f]{7,40}) (.+)$")
+APPLIED_EDIT_PATTERN = re.compile(r"^Applied edit to ?(.*)$")
+CREATED_FILE_PATTERN = re.compile(r"^Creating empty file ?(.*)$")
+COST_PATTERN = re.compile(r"Cost: \$([0-9]+(?:\.[0-9]+)?) message, \$([0-9]+(?:\.[0-9]+)?) session")
+ERROR_PATTERN = re.compile(
+    r"^(litellm\.\w+|\w*(Error|Exception):|The LLM did not conform to the edit format|"
+    r"Failed to apply edit|Unable to|Only \d+ reflections allowed)"
+)
+
+
+class AiderOutputParser:
+    """
+    Line-by-line state machine over aider's stable output lines:
+    `Commit <hash> <message>`, `Applied edit to <file>`, `Creating empty file <file>`
+    and `Tokens: ... Cost: $X message, $Y session.`
+
+    Lines can be fed as they are produced; call `get_summary` once the run is over.
+    """
+
+    def __init__(self, wrap_width: int = AIDER_WRAP_WIDTH):
+        self.wrap_width = wrap_width
+        self.commits: list[tuple[str, str]] = []
+        self.files_modified: list[str] = []
+        self.files_created: list[str] = []
+        self.errors_reported: list[str] = []
+        self.session_cost: Optional[float] = None
+        self.saw_token_report = False
+
+        # A value wrapped onto the following lines, and the list it belongs to once complete
+        self._pending_fragments: list[str] = []
+        self._pending_target: Optional[list[str]] = None
+
+    def _is_wrapped(self, line: str) -> bool:
+        return len(line) >= self.wrap_width
+
+    def _is_continuation(self, line: str) -> bool:
+        """A wrapped path continues on a line without spaces that is not one of aider's known lines."""
+        stripped_line = line.strip()
+        if not stripped_line or re.search(r"\s", stripped_line):
+            return False
+        return not any(
+            pattern.match(stripped_line)
+            for pattern in (APPLIED_EDIT_PATTERN, CREATED_FILE_PATTERN, COMMIT_PATTERN, ERROR_PATTERN)
+        ) and not COST_PATTERN.search(stripped_line)
+
+    def _start_pending(self, first_fragment: str, full_line: str, target: list[str]) -> None:
+        if not first_fragment:
+            # The value starts on the next line
+            self._pending_fragments, self._pending_target = [], target
+        elif self._is_wrapped(full_line):
+            self._pending_fragments, self._pending_target = [first_fragment], target
+        else:
+            self._add_unique(target, first_fragment)
+
+    def flush(self) -> None:
+        """Completes a value that may still continue on the next line, e.g. at the end of a stream."""
+        if self._pending_target is not None and self._pending_fragments:
+            self._add_unique(self._pending_target, "".join(self._pending_fragments))
+        self._pending_fragments, self._pending_target = [], None
+
+    def _add_unique(self, target: list[str], value: str) -> None:
+        if value not in target:
+            target.append(value)
+
+    def feed(self, line: str) -> None:
+        """Consumes one line of aider stdout or stderr."""
+        line = line.rstrip()
+
+        if self._pending_target is not None:
+            if self._is_continuation(line):
+                self._pending_fragments.append(line.strip())
+                if not self._is_wrapped(line):
+                    self.flush()
+                return
+            # The value was exactly as long as the wrap width; this line is unrelated
+            self.flush()
+
+        applied_edit_match = APPLIED_EDIT_PATTERN.match(line)
+        if applied_edit_match:
+            self._start_pending(applied_edit_match.group(1).strip(), line, self.files_modified)
+            return
+
+        created_file_match = CREATED_FILE_PATTERN.match(line)
+        if created_file_match:
+            self._start_pending(created_file_match.group(1).strip(), line, self.files_created)
+            return
+
+        commit_match = COMMIT_PATTERN.match(line)
+        if commit_match:
+            self.commits.append((commit_match.group(1), commit_match.group(2).strip()))
+            return
+
+        cost_match = COST_PATTERN.search(line)
+        if cost_match:
+            self.saw_token_report = True
+            # Several reports can appear in one run; the highest session figure is the run's total
+            session_cost = float(cost_match.group(2))
+            if self.session_cost is None or session_cost > self.session_cost:
+                self.session_cost = session_cost
+            return
+
+        if ERROR_PATTERN.match(line):
+            self.errors_reported.append(line)
+
+    def can_classify(self) -> bool:
+        """True once the output shows the run either committed or at least reached the model and reported cost."""
+        return bool(self.commits) or self.saw_token_report
+
+    def get_summary(self) -> Optional[AiderRunSummary]:
+        """
+        Returns the summary of everything fed so far, or None if the run cannot be classified.
+        """
+        self.flush()
+        if not self.can_classify():
+            return None
+
+        # Files aider created also show up as edited; report them only once
+        files_modified = [path for path in self.files_modified if path not in self.files_created]
+        last_commit_hash, last_commit_message = self.commits[-1] if self.commits else (None, None)
+
+        if self.commits:
+            raw_output_summary = (
+                f"Aider edited {len(self.files_modified)} file(s) and made {len(self.commits)} commit(s)."
+            )
+        else:
+            raw_output_summary = f"Aider edited {len(self.files_modified)} file(s) but made no commit."
+
+        return AiderRunSummary(
+            changes_made=[message for _, message in self.commits],
+            commit_hash=last_commit_hash,
+            commit_message=last_commit_message,
+            files_modified=files_modified,
+            files_created=list(self.files_created),
+            errors_reported=list(self.errors_reported),
+            raw_output_summary=raw_output_summary,
+            total_cost=self.session_cost if self.session_cost is not None else 0.0,
+        )
+
+
+def parse_aider_output(stdout: str, stderr: str = "") -> Optional[AiderRunSummary]:
+    """
+    Parses a finished aider run's captured output.
+
+    Returns:
+        The summary, or None if the output does not show enough to classify the run.
+    """
+    parser = AiderOutputParser()
+    for line in stdout.splitlines():
+        parser.feed(line)
+    # Stderr lines must not be read as continuations of a wrapped stdout value
+    parser.flush()
+    for line in stderr.splitlines():
+        parser.feed(line)
+    return parser.get_summary()
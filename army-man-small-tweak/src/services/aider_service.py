@@ -1,5 +1,5 @@
 """Defines the AiderService class."""
-import asyncio
+import contextvars
 import logging
 import subprocess
 import threading
@@ -9,7 +9,9 @@ from pydantic import BaseModel
 
 from src.config import AppConfig
 from src.models.aider_summary import AiderRunSummary
+from src.services.aider_output_parser import parse_aider_output
 from src.services.llm_prompt_service import LlmPromptService
+from src.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +39,7 @@ class AiderService:
         self.workspace_path = app_config.goal_git_path
         self.llm_prompt_service = llm_prompt_service
 
+    @traced("aider")
     def execute(self, command_args: list[str], files_to_add: Optional[list[str]] = None) -> AiderExecutionResult:
         """
         Executes an aider command as a subprocess, streams its output, captures stdout and stderr,
@@ -77,9 +80,13 @@ class AiderService:
                 cwd=self.workspace_path,
             )
 
-            # Create threads to stream stdout and stderr
-            stdout_thread = threading.Thread(target=stream_output, args=(process.stdout, logger.info, stdout_lines))
-            stderr_thread = threading.Thread(target=stream_output, args=(process.stderr, logger.error, stderr_lines))
+            # Create threads to stream stdout and stderr, in copies of this context so batch mode logs them to this goal
+            stdout_thread = threading.Thread(
+                target=contextvars.copy_context().run, args=(stream_output, process.stdout, logger.info, stdout_lines)
+            )
+            stderr_thread = threading.Thread(
+                target=contextvars.copy_context().run, args=(stream_output, process.stderr, logger.error, stderr_lines)
+            )
 
             # Start the threads
             stdout_thread.start()
@@ -107,7 +114,29 @@ class AiderService:
             logger.critical(error_msg, exc_info=True)
             return AiderExecutionResult(exit_code=-1, stdout="", stderr=error_msg)
 
-    def get_summary(self, result: AiderExecutionResult) -> AiderRunSummary:
+    @traced("aider")
+    async def get_summary(self, result: AiderExecutionResult, allow_llm_fallback: bool = True) -> Optional[AiderRunSummary]:
+        """
+        Summarizes an aider run from its output lines, asking the LLM only when the
+        output cannot be classified (e.g. aider crashed before reaching the model).
+
+        Args:
+            result: The aider run to summarize.
+            allow_llm_fallback: Whether the LLM may be asked when parsing is inconclusive.
+        """
+        parsed_summary = parse_aider_output(result.stdout, result.stderr)
+        if parsed_summary:
+            logger.info("Extracted Aider run summary from aider output.")
+            logger.debug(f"Aider Run Summary: {parsed_summary.model_dump_json(indent=2)}")
+            return parsed_summary
+        if not allow_llm_fallback:
+            logger.info("Could not classify aider output; skipping LLM summary extraction.")
+            return None
+
+        logger.info("Could not classify aider output; falling back to LLM summary extraction.")
+        return await self._get_llm_summary(result)
+
+    async def _get_llm_summary(self, result: AiderExecutionResult) -> Optional[AiderRunSummary]:
         system_prompt = """
 You are an expert at analyzing the output of the 'aider' command-line tool.
 Your task is to extract specific information from aider's stdout and stderr and return it in a structured JSON format
@@ -154,11 +183,11 @@ Based on this output, provide a JSON summary matching the AiderRunSummary model.
 
             # Note: Using a placeholder for llm_model_name. This should come from app_config.
             # e.g., app_config.llm_model_for_summaries
-            aider_run_summary_obj = asyncio.run(self.llm_prompt_service.get_structured_output(
+            aider_run_summary_obj = await self.llm_prompt_service.get_structured_output(
                 messages=llm_messages,
                 output_pydantic_model_type=AiderRunSummary,
                 llm_model_name=self.app_config.aider_summary_model
-            ))
+            )
 
             if aider_run_summary_obj:
                 logger.info("Successfully extracted Aider run summary.")
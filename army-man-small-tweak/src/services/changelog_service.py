@@ -5,6 +5,7 @@ from datetime import datetime
 
 from src.config import AppConfig
 from src.state import WorkflowState
+from src.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +13,7 @@ class ChangelogService:
     def __init__(self, app_config: AppConfig):
         self.app_config = app_config
 
+    @traced("changelog")
     def record_event_in_changelog(self, current_workflow_state: WorkflowState, preceding_event_summary: str) -> bool:
         """
         Records an event in the changelog.md file by direct f-string formatting.
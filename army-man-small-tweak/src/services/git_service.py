@@ -1,22 +1,44 @@
 import subprocess
 import os
 
+from src.models.git_commit import CommitFileStat, CommitInfo
+from src.utils.tracing import trace_span
+
+# Separators that cannot appear in a commit subject, so `git log` output splits unambiguously
+COMMIT_RECORD_SEPARATOR = "\x1e"
+COMMIT_FIELD_SEPARATOR = "\x1f"
+
+
+def find_git_root(path: str) -> str | None:
+    """Returns the nearest directory at or above `path` with a '.git' entry (directory or worktree file), or None."""
+    current_path = os.path.abspath(path)
+    while True:
+        if os.path.exists(os.path.join(current_path, '.git')):
+            return current_path
+        parent_path = os.path.dirname(current_path)
+        if parent_path == current_path:
+            return None
+        current_path = parent_path
+
+
 class GitService:
     def __init__(self, repo_path: str):
         self.repo_path = repo_path
-        if not os.path.isdir(os.path.join(repo_path, '.git')):
+        # Linked worktrees (used by the General) have a '.git' file instead of a directory
+        if not os.path.exists(os.path.join(repo_path, '.git')):
             raise ValueError(f"'{repo_path}' is not a valid Git repository.")
 
     def _run_git_command(self, command: list[str]) -> str:
         try:
-            process = subprocess.run(
-                ["git"] + command,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=True, # Will raise CalledProcessError for non-zero exit codes
-                encoding='utf-8' # Explicitly set encoding
-            )
+            with trace_span(f"git {command[0]}", "git"):
+                process = subprocess.run(
+                    ["git"] + command,
+                    cwd=self.repo_path,
+                    capture_output=True,
+                    text=True,
+                    check=True, # Will raise CalledProcessError for non-zero exit codes
+                    encoding='utf-8' # Explicitly set encoding
+                )
             return process.stdout.strip()
         except subprocess.CalledProcessError as e:
             raise # Re-raise the exception or handle it as appropriate
@@ -49,6 +71,51 @@ class GitService:
         except (subprocess.CalledProcessError, ValueError):
             return None
 
+    def get_commits_since(self, before_hash: str | None) -> list[CommitInfo] | None:
+        """
+        Returns the commits in `before_hash..HEAD`, oldest first, with per-file line stats,
+        using a single `git log --numstat` call.
+
+        Args:
+            before_hash: HEAD before the work started; None if the repository had no commits yet.
+
+        Returns:
+            The new commits (empty if none), or None if git could not be queried.
+        """
+        revision_range = f"{before_hash}..HEAD" if before_hash else "HEAD"
+        log_format = f"--format={COMMIT_RECORD_SEPARATOR}%H{COMMIT_FIELD_SEPARATOR}%s"
+        try:
+            log_output = self._run_git_command(["log", "--reverse", "--numstat", log_format, revision_range])
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return None
+
+        commits: list[CommitInfo] = []
+        for record in log_output.split(COMMIT_RECORD_SEPARATOR):
+            if not record.strip():
+                continue
+            header, _, numstat_block = record.partition("\n")
+            commit_hash, _, message = header.partition(COMMIT_FIELD_SEPARATOR)
+
+            files: list[CommitFileStat] = []
+            for numstat_line in numstat_block.splitlines():
+                parts = numstat_line.split("\t", 2)
+                if len(parts) != 3:
+                    continue
+                lines_added, lines_deleted, path = parts
+                # Binary files are reported as "-\t-\t<path>"
+                files.append(CommitFileStat(
+                    path=path,
+                    lines_added=int(lines_added) if lines_added.isdigit() else None,
+                    lines_deleted=int(lines_deleted) if lines_deleted.isdigit() else None,
+                ))
+            commits.append(CommitInfo(commit_hash=commit_hash.strip(), message=message.strip(), files=files))
+        return commits
+
+    def get_common_git_directory(self) -> str:
+        """Returns the main checkout's .git directory, which linked worktrees share and which outlives them."""
+        common_git_directory = self._run_git_command(["rev-parse", "--git-common-dir"])
+        return os.path.abspath(os.path.join(self.repo_path, common_git_directory))
+
     def commit_changes(self, commit_message: str) -> bool:
         try:
             self._run_git_command(["add", "."])
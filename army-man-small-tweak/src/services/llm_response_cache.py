@@ -0,0 +1,131 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LlmResponseCache:
+    """
+    SQLite-backed cache of validated LLM responses.
+
+    Entries expire after `ttl_seconds`. Once the stored responses exceed `max_bytes`,
+    the least recently used entries are evicted.
+    """
+
+    def __init__(self, database_path: str, ttl_seconds: float, max_bytes: int):
+        """
+        Args:
+            database_path: SQLite file holding the cache; created if missing.
+            ttl_seconds: How long a response stays valid.
+            max_bytes: Upper bound for the total size of stored responses.
+        """
+        self.database_path = database_path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        database_directory = os.path.dirname(os.path.abspath(database_path))
+        os.makedirs(database_directory, exist_ok=True)
+        # Several processes (e.g. parallel workers) may share one cache file
+        self._connection = sqlite3.connect(database_path, timeout=30)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                cache_key TEXT PRIMARY KEY,
+                model_name TEXT NOT NULL,
+                response_json TEXT NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_used_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_last_used ON llm_responses (last_used_at)")
+        self._connection.commit()
+
+    @staticmethod
+    def make_key(
+        model_name: str,
+        messages: list[dict[str, str]],
+        output_json_schema: dict[str, Any],
+        model_parameters: Optional[dict[str, Any]]
+    ) -> str:
+        """Hashes everything that influences the response. Role case and surrounding whitespace are ignored."""
+        normalized_messages = [
+            {"role": (message.get("role") or "").lower(), "content": (message.get("content") or "").strip()}
+            for message in messages
+        ]
+        key_source = json.dumps(
+            {
+                "model": model_name,
+                "messages": normalized_messages,
+                "schema": output_json_schema,
+                "parameters": model_parameters or {},
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+    def get(self, cache_key: str) -> Optional[str]:
+        """Returns the cached response JSON, or None on a miss or an expired entry."""
+        now = time.time()
+        row = self._connection.execute(
+            "SELECT response_json, created_at FROM llm_responses WHERE cache_key = ?", (cache_key,)
+        ).fetchone()
+
+        if row is None or now - row[1] > self.ttl_seconds:
+            if row is not None:
+                self._connection.execute("DELETE FROM llm_responses WHERE cache_key = ?", (cache_key,))
+                self._connection.commit()
+            self.misses += 1
+            logger.info(f"LLM response cache miss (hits: {self.hits}, misses: {self.misses}).")
+            return None
+
+        self._connection.execute("UPDATE llm_responses SET last_used_at = ? WHERE cache_key = ?", (now, cache_key))
+        self._connection.commit()
+        self.hits += 1
+        logger.info(f"LLM response cache hit (hits: {self.hits}, misses: {self.misses}).")
+        return row[0]
+
+    def put(self, cache_key: str, model_name: str, response_json: str) -> None:
+        """Stores a response, then evicts least recently used entries while over `max_bytes`."""
+        now = time.time()
+        size_bytes = len(response_json.encode("utf-8"))
+        if size_bytes > self.max_bytes:
+            logger.debug(f"LLM response of {size_bytes} bytes is larger than the cache; not caching it.")
+            return
+
+        self._connection.execute(
+            "INSERT OR REPLACE INTO llm_responses (cache_key, model_name, response_json, size_bytes, created_at, last_used_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (cache_key, model_name, response_json, size_bytes, now, now)
+        )
+        self._evict_over_size()
+        self._connection.commit()
+
+    def _evict_over_size(self) -> None:
+        total_bytes = self._connection.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM llm_responses").fetchone()[0]
+        if total_bytes <= self.max_bytes:
+            return
+
+        evicted_keys: list[tuple[str]] = []
+        for cache_key, size_bytes in self._connection.execute(
+            "SELECT cache_key, size_bytes FROM llm_responses ORDER BY last_used_at ASC"
+        ).fetchall():
+            if total_bytes <= self.max_bytes:
+                break
+            evicted_keys.append((cache_key,))
+            total_bytes -= size_bytes
+        self._connection.executemany("DELETE FROM llm_responses WHERE cache_key = ?", evicted_keys)
+        logger.debug(f"Evicted {len(evicted_keys)} LLM response(s) to stay under {self.max_bytes} bytes.")
+
+    def close(self) -> None:
+        self._connection.close()
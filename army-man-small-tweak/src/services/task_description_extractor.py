@@ -0,0 +1,81 @@
+"""Deterministic extraction of the manifest fields from a goal folder, without an LLM."""
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Optional
+
+from pydantic import ValidationError
+
+from src.pydantic_models.core_schemas import ManifestConfigLLM
+
+logger = logging.getLogger(__name__)
+
+MAX_TITLE_LENGTH = 80
+
+HEADING_PATTERN = re.compile(r"^#{1,6}\s+(.+?)\s*#*\s*$")
+
+
+def load_task_sidecar(goal_folder_path: Optional[str], sidecar_filename: Optional[str]) -> Optional[dict]:
+    """
+    Reads the structured task record the Secretary writes next to the task description.
+
+    Returns:
+        The record's fields, or None if there is no readable sidecar.
+    """
+    if not goal_folder_path or not sidecar_filename:
+        return None
+    sidecar_path = Path(goal_folder_path) / sidecar_filename
+    if not sidecar_path.is_file():
+        return None
+    try:
+        task_record = json.loads(sidecar_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable task sidecar '{sidecar_path}': {e}")
+        return None
+    return task_record if isinstance(task_record, dict) else None
+
+
+def extract_goal_title(task_description: str, goal_folder_path: Optional[str]) -> Optional[str]:
+    """
+    Uses the first markdown heading of a hand-written description as the title. The Secretary
+    writes descriptions without their '## ' heading, so otherwise the goal folder name is used.
+    """
+    for line in task_description.splitlines():
+        heading_match = HEADING_PATTERN.match(line.strip())
+        if heading_match:
+            return heading_match.group(1)[:MAX_TITLE_LENGTH].strip()
+    if goal_folder_path:
+        folder_title = re.sub(r"[-_\s]+", " ", Path(goal_folder_path).name).strip()
+        return folder_title[:MAX_TITLE_LENGTH].strip() or None
+    return None
+
+
+def extract_manifest_config(
+    task_description: str, goal_folder_path: Optional[str], sidecar_filename: Optional[str]
+) -> Optional[ManifestConfigLLM]:
+    """
+    Builds the manifest fields from the goal's task sidecar. The target file comes only from the
+    sidecar's `small_tweak_file_path`, which the Secretary sets when exactly one quoted path exists
+    in the project; the title falls back to the description's heading or the goal folder name.
+
+    Returns:
+        The manifest fields, or None if an LLM should decide.
+    """
+    task_record = load_task_sidecar(goal_folder_path, sidecar_filename)
+    if not task_record or not isinstance(task_record.get("small_tweak_file_path"), str):
+        return None
+
+    goal_title = task_record.get("goal_title") or extract_goal_title(task_description, goal_folder_path)
+    if not goal_title:
+        return None
+
+    try:
+        return ManifestConfigLLM(
+            goal_title=goal_title,
+            task_description=task_record.get("task_description") or task_description.strip(),
+            small_tweak_file_path=task_record["small_tweak_file_path"],
+        )
+    except ValidationError as e:
+        logger.warning(f"Ignoring unusable task sidecar in '{goal_folder_path}': {e}")
+        return None
@@ -6,6 +6,8 @@ from typing import Any, Dict
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape, exceptions
 
+from src.utils.tracing import traced
+
 logger = logging.getLogger(__name__)
 
 class WriteFileFromTemplateService:
@@ -18,6 +20,7 @@ class WriteFileFromTemplateService:
         """Initializes the WriteFileFromTemplateService."""
         pass
 
+    @traced("template")
     def render_and_write_file(
         self,
         template_abs_path_str: str,
@@ -31,5 +31,8 @@ class WorkflowState(TypedDict):
     # Data for goal-manifest.md, managed by manifest_create and manifest_update nodes
     manifest_data: Optional[ManifestData]
 
+    # Commits aider made during the small tweak, read back from git (CommitInfo dicts, oldest first)
+    aider_commits: Optional[list[dict]]
+
     # Cost tracking
     total_aider_cost: Optional[float]  # Cumulative cost of aider runs, typically in USD
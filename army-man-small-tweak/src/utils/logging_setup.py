@@ -1,9 +1,12 @@
 """Utility for configuring the application's logging system."""
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 import logging
 import os
 from pathlib import Path
 import sys
+from typing import Iterator, NamedTuple, Optional
 
 OVERVIEW_LEVEL_NUM = 25  # Positioned between INFO (20) and WARNING (30)
 OVERVIEW_LEVEL_NAME = "OVERVIEW"
@@ -22,23 +25,78 @@ class LowercaseLevelnameFormatter(logging.Formatter):
         record.levelname = record.levelname.lower()
         return super().format(record)
 
-def setup_logging(app_config, log_level=logging.INFO):
-    """Configures logging for the application with console and file outputs."""
 
+class GoalLogTarget(NamedTuple):
+    goal_name: str
+    handlers: list[logging.Handler]
+
+
+# The goal whose files records logged in the current task or thread belong to (batch mode).
+# asyncio tasks and asyncio.to_thread copy it; plain threads must be started in a copied context.
+current_goal_log_target: ContextVar[Optional[GoalLogTarget]] = ContextVar("current_goal_log_target", default=None)
+
+
+class GoalLogRouter(logging.Handler):
+    """Passes each record to the log files of the goal that is current where it was logged."""
+
+    def emit(self, record):
+        goal_log_target = current_goal_log_target.get()
+        if goal_log_target is None:
+            return
+        for handler in goal_log_target.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class GoalNameFilter(logging.Filter):
+    """Adds the current goal's folder name as `goal_name`, so interleaved console lines stay readable."""
+
+    def filter(self, record):
+        goal_log_target = current_goal_log_target.get()
+        record.goal_name = goal_log_target.goal_name if goal_log_target else "-"
+        return True
+
+
+def create_goal_file_handlers(app_config) -> list[logging.Handler]:
+    """Creates the overview and detailed log file handlers in the goal's log folder."""
     goal_root_path = Path(app_config.goal_root_path).resolve()
     log_subdirectory = goal_root_path / app_config.log_subdirectory_name
     os.makedirs(log_subdirectory, exist_ok=True)
 
     overview_log_file_path = str(log_subdirectory / app_config.overview_log_filename)
     detailed_log_file_path = str(log_subdirectory / app_config.detailed_log_filename)
-    
+
     # Spec mentioned: fmt="[%(asctime)s.%(msecs)03d] (%(levelname)s) [%(name)s] %(message)s", datefmt="%H:%M:%S"
     # Adding [%(name)s] to file_formatter as per typical detailed logging.
-    file_formatter = LowercaseLevelnameFormatter(     
+    file_formatter = LowercaseLevelnameFormatter(
         fmt="[%(asctime)s.%(msecs)03d] (%(levelname)s) %(message)s",
         datefmt="%H:%M:%S"
     )
 
+    # Configure Overview File Handler
+    overview_file_handler = logging.FileHandler(overview_log_file_path, mode='a') # Use 'a' for append
+    overview_file_handler.setFormatter(file_formatter)
+    # Set this handler to only capture OVERVIEW level and above (WARNING, ERROR, CRITICAL)
+    overview_file_handler.setLevel(OVERVIEW_LEVEL_NUM)
+
+    # Configure Detailed File Handler
+    detailed_file_handler = logging.FileHandler(detailed_log_file_path, mode='a') # Use 'a' for append
+    detailed_file_handler.setFormatter(file_formatter)
+    # This handler captures DEBUG and above (so DEBUG, INFO, OVERVIEW, WARNING, ERROR, CRITICAL)
+    detailed_file_handler.setLevel(logging.DEBUG)
+
+    return [overview_file_handler, detailed_file_handler]
+
+
+def setup_logging(app_config, log_level=logging.INFO, console_stream=None):
+    """
+    Configures logging for the application with console and file outputs.
+
+    Args:
+        console_stream: Stream for console output; defaults to stdout. The worker
+                        daemon passes stderr because its stdout carries responses.
+    """
+
     console_formatter = LowercaseLevelnameFormatter(
         fmt="%(asctime)s.%(msecs)03d: (%(levelname)s) %(message)s", # Keeping console simpler
         datefmt="%M:%S" # Console uses MM:SS for brevity as per your current code
@@ -48,30 +106,63 @@ def setup_logging(app_config, log_level=logging.INFO):
     root_logger.setLevel(logging.DEBUG) # Set root to lowest level to allow handlers to filter
     
     if root_logger.hasHandlers():
+        # Close file handlers from a previous goal when one process works on several goals
+        for handler in root_logger.handlers:
+            handler.close()
         root_logger.handlers.clear()
         
     # Configure Console Handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler = logging.StreamHandler(console_stream or sys.stdout)
     console_handler.setFormatter(console_formatter)
     console_handler.setLevel(log_level) # Console level controlled by passed-in log_level
     root_logger.addHandler(console_handler)
 
-    # Configure Overview File Handler
-    overview_file_handler = logging.FileHandler(overview_log_file_path, mode='a') # Use 'a' for append
-    overview_file_handler.setFormatter(file_formatter)
-    # Set this handler to only capture OVERVIEW level and above (WARNING, ERROR, CRITICAL)
-    overview_file_handler.setLevel(OVERVIEW_LEVEL_NUM) 
-    root_logger.addHandler(overview_file_handler)
-
-    # Configure Detailed File Handler
-    detailed_file_handler = logging.FileHandler(detailed_log_file_path, mode='a') # Use 'a' for append
-    detailed_file_handler.setFormatter(file_formatter)
-    # This handler captures DEBUG and above (so DEBUG, INFO, OVERVIEW, WARNING, ERROR, CRITICAL)
-    detailed_file_handler.setLevel(logging.DEBUG) 
-    root_logger.addHandler(detailed_file_handler)
+    for file_handler in create_goal_file_handlers(app_config):
+        root_logger.addHandler(file_handler)
 
     # Initial log message to confirm setup and show date
     # Changed to use the newly defined logger.overview for this prominent message
     root_logger.overview(f"\n\n======== Logging initialized. Date: {datetime.now().strftime('%Y-%m-%d')} =========\n\n")
     root_logger.info("Detailed logging started (includes INFO, DEBUG, OVERVIEW, etc.).")
     root_logger.debug("Debug level test message for detailed log.")
+
+
+def setup_batch_logging(log_level=logging.INFO, console_stream=None):
+    """
+    Configures logging for several goals running at once: console output is prefixed with the
+    goal's folder name and file output goes to the goal that is current in `goal_logging`.
+    """
+    console_formatter = LowercaseLevelnameFormatter(
+        fmt="%(asctime)s.%(msecs)03d: (%(levelname)s) [%(goal_name)s] %(message)s",
+        datefmt="%M:%S"
+    )
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.DEBUG)
+    for handler in root_logger.handlers:
+        handler.close()
+    root_logger.handlers.clear()
+
+    console_handler = logging.StreamHandler(console_stream or sys.stdout)
+    console_handler.setFormatter(console_formatter)
+    console_handler.setLevel(log_level)
+    console_handler.addFilter(GoalNameFilter())
+    root_logger.addHandler(console_handler)
+    root_logger.addHandler(GoalLogRouter())
+
+
+@contextmanager
+def goal_logging(app_config) -> Iterator[None]:
+    """
+    Sends records logged inside the block, by this task and what it starts, to the goal's own
+    overview and detailed logs. Requires `setup_batch_logging`.
+    """
+    goal_log_target = GoalLogTarget(Path(app_config.goal_root_path).name, create_goal_file_handlers(app_config))
+    token = current_goal_log_target.set(goal_log_target)
+    try:
+        logging.getLogger().overview(f"\n\n======== Logging initialized. Date: {datetime.now().strftime('%Y-%m-%d')} =========\n\n")
+        yield
+    finally:
+        current_goal_log_target.reset(token)
+        for handler in goal_log_target.handlers:
+            handler.close()
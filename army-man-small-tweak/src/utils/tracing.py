@@ -0,0 +1,137 @@
+"""
+Timing spans for graph nodes and service calls, written per goal as Chrome trace events.
+
+The trace file uses the Chrome "JSON Array Format" with one event per line: an opening '['
+followed by `{...},` lines. The closing ']' is optional in that format, so a run that is
+interrupted, or a rerun appending to the same file, still opens in chrome://tracing or Perfetto.
+"""
+import functools
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class GoalTracer:
+    """Appends complete ("X") trace events for one goal to its trace file."""
+
+    def __init__(self, trace_file_path: str, goal_name: str):
+        """
+        Args:
+            trace_file_path: File the events are appended to; created with the opening '[' if missing.
+            goal_name: Shown as the process name in the trace viewer.
+        """
+        self.trace_file_path = trace_file_path
+        self.process_id = os.getpid()
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(trace_file_path)), exist_ok=True)
+        is_new_file = not os.path.exists(trace_file_path) or os.path.getsize(trace_file_path) == 0
+        self._trace_file = open(trace_file_path, "a", encoding="utf-8")
+        if is_new_file:
+            self._trace_file.write("[\n")
+        self._write_event({"name": "process_name", "ph": "M", "pid": self.process_id, "args": {"name": goal_name}})
+
+    def _write_event(self, event: dict[str, Any]) -> None:
+        with self._lock:
+            self._trace_file.write(json.dumps(event, default=str) + ",\n")
+            self._trace_file.flush()
+
+    def record_span(self, name: str, category: str, start_time_us: int, duration_us: int, args: dict[str, Any]) -> None:
+        self._write_event({
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start_time_us,
+            "dur": duration_us,
+            "pid": self.process_id,
+            "tid": threading.get_ident(),
+            "args": args,
+        })
+
+    def close(self) -> None:
+        with self._lock:
+            self._trace_file.close()
+
+
+# The tracer of the goal being run in the current task or thread; None disables tracing
+current_tracer: ContextVar[Optional[GoalTracer]] = ContextVar("current_tracer", default=None)
+
+
+@contextmanager
+def goal_tracing(app_config) -> Iterator[Optional[GoalTracer]]:
+    """
+    Records the spans of everything run inside the block, including threads started with
+    `asyncio.to_thread`, to the goal's trace file. Does nothing if `trace_filename` is not set.
+    """
+    if not app_config.trace_filename:
+        yield None
+        return
+
+    goal_root_path = Path(app_config.goal_root_path).resolve()
+    trace_file_path = str(goal_root_path / app_config.log_subdirectory_name / app_config.trace_filename)
+    tracer = GoalTracer(trace_file_path, goal_root_path.name)
+    token = current_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        current_tracer.reset(token)
+        tracer.close()
+        logger.debug(f"Trace written to {trace_file_path}")
+
+
+@contextmanager
+def trace_span(name: str, category: str, **args: Any) -> Iterator[dict[str, Any]]:
+    """
+    Times the block as one span. The yielded dict can be filled with more span arguments;
+    an exception escaping the block is recorded as `error`.
+    """
+    tracer = current_tracer.get()
+    if tracer is None:
+        yield args
+        return
+
+    start_time_us = time.time_ns() // 1000
+    start_counter_ns = time.perf_counter_ns()
+    try:
+        yield args
+    except BaseException as e:
+        args["error"] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        duration_us = (time.perf_counter_ns() - start_counter_ns) // 1000
+        tracer.record_span(name, category, start_time_us, duration_us, args)
+
+
+def traced(category: str, name: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Decorator that records each call of a function or coroutine function as a span, named after
+    the function unless `name` is given. The signature is kept, so LangGraph still passes `config`.
+    """
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with trace_span(span_name, category):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with trace_span(span_name, category):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
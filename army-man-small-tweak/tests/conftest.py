@@ -0,0 +1,27 @@
+import pytest
+
+from src.config import AppConfig
+
+# The per-goal fields config.yml would provide; model_construct fills in the remaining defaults
+GOAL_CONFIG_FIELDS = {
+    "task_description_filename": "task-description.md",
+    "manifest_output_filename": "goal-manifest.md",
+    "changelog_output_filename": "changelog.md",
+    "log_subdirectory_name": "logs",
+    "overview_log_filename": "overview.log",
+    "detailed_log_filename": "detailed.log",
+    "manifest_template_filename": "src/templates/goal-manifest.j2",
+}
+
+
+@pytest.fixture
+def make_goal_config():
+    """Builds a goal's AppConfig without reading config.yml; keyword arguments override fields."""
+    def make(goal_root_path, goal_git_path=None, **overrides) -> AppConfig:
+        return AppConfig.model_construct(**{
+            **GOAL_CONFIG_FIELDS,
+            "goal_root_path": str(goal_root_path),
+            "goal_git_path": str(goal_git_path or goal_root_path),
+            **overrides,
+        })
+    return make
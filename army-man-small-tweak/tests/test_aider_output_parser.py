@@ -0,0 +1,88 @@
+from pathlib import Path
+
+from src.services.aider_output_parser import AiderOutputParser, parse_aider_output
+
+# Define the path to the aider output sample file relative to this test file
+TEST_DIR = Path(__file__).parent
+SAMPLE_OUTPUT_FILE = TEST_DIR / "aider_std_out_sample.txt"
+
+
+def test_parses_sample_output():
+    summary = parse_aider_output(SAMPLE_OUTPUT_FILE.read_text(encoding="utf-8"))
+
+    assert summary is not None
+    assert summary.commit_hash == "75f1d17"
+    assert summary.commit_message == "style: Make comments single-line and concise"
+    assert summary.changes_made == ["style: Make comments single-line and concise"]
+    # The path is wrapped across two lines in the sample and the chat "Added" lines are not edits
+    assert summary.files_modified == [
+        "projects\\isometric_2d_prototype\\isometric_2d_prototype\\character_controller\\character_controller_ai.gd"
+    ]
+    assert summary.files_created == []
+    assert summary.errors_reported == []
+    assert summary.total_cost == 0.03
+
+
+def test_uses_highest_session_cost_and_last_commit():
+    parser = AiderOutputParser()
+    for line in [
+        "Tokens: 8.0k sent, 374 received. Cost: $0.01 message, $0.04 session.",
+        "Applied edit to src/app.py",
+        "Commit abc1234 feat: First change",
+        "Tokens: 2.0k sent, 100 received. Cost: $0.01 message, $0.05 session.",
+        "Applied edit to src/app.py",
+        "Creating empty file src/new_module.py",
+        "Applied edit to src/new_module.py",
+        "Commit def5678 feat: Second change",
+    ]:
+        parser.feed(line)
+
+    summary = parser.get_summary()
+
+    assert summary.total_cost == 0.05
+    assert summary.commit_hash == "def5678"
+    assert summary.changes_made == ["feat: First change", "feat: Second change"]
+    assert summary.files_modified == ["src/app.py"]
+    assert summary.files_created == ["src/new_module.py"]
+
+
+def test_run_without_commit_is_classified():
+    summary = parse_aider_output(
+        "The LLM did not conform to the edit format.\n"
+        "Tokens: 1.0k sent, 50 received. Cost: $0.00 message, $0.00 session.\n"
+    )
+
+    assert summary is not None
+    assert summary.commit_hash is None
+    assert summary.errors_reported == ["The LLM did not conform to the edit format."]
+
+
+def test_unclassifiable_output_returns_none():
+    assert parse_aider_output("", "litellm.APIConnectionError: connection refused") is None
+
+
+def test_line_after_wrap_width_edit_is_not_joined_to_the_path():
+    long_path = "src/" + "a" * 56 + ".py"
+    applied_edit_line = f"Applied edit to {long_path}"
+    assert len(applied_edit_line) == 79
+
+    summary = parse_aider_output(
+        f"{applied_edit_line}\n"
+        "Commit abc1234 feat: x\n"
+        "Tokens: 1.0k sent, 50 received. Cost: $0.01 message, $0.01 session.\n"
+    )
+
+    assert summary.files_modified == [long_path]
+    assert summary.commit_hash == "abc1234"
+
+
+def test_wrapped_path_is_joined():
+    long_path = "src/" + "b" * 70 + "/module.py"
+    applied_edit_line = f"Applied edit to {long_path}"
+
+    summary = parse_aider_output(
+        f"{applied_edit_line[:79]}\n{applied_edit_line[79:]}\n"
+        "Commit abc1234 feat: x\n"
+    )
+
+    assert summary.files_modified == [long_path]
@@ -18,7 +18,7 @@ logger = logging.getLogger(__name__)
 TEST_DIR = Path(__file__).parent
 SAMPLE_OUTPUT_FILE = TEST_DIR / "aider_std_out_sample.txt"
 
-def test_get_aider_summary_from_sample_output(
+async def test_get_aider_summary_from_sample_output(
     app_config: AppConfig, 
     llm_prompt_service: LlmPromptService
 ):
@@ -44,8 +44,7 @@ def test_get_aider_summary_from_sample_output(
     aider_service = AiderService(app_config=app_config, llm_prompt_service=llm_prompt_service)
 
     # 3. ACT: Call the method under test
-    # AiderService.get_summary internally uses asyncio.run, so the call is blocking.
-    actual_summary = aider_service.get_summary(execution_result)
+    actual_summary = await aider_service.get_summary(execution_result)
 
     logger.info(actual_summary.model_dump())
 
@@ -99,7 +98,7 @@ if __name__ == "__main__":
 
     # Execute the LlmPromptService method tests
     try:
-        test_get_aider_summary_from_sample_output(app_config, llm_service)
+        asyncio.run(test_get_aider_summary_from_sample_output(app_config, llm_service))
     except Exception as e:
         main_logger.error(f"An error occurred while running the async test function: {e}", exc_info=True)
 
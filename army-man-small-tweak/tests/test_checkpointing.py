@@ -0,0 +1,120 @@
+import asyncio
+import subprocess
+
+import aiosqlite
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from langgraph.graph import END, StateGraph
+
+from src.checkpointing import ainvoke_with_checkpoints, get_checkpoint_database_path, get_checkpoint_thread_id
+from src.graph_builder import RoutingLogic
+from src.runner import create_initial_state
+from src.state import WorkflowState
+
+NODE_NAMES = [
+    "initialize_workflow",
+    "validate_inputs",
+    "manifest_create_node",
+    "execute_small_tweak",
+    "manifest_update_node",
+    "error_path",
+    "success_path",
+]
+
+
+def _build_stub_graph(node_calls: list[str], failing_nodes: set[str], task_paths_seen: list[str]) -> StateGraph:
+    def make_node(node_name):
+        def node(state: WorkflowState) -> dict:
+            node_calls.append(node_name)
+            task_paths_seen.append(state.get("task_description_path"))
+            if node_name in failing_nodes:
+                return {"current_step_name": node_name, "error_message": f"{node_name} failed"}
+            return {"current_step_name": node_name}
+        return node
+
+    graph_builder = StateGraph(WorkflowState)
+    for node_name in NODE_NAMES:
+        graph_builder.add_node(node_name, make_node(node_name))
+    routing = RoutingLogic()
+    graph_builder.set_entry_point("initialize_workflow")
+    graph_builder.add_conditional_edges("initialize_workflow", routing.route_after_initialization)
+    graph_builder.add_conditional_edges("validate_inputs", routing.route_after_validation)
+    graph_builder.add_conditional_edges("manifest_create_node", routing.route_after_manifest_generation)
+    graph_builder.add_conditional_edges("execute_small_tweak", routing.route_after_small_tweak)
+    graph_builder.add_conditional_edges("manifest_update_node", routing.route_after_manifest_update)
+    graph_builder.add_edge("error_path", END)
+    graph_builder.add_edge("success_path", END)
+    return graph_builder
+
+
+def _run_goal(database_path, app_config, failing_nodes=frozenset(), task_paths_seen=None) -> list[str]:
+    node_calls: list[str] = []
+    task_paths_seen = [] if task_paths_seen is None else task_paths_seen
+
+    async def run():
+        async with aiosqlite.connect(database_path) as connection:
+            checkpointer = AsyncSqliteSaver(connection)
+            await checkpointer.setup()
+            app_graph = _build_stub_graph(node_calls, set(failing_nodes), task_paths_seen).compile(checkpointer=checkpointer)
+            await ainvoke_with_checkpoints(
+                app_graph, create_initial_state(), {"configurable": {"app_config": app_config}}, "ai-goals/goal"
+            )
+
+    asyncio.run(run())
+    return node_calls
+
+
+def test_resumes_at_failed_node_and_starts_fresh_after_success(tmp_path, make_goal_config):
+    goal_root_path = tmp_path / "ai-goals" / "goal"
+    goal_root_path.mkdir(parents=True)
+    database_path = str(tmp_path / "checkpoints.sqlite")
+    app_config = make_goal_config(goal_root_path, tmp_path)
+
+    assert _run_goal(database_path, app_config, {"execute_small_tweak"}) == NODE_NAMES[:5] + ["error_path"]
+    assert _run_goal(database_path, app_config) == ["execute_small_tweak", "manifest_update_node", "success_path"]
+    assert _run_goal(database_path, app_config) == NODE_NAMES[:5] + ["success_path"]
+
+
+def test_initialization_failure_restarts(tmp_path, make_goal_config):
+    goal_root_path = tmp_path / "ai-goals" / "goal"
+    goal_root_path.mkdir(parents=True)
+    database_path = str(tmp_path / "checkpoints.sqlite")
+    app_config = make_goal_config(goal_root_path, tmp_path)
+
+    assert _run_goal(database_path, app_config, {"initialize_workflow"}) == ["initialize_workflow", "error_path"]
+    assert _run_goal(database_path, app_config) == NODE_NAMES[:5] + ["success_path"]
+
+
+def test_resume_in_another_checkout_uses_its_paths(tmp_path, make_goal_config):
+    database_path = str(tmp_path / "checkpoints.sqlite")
+    first_checkout, second_checkout = tmp_path / "worktree-1", tmp_path / "worktree-2"
+    for checkout in (first_checkout, second_checkout):
+        (checkout / "ai-goals" / "goal").mkdir(parents=True)
+
+    _run_goal(database_path, make_goal_config(first_checkout / "ai-goals" / "goal", first_checkout), {"execute_small_tweak"})
+    task_paths_seen: list[str] = []
+    resumed_node_calls = _run_goal(
+        database_path, make_goal_config(second_checkout / "ai-goals" / "goal", second_checkout), task_paths_seen=task_paths_seen
+    )
+
+    assert resumed_node_calls[0] == "execute_small_tweak"
+    assert task_paths_seen[0] == str((second_checkout / "ai-goals" / "goal" / "task-description.md").resolve())
+
+
+def test_worktrees_share_the_goal_thread_and_database(tmp_path, make_goal_config):
+    main_checkout = tmp_path / "repo"
+    (main_checkout / "ai-goals" / "goal").mkdir(parents=True)
+    (main_checkout / "ai-goals" / "goal" / "task-description.md").write_text("Task\n")
+    git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+    subprocess.run(git + ["init", "-q"], cwd=main_checkout, check=True)
+    subprocess.run(git + ["add", "-A"], cwd=main_checkout, check=True)
+    subprocess.run(git + ["commit", "-q", "-m", "init"], cwd=main_checkout, check=True)
+    worktree = tmp_path / "worktree"
+    subprocess.run(git + ["worktree", "add", "-q", str(worktree)], cwd=main_checkout, check=True)
+
+    main_config = make_goal_config(main_checkout / "ai-goals" / "goal", main_checkout)
+    worktree_config = make_goal_config(worktree / "ai-goals" / "goal", worktree)
+
+    assert get_checkpoint_thread_id(main_config) == get_checkpoint_thread_id(worktree_config) == "ai-goals/goal"
+    database_path = get_checkpoint_database_path(worktree_config)
+    assert database_path == get_checkpoint_database_path(main_config)
+    assert database_path.startswith(str((main_checkout / ".git").resolve()))
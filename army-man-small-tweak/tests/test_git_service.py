@@ -1,4 +1,5 @@
 import logging
+import subprocess
 import sys
 from dotenv import load_dotenv
 
@@ -48,6 +49,43 @@ def run_git_service_tests(app_config: AppConfig, git_service: GitService):
     logger.overview(f"*** IMPORTANT: This test interacted with the Git repository at '{git_service.repo_path}'. ***")
     logger.overview("*** Please MANUALLY VERIFY the console output for correctness. ***")
 
+def _git(repo_path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo_path, check=True, capture_output=True)
+
+def test_get_commits_since(tmp_path):
+    """
+    Commits made after a recorded HEAD come back oldest first with per-file line stats.
+    """
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "army@example.com")
+    _git(tmp_path, "config", "user.name", "Army Man")
+    git_service = GitService(repo_path=str(tmp_path))
+
+    assert git_service.get_last_commit_hash() is None
+    (tmp_path / "a.txt").write_text("one\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "Initial commit")
+    before_hash = git_service.get_last_commit_hash()
+
+    assert git_service.get_commits_since(before_hash) == []
+
+    (tmp_path / "a.txt").write_text("one\ntwo\nthree\n")
+    _git(tmp_path, "commit", "-q", "-am", "feat: Extend a")
+    (tmp_path / "b.txt").write_text("b\n")
+    (tmp_path / "a.txt").write_text("one\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "fix: Add b and trim a")
+
+    commits = git_service.get_commits_since(before_hash)
+
+    assert [commit.message for commit in commits] == ["feat: Extend a", "fix: Add b and trim a"]
+    assert commits[-1].commit_hash == git_service.get_last_commit_hash()
+    assert [(f.path, f.lines_added, f.lines_deleted) for f in commits[0].files] == [("a.txt", 2, 0)]
+    assert sorted((f.path, f.lines_added, f.lines_deleted) for f in commits[1].files) == [("a.txt", 0, 2), ("b.txt", 1, 0)]
+    assert commits[1].format_stats() == "2 file(s), +1 -2"
+    # Without a starting point every commit counts as new
+    assert len(git_service.get_commits_since(None)) == 3
+
 if __name__ == "__main__":
     # Load environment variables from .env file, if present
     load_dotenv()
@@ -0,0 +1,52 @@
+import asyncio
+import logging
+import threading
+
+from src.utils.logging_setup import goal_logging, setup_batch_logging
+
+
+def test_concurrent_goals_log_to_their_own_files(tmp_path, make_goal_config):
+    setup_batch_logging()
+    logger = logging.getLogger("test_goal_logging")
+
+    async def run_goal(goal_name):
+        with goal_logging(make_goal_config(tmp_path / goal_name)):
+            logger.info(f"{goal_name} started")
+            await asyncio.sleep(0.01)
+            await asyncio.to_thread(logger.info, f"{goal_name} worker thread")
+            logger.overview(f"{goal_name} finished")
+
+    async def run_goals():
+        await asyncio.gather(run_goal("goal-a"), run_goal("goal-b"))
+
+    try:
+        asyncio.run(run_goals())
+    finally:
+        logging.getLogger().handlers.clear()
+
+    for goal_name, other_goal_name in (("goal-a", "goal-b"), ("goal-b", "goal-a")):
+        detailed_log = (tmp_path / goal_name / "logs" / "detailed.log").read_text()
+        overview_log = (tmp_path / goal_name / "logs" / "overview.log").read_text()
+        assert f"{goal_name} started" in detailed_log
+        assert f"{goal_name} worker thread" in detailed_log
+        assert f"{goal_name} finished" in overview_log
+        assert f"{goal_name} started" not in overview_log
+        assert other_goal_name not in detailed_log
+
+
+def test_records_outside_a_goal_are_not_written_to_files(tmp_path, make_goal_config):
+    setup_batch_logging()
+    logger = logging.getLogger("test_goal_logging")
+
+    try:
+        with goal_logging(make_goal_config(tmp_path / "goal-a")):
+            thread = threading.Thread(target=logger.info, args=("unrouted thread",))
+            thread.start()
+            thread.join()
+        logger.info("after the goal")
+    finally:
+        logging.getLogger().handlers.clear()
+
+    detailed_log = (tmp_path / "goal-a" / "logs" / "detailed.log").read_text()
+    assert "unrouted thread" not in detailed_log
+    assert "after the goal" not in detailed_log
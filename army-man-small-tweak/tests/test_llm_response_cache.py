@@ -0,0 +1,34 @@
+from src.services.llm_response_cache import LlmResponseCache
+
+
+def test_hit_after_put_and_key_ignores_whitespace(tmp_path):
+    cache = LlmResponseCache(str(tmp_path / "cache.sqlite"), ttl_seconds=60, max_bytes=1024)
+    schema = {"title": "Example"}
+    key = LlmResponseCache.make_key("model-a", [{"role": "user", "content": "Hello"}], schema, None)
+
+    assert cache.get(key) is None
+    cache.put(key, "model-a", '{"value": 1}')
+
+    same_key = LlmResponseCache.make_key("model-a", [{"role": "USER", "content": " Hello\n"}], schema, {})
+    assert cache.get(same_key) == '{"value": 1}'
+    assert LlmResponseCache.make_key("model-b", [{"role": "user", "content": "Hello"}], schema, None) != key
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_expired_entries_miss(tmp_path):
+    cache = LlmResponseCache(str(tmp_path / "cache.sqlite"), ttl_seconds=-1, max_bytes=1024)
+    cache.put("key", "model-a", "{}")
+
+    assert cache.get("key") is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = LlmResponseCache(str(tmp_path / "cache.sqlite"), ttl_seconds=60, max_bytes=20)
+    cache.put("first", "model-a", "x" * 8)
+    cache.put("second", "model-a", "y" * 8)
+    cache.get("first")
+    cache.put("third", "model-a", "z" * 8)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == "x" * 8
+    assert cache.get("third") == "z" * 8
@@ -0,0 +1,31 @@
+import httpx
+from pydantic_ai.exceptions import ModelHTTPError
+
+from src.services.llm_retry import compute_retry_delay, get_retry_after_seconds, is_retryable_error
+
+
+def test_classifies_errors():
+    assert is_retryable_error(ModelHTTPError(429, "gemini"))
+    assert is_retryable_error(ModelHTTPError(503, "gemini"))
+    assert is_retryable_error(httpx.ReadTimeout("timed out"))
+    assert not is_retryable_error(ModelHTTPError(401, "gemini"))
+    assert not is_retryable_error(ModelHTTPError(400, "gemini"))
+    assert not is_retryable_error(ValueError("schema"))
+
+
+def test_honors_gemini_retry_delay():
+    error = ModelHTTPError(429, "gemini", '{"error": {"details": [{"retryDelay": "17s"}]}}')
+
+    assert get_retry_after_seconds(error) == 17.0
+    assert 17.0 <= compute_retry_delay(1, 1.0, 30.0, get_retry_after_seconds(error)) <= 18.0
+
+
+def test_backoff_is_capped():
+    for attempt in range(1, 10):
+        assert 0 <= compute_retry_delay(attempt, 1.0, 4.0) <= 4.0
+
+
+def test_provider_delay_is_capped():
+    error = ModelHTTPError(429, "gemini", '{"error": {"details": [{"retryDelay": "3600s"}]}}')
+
+    assert compute_retry_delay(1, 1.0, 30.0, get_retry_after_seconds(error)) == 30.0
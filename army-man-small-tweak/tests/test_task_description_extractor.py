@@ -0,0 +1,40 @@
+import json
+from pathlib import Path
+
+from src.services.task_description_extractor import extract_goal_title, extract_manifest_config
+
+# A goal folder written by the Secretary: task-description.md without its '## ' heading, plus task.json
+SECRETARY_GOAL_PATH = Path(__file__).parent / "secretary_goal_sample" / "update-stuff-title"
+
+
+def test_secretary_goal_folder_needs_no_llm():
+    task_description = (SECRETARY_GOAL_PATH / "task-description.md").read_text(encoding="utf-8")
+
+    manifest_config = extract_manifest_config(task_description, str(SECRETARY_GOAL_PATH), "task.json")
+
+    assert manifest_config is not None
+    assert manifest_config.goal_title == "Update stuff title"
+    assert manifest_config.small_tweak_file_path == "army-secretary/src/main.py"
+    assert manifest_config.task_description == task_description.strip()
+
+
+def test_title_falls_back_to_heading_then_folder_name(tmp_path):
+    goal_path = tmp_path / "rename-the-title"
+    goal_path.mkdir()
+    (goal_path / "task.json").write_text(json.dumps({"small_tweak_file_path": "src/app.py"}), encoding="utf-8")
+
+    assert extract_manifest_config("# Rename it\n\nIn `src/app.py`.", str(goal_path), "task.json").goal_title == "Rename it"
+    assert extract_manifest_config("In `src/app.py`.", str(goal_path), "task.json").goal_title == "rename the title"
+    assert extract_goal_title("In `src/app.py`.", None) is None
+
+
+def test_missing_or_incomplete_sidecar_is_left_to_the_llm(tmp_path):
+    task_description = "# Move code\n\nMove code from `a.py` to `b.py`"
+    assert extract_manifest_config(task_description, str(tmp_path), "task.json") is None
+    assert extract_manifest_config(task_description, str(tmp_path), None) is None
+
+    (tmp_path / "task.json").write_text(json.dumps({"goal_title": "No target file"}), encoding="utf-8")
+    assert extract_manifest_config(task_description, str(tmp_path), "task.json") is None
+
+    (tmp_path / "task.json").write_text("{not json", encoding="utf-8")
+    assert extract_manifest_config(task_description, str(tmp_path), "task.json") is None
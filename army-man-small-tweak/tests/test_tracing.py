@@ -0,0 +1,57 @@
+import asyncio
+import json
+
+import pytest
+
+from src.utils.tracing import goal_tracing, trace_span, traced
+
+
+def _read_trace_events(trace_file_path):
+    # The closing ']' is optional in the Chrome trace array format, so the file never has one
+    return json.loads(trace_file_path.read_text().rstrip().rstrip(",") + "]")
+
+
+def test_records_spans_for_sync_async_and_failing_calls(tmp_path, make_goal_config):
+    @traced("node", "sync_node")
+    def sync_node(state, config):
+        return state
+
+    @traced("llm")
+    async def summarize():
+        await asyncio.to_thread(lambda: None)
+
+    with goal_tracing(make_goal_config(tmp_path)):
+        sync_node({}, config=None)
+        asyncio.run(summarize())
+        with pytest.raises(ValueError):
+            with trace_span("git commit", "git"):
+                raise ValueError("nothing to commit")
+
+    events = _read_trace_events(tmp_path / "logs" / "trace.json")
+    spans = {event["name"]: event for event in events if event["ph"] == "X"}
+    assert events[0]["ph"] == "M" and events[0]["args"]["name"] == tmp_path.name
+    assert spans["sync_node"]["cat"] == "node"
+    assert spans["test_records_spans_for_sync_async_and_failing_calls.<locals>.summarize"]["cat"] == "llm"
+    assert spans["git commit"]["args"]["error"] == "ValueError: nothing to commit"
+    assert all(span["dur"] >= 0 for span in spans.values())
+
+
+def test_reruns_append_and_spans_outside_a_goal_are_dropped(tmp_path, make_goal_config):
+    with trace_span("before", "git"):
+        pass
+    for _ in range(2):
+        with goal_tracing(make_goal_config(tmp_path)):
+            with trace_span("git status", "git"):
+                pass
+
+    events = _read_trace_events(tmp_path / "logs" / "trace.json")
+    assert [event["name"] for event in events if event["ph"] == "X"] == ["git status", "git status"]
+
+
+def test_disabled_when_no_trace_filename(tmp_path, make_goal_config):
+    with goal_tracing(make_goal_config(tmp_path, trace_filename=None)) as tracer:
+        with trace_span("git status", "git"):
+            pass
+
+    assert tracer is None
+    assert not (tmp_path / "logs").exists()
@@ -0,0 +1,88 @@
+"""
+Compares the streaming backlog parser with the previous whole-file approach
+(re.split plus content.find/count for line numbers) on a synthetic backlog.
+
+Usage (from the army-secretary folder):
+    uv run .\\benchmarks\\backlog_parser_benchmark.py --tasks 100000
+"""
+import argparse
+import os
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+
+PROJECT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIRECTORY)
+sys.path.insert(0, os.path.join(PROJECT_DIRECTORY, "src"))
+
+from services.backlog_parser import parse_backlog_file  # noqa: E402
+
+
+def write_synthetic_backlog(backlog_filepath: str, task_count: int) -> None:
+    with open(backlog_filepath, "w", encoding="utf-8") as f:
+        f.write("Notes before the first task.\n\n")
+        for task_number in range(task_count):
+            f.write(f"## Update widget {task_number} title\n\n")
+            f.write(f"Change the label in `src/widgets/widget_{task_number}.py` to read 'Widget {task_number}'.\n")
+            f.write("Keep the existing tests passing.\n\n")
+
+
+def parse_whole_file(backlog_filepath: str) -> int:
+    with open(backlog_filepath, encoding="utf-8") as f:
+        content = f.read()
+    section_count = 0
+    for section_content in re.split(r"(?=^## )", content, flags=re.MULTILINE):
+        section_content = section_content.strip()
+        if not section_content:
+            continue
+        content.count("\n", 0, content.find(section_content))
+        section_count += 1
+    return section_count
+
+
+def parse_streaming(backlog_filepath: str) -> int:
+    return sum(1 for _ in parse_backlog_file(backlog_filepath))
+
+
+def measure(parse_function, backlog_filepath: str) -> tuple[int, float, float]:
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    section_count = parse_function(backlog_filepath)
+    elapsed_seconds = time.perf_counter() - start_time
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return section_count, elapsed_seconds, peak_bytes / (1024 * 1024)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark backlog parsing.")
+    parser.add_argument("--tasks", type=int, default=100_000, help="Number of tasks in the synthetic backlog.")
+    parser.add_argument(
+        "--legacy_tasks", type=int, default=10_000,
+        help="Number of tasks for the whole-file approach, which is quadratic. 0 skips it."
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        for label, parse_function, task_count in [
+            ("whole file", parse_whole_file, args.legacy_tasks),
+            ("streaming", parse_streaming, args.legacy_tasks),
+            ("streaming", parse_streaming, args.tasks),
+        ]:
+            if task_count <= 0:
+                continue
+            backlog_filepath = os.path.join(temporary_directory, f"BACKLOG_{task_count}.md")
+            if not os.path.exists(backlog_filepath):
+                write_synthetic_backlog(backlog_filepath, task_count)
+            file_size_mb = os.path.getsize(backlog_filepath) / (1024 * 1024)
+            section_count, elapsed_seconds, peak_mb = measure(parse_function, backlog_filepath)
+            print(
+                f"{label:>10}: {task_count:>7} tasks ({file_size_mb:.1f} MB) -> {section_count} sections "
+                f"in {elapsed_seconds:.2f}s, peak memory {peak_mb:.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -30,6 +30,20 @@ class AppConfig:
     default_log_directory: str
     default_log_filename: str
     new_goal_folders_filename: str
+    max_concurrent_llm_calls: int
+    folder_name_batch_size: int
+    use_local_slugs: bool
+    folder_name_cache_max_entries: int
+    backlog_intake_mode: str
+    task_sidecar_filename: Optional[str]
+    llm_response_cache_enabled: bool
+    llm_response_cache_filename: str
+    llm_response_cache_ttl_hours: float
+    llm_response_cache_max_bytes: int
+    llm_max_retries: int
+    llm_retry_base_delay_seconds: float
+    llm_retry_max_delay_seconds: float
+    llm_structured_output_mode: str
 
     def __init__(self, command_line_git_path: Optional[str] = None) -> None:
         """
@@ -63,12 +77,34 @@ class AppConfig:
         self.default_log_directory = yaml_config.get("default_log_directory") 
         self.default_log_filename = yaml_config.get("default_log_filename") 
         self.new_goal_folders_filename = yaml_config.get("new_goal_folders_filename")
+        self.max_concurrent_llm_calls = yaml_config.get("max_concurrent_llm_calls", 1)
+        self.folder_name_batch_size = yaml_config.get("folder_name_batch_size", 0)
+        self.use_local_slugs = yaml_config.get("use_local_slugs", True)
+        self.folder_name_cache_max_entries = yaml_config.get("folder_name_cache_max_entries", 0)
+        self.backlog_intake_mode = yaml_config.get("backlog_intake_mode", "consume")
+        self.task_sidecar_filename = yaml_config.get("task_sidecar_filename")
+        self.llm_response_cache_enabled = yaml_config.get("llm_response_cache_enabled", False)
+        self.llm_response_cache_filename = yaml_config.get("llm_response_cache_filename", "llm-response-cache.sqlite")
+        self.llm_response_cache_ttl_hours = yaml_config.get("llm_response_cache_ttl_hours", 168)
+        self.llm_response_cache_max_bytes = yaml_config.get("llm_response_cache_max_bytes", 50 * 1024 * 1024)
+        self.llm_max_retries = yaml_config.get("llm_max_retries", 3)
+        self.llm_retry_base_delay_seconds = yaml_config.get("llm_retry_base_delay_seconds", 1.0)
+        self.llm_retry_max_delay_seconds = yaml_config.get("llm_retry_max_delay_seconds", 30.0)
+        self.llm_structured_output_mode = yaml_config.get("llm_structured_output_mode", "tool")
 
         load_dotenv()
         self.gemini_api_key = os.getenv("GEMINI_API_KEY")
 
         self.validate()
 
+    @property
+    def llm_response_cache_path(self) -> str:
+        """
+        Full path to the LLM response cache database, kept in the Secretary's own directory.
+        """
+        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        return os.path.join(base_dir, self.llm_response_cache_filename)
+
     @property
     def backlog_file_path(self) -> str:
         """
@@ -122,6 +158,34 @@ class AppConfig:
             raise ValueError("default_llm_model_name must be a non-empty string in config.yaml or defaults will apply.")
         if not self.task_description_filename or not isinstance(self.task_description_filename, str):
             raise ValueError("task_description_filename must be a non-empty string in config.yaml or use the default value.")
+        if not isinstance(self.max_concurrent_llm_calls, int) or self.max_concurrent_llm_calls < 1:
+            raise ValueError("max_concurrent_llm_calls must be a positive integer in config.yaml.")
+        if not isinstance(self.folder_name_batch_size, int) or self.folder_name_batch_size < 0:
+            raise ValueError("folder_name_batch_size must be 0 (disabled) or a positive integer in config.yaml.")
+        if not isinstance(self.use_local_slugs, bool):
+            raise ValueError("use_local_slugs must be true or false in config.yaml.")
+        if not isinstance(self.folder_name_cache_max_entries, int) or self.folder_name_cache_max_entries < 0:
+            raise ValueError("folder_name_cache_max_entries must be 0 (disabled) or a positive integer in config.yaml.")
+        if self.backlog_intake_mode not in ("consume", "incremental"):
+            raise ValueError("backlog_intake_mode must be 'consume' or 'incremental' in config.yaml.")
+        if self.task_sidecar_filename is not None and not isinstance(self.task_sidecar_filename, str):
+            raise ValueError("task_sidecar_filename must be a filename in config.yaml, or left unset to disable sidecars.")
+        if not isinstance(self.llm_response_cache_enabled, bool):
+            raise ValueError("llm_response_cache_enabled must be true or false in config.yaml.")
+        if not self.llm_response_cache_filename or not isinstance(self.llm_response_cache_filename, str):
+            raise ValueError("llm_response_cache_filename must be a non-empty string in config.yaml.")
+        if not isinstance(self.llm_response_cache_ttl_hours, (int, float)) or self.llm_response_cache_ttl_hours <= 0:
+            raise ValueError("llm_response_cache_ttl_hours must be a positive number in config.yaml.")
+        if not isinstance(self.llm_response_cache_max_bytes, int) or self.llm_response_cache_max_bytes <= 0:
+            raise ValueError("llm_response_cache_max_bytes must be a positive integer in config.yaml.")
+        if not isinstance(self.llm_max_retries, int) or self.llm_max_retries < 0:
+            raise ValueError("llm_max_retries must be 0 (no retries) or a positive integer in config.yaml.")
+        if not isinstance(self.llm_retry_base_delay_seconds, (int, float)) or self.llm_retry_base_delay_seconds < 0:
+            raise ValueError("llm_retry_base_delay_seconds must be a non-negative number in config.yaml.")
+        if not isinstance(self.llm_retry_max_delay_seconds, (int, float)) or self.llm_retry_max_delay_seconds < self.llm_retry_base_delay_seconds:
+            raise ValueError("llm_retry_max_delay_seconds must be a number no smaller than llm_retry_base_delay_seconds in config.yaml.")
+        if self.llm_structured_output_mode not in ("prompt", "tool"):
+            raise ValueError("llm_structured_output_mode must be 'prompt' or 'tool' in config.yaml.")
         if not self.default_log_directory or not isinstance(self.default_log_directory, str):
             raise ValueError("default_log_directory must be a non-empty string in config.yaml or use the default value 'logs'.")
         if not self.default_log_filename or not isinstance(self.default_log_filename, str):
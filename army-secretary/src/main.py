@@ -10,8 +10,12 @@ to catch and log any unhandled exceptions during execution.
 
 import argparse  # Added for command-line argument parsing
 import asyncio
+import functools
+import json
 import logging
+import os
 from datetime import datetime
+from typing import Optional
 
 # Project-specific imports
 from config import AppConfig
@@ -28,6 +32,11 @@ parser.add_argument(
     help="Override the project_git_path from config.yaml with the provided path.",
     required=False
 )
+parser.add_argument(
+    "--stream_goals",
+    action="store_true",
+    help="Commit each goal folder as soon as it is created and announce it as a JSON line on stdout, so the General can start on it immediately.",
+)
 args = parser.parse_args()
 
 # 2. Initialize AppConfig first, passing the command line argument if provided
@@ -47,12 +56,26 @@ if args.root_git_path:
     logger.info(f"Overriding project_git_path with command line argument: {args.root_git_path}")
 logger.debug("Debug level test message for detailed log from main.py.")
 
+def _publish_goal_folder(git_service: GitService, goal_folder_path: str) -> None:
+    """
+    Commits a single new goal folder and announces it on stdout as a JSON line.
+    The commit comes first so a worktree created from HEAD already contains the goal.
+    Logging goes to stderr, so stdout only carries these announcements.
+    """
+    commit_message = f"AI Army Secretary - Added goal {os.path.basename(goal_folder_path)}"
+    if not git_service.commit_paths([goal_folder_path], commit_message):
+        logger.warning(f"Failed to commit goal folder {goal_folder_path}; not announcing it.")
+        return
+    print(json.dumps({"goal_folder": goal_folder_path}), flush=True)
+    logger.info(f"Published goal folder: {goal_folder_path}")
+
 async def run() -> None:
     """
     Main asynchronous function to run the PoC 8 backlog processing.
     Initializes services and processes the backlog file.
     """
     logger.info("Starting PoC 8: Backlog to Goals Processor.")
+    llm_service: Optional[LlmPromptService] = None
     try:
 
         # Get paths from AppConfig
@@ -66,10 +89,17 @@ async def run() -> None:
         logger.info("LlmPromptService initialized.")
 
         # 3. Initialize BacklogProcessor
+        on_goal_created = None
+        if args.stream_goals:
+            stream_git_service = GitService(repo_path=app_config.project_git_path)
+            on_goal_created = functools.partial(_publish_goal_folder, stream_git_service)
+            logger.info("Streaming mode enabled: each goal folder is committed and published as soon as it is created.")
+
         backlog_processor = BacklogProcessor(
             llm_service=llm_service,
             output_dir=goals_output_directory,
-            app_config=app_config 
+            app_config=app_config,
+            on_goal_created=on_goal_created
         )
         logger.info(f"BacklogProcessor initialized. Output will be in: {goals_output_directory}")
 
@@ -100,6 +130,9 @@ async def run() -> None:
         logger.critical(f"Configuration error: {ve}. Please check your .env, config.yaml files, or command line arguments. Exiting.", exc_info=False)
     except Exception:
         logger.error("An unhandled error occurred during PoC 8 execution:", exc_info=True)
+    finally:
+        if llm_service:
+            await llm_service.aclose()
 
 if __name__ == "__main__":
     asyncio.run(run())
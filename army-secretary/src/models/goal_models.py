@@ -22,3 +22,47 @@ class SanitizedGoalInfo(BaseModel):
                     "and special characters removed or replaced appropriately. "
                     "Example: 'implement-user-login-feature'."
     )
+
+
+class SanitizedGoalInfoBatchItem(SanitizedGoalInfo):
+    """
+    A folder name for one task of a batched request.
+
+    Attributes:
+        task_index (int): The index the task was given in the prompt.
+    """
+    task_index: int = Field(
+        ...,
+        description="The index of the task this folder name belongs to, exactly as given in the prompt."
+    )
+
+
+class SanitizedGoalInfoBatch(BaseModel):
+    """
+    Pydantic model to structure the output from the LLM
+    when generating folder names for several goals in one request.
+
+    Attributes:
+        goals (list[SanitizedGoalInfoBatchItem]): One entry per task in the prompt.
+    """
+    goals: list[SanitizedGoalInfoBatchItem] = Field(
+        ...,
+        description="One entry per task in the prompt, each with its task_index and folder_name."
+    )
+
+
+class GoalTaskRecord(BaseModel):
+    """
+    Structured description of one goal, written next to the task description as a sidecar
+    so Army Man can build its manifest without asking an LLM to extract the same fields.
+
+    Attributes:
+        goal_title (str): The task title from the backlog.
+        task_description (str): The full task description from the backlog.
+        small_tweak_file_path (str): The target file, relative to the project's git root.
+        folder_name (str): The goal folder's name.
+    """
+    goal_title: str
+    task_description: str
+    small_tweak_file_path: str
+    folder_name: str
@@ -5,15 +5,10 @@ This module centralizes the definition of system and user prompts used in
 various parts of the application, particularly for generating sanitized
 folder names from task descriptions.
 """
-from models.goal_models import SanitizedGoalInfo
-
-SANITIZE_FOLDER_NAME_SYSTEM_PROMPT: str = f"""
+SANITIZE_FOLDER_NAME_SYSTEM_PROMPT: str = """
     You are an expert assistant that generates filesystem-friendly folder names from task descriptions.
 
     Your goal is to extract specific pieces of information and structure them according to the provided JSON schema.
-    The JSON schema to use for your response is:
-    {SanitizedGoalInfo.model_json_schema()}
-    Ensure your output is a valid JSON object that conforms to this schema.
     From the user's task title and description, extract:
     1.  `folder_name`: A filesystem-friendly folder name derived from the task title or description.
 """
@@ -35,3 +30,34 @@ def get_sanitize_folder_name_user_prompt(task_description: str, task_title: str)
         Task Description:
         {task_description}
     """
+
+SANITIZE_FOLDER_NAMES_BATCH_SYSTEM_PROMPT: str = """
+    You are an expert assistant that generates filesystem-friendly folder names from task descriptions.
+
+    You will receive several tasks, each introduced by its task index.
+    Your goal is to extract specific pieces of information and structure them according to the provided JSON schema.
+    For every task, return exactly one entry with:
+    1.  `task_index`: The index of the task exactly as given.
+    2.  `folder_name`: A filesystem-friendly folder name derived from the task title or description.
+"""
+
+def get_sanitize_folder_names_batch_user_prompt(tasks: list[tuple[int, str, str]]) -> str:
+    """
+    Generates the user prompt content for requesting sanitized folder names for several tasks at once.
+
+    Args:
+        tasks: (task_index, task_title, task_description) for every task in the batch.
+
+    Returns:
+        A string formatted as the user prompt to be sent to the LLM.
+    """
+    task_blocks: list[str] = []
+    for task_index, task_title, task_description in tasks:
+        task_blocks.append(f"""
+        Task Index: {task_index}
+        Task Title: '{task_title}'
+
+        Task Description:
+        {task_description}
+        """)
+    return "\n        ---\n".join(task_blocks)
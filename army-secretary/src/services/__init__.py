@@ -1,9 +1,17 @@
+from .backlog_parser import BacklogSection, parse_backlog_file, parse_backlog_lines
 from .backlog_processor import BacklogProcessor
+from .folder_name_cache import FolderNameCache
 from .llm_prompt_service import LlmPromptService
+from .processed_section_index import ProcessedSectionIndex
 from .git_service import GitService
 
 __all__ = [
+    "BacklogSection",
+    "parse_backlog_file",
+    "parse_backlog_lines",
     "BacklogProcessor",
+    "FolderNameCache",
     "LlmPromptService",
+    "ProcessedSectionIndex",
 	"GitService"
 ]
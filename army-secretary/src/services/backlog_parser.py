@@ -0,0 +1,80 @@
+"""
+Single-pass, line-by-line parser for backlog markdown files.
+
+Sections start at lines beginning with '## '. Only the section currently being
+read is held in memory, and every section carries the exact line it starts on.
+"""
+
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+TASK_HEADING_PREFIX: str = "## "
+
+
+class BacklogSection(NamedTuple):
+    """
+    One block of the backlog. `title` is None for text before the first '## ' heading
+    and an empty string for a heading without text.
+    """
+    index: int
+    start_line: int
+    title: Optional[str]
+    description: str
+    content: str
+
+
+def _build_section(index: int, start_line: int, lines: list[str]) -> Optional[BacklogSection]:
+    content = "".join(lines).strip()
+    if not content:
+        return None
+
+    if not lines[0].startswith(TASK_HEADING_PREFIX):
+        # Leading blank lines are not part of the block; point at its first text line
+        blank_line_count = next(line_number for line_number, line in enumerate(lines) if line.strip())
+        return BacklogSection(index, start_line + blank_line_count, None, "", content)
+
+    title = lines[0][len(TASK_HEADING_PREFIX):].strip()
+    description = "".join(lines[1:]).strip()
+    return BacklogSection(index, start_line, title, description, content)
+
+
+def parse_backlog_lines(lines: Iterable[str]) -> Iterator[BacklogSection]:
+    """
+    Splits backlog lines into sections as they are read.
+
+    Args:
+        lines: Lines including their line endings, e.g. an open text file.
+
+    Yields:
+        Non-empty sections in file order, numbered from 0 with 1-based start lines.
+    """
+    section_lines: list[str] = []
+    section_start_line: int = 1
+    section_index: int = 0
+
+    for line_number, line in enumerate(lines, start=1):
+        if line.startswith(TASK_HEADING_PREFIX) and section_lines:
+            section = _build_section(section_index, section_start_line, section_lines)
+            if section:
+                yield section
+                section_index += 1
+            section_lines = []
+            section_start_line = line_number
+        elif not section_lines:
+            section_start_line = line_number
+        section_lines.append(line)
+
+    if section_lines:
+        section = _build_section(section_index, section_start_line, section_lines)
+        if section:
+            yield section
+
+
+def parse_backlog_file(backlog_filepath: str) -> Iterator[BacklogSection]:
+    """
+    Streams the sections of a backlog file without reading it into memory at once.
+
+    Raises:
+        OSError: If the file cannot be opened or read.
+    """
+    with open(backlog_filepath, encoding="utf-8") as f:
+        yield from parse_backlog_lines(f)
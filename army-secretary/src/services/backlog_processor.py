@@ -4,26 +4,45 @@ markdown file, interacting with an LLM to sanitize task titles for
 directory names, and creating a structured output of goal description files.
 """
 
+import asyncio
 import logging
 import os
 import re
-from typing import Optional, Tuple, List # Added List for parsing_errors
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional, Tuple, List # Added List for parsing_errors
 from datetime import datetime
 
 from config import AppConfig
-from models.goal_models import SanitizedGoalInfo
+from models.goal_models import GoalTaskRecord, SanitizedGoalInfo, SanitizedGoalInfoBatch
+from utils.slugger import make_unique_folder_name, slugify_title
+from utils.task_file_paths import find_task_file_path
+from .backlog_parser import BacklogSection, parse_backlog_file
+from .folder_name_cache import FolderNameCache
 from .llm_prompt_service import LlmPromptService
+from .processed_section_index import ProcessedSectionIndex
 import prompts
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+def _chunked(items: Iterable, chunk_size: int) -> Iterator[list]:
+    """Yields lists of up to `chunk_size` items, reading `items` lazily."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
 class BacklogProcessor:
     """
     Processes a backlog file, extracts tasks, and creates a structured
     directory of goal description files, using an LLM for folder name generation.
     """
 
-    def __init__(self, llm_service: LlmPromptService, output_dir: str, app_config: AppConfig) -> None:
+    def __init__(
+        self,
+        llm_service: LlmPromptService,
+        output_dir: str,
+        app_config: AppConfig,
+        on_goal_created: Optional[Callable[[str], None]] = None
+    ) -> None:
         """
         Initializes the BacklogProcessor.
 
@@ -31,17 +50,40 @@ class BacklogProcessor:
             llm_service: An instance of LlmPromptService.
             output_dir: The root directory where goal folders will be created.
             app_config: The application configuration.
+            on_goal_created: Optional callback invoked with each goal folder path as soon as
+                             its task description has been written.
         """
         self.llm_service: LlmPromptService = llm_service
         self.output_dir: str = output_dir
         self.app_config: AppConfig = app_config
+        self.on_goal_created: Optional[Callable[[str], None]] = on_goal_created
 
         self.created_folders: List[str] = []
 
+        # Caps how many folder-name requests are in flight at once (free tiers are rate limited)
+        self._llm_semaphore: asyncio.Semaphore = asyncio.Semaphore(self.app_config.max_concurrent_llm_calls)
+
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
             logger.info(f"Created output directory: {self.output_dir}")
 
+        # Existing goal folders plus the ones named during this run, so new goals never overwrite them
+        self._taken_folder_names: set[str] = {
+            entry for entry in os.listdir(self.output_dir) if os.path.isdir(os.path.join(self.output_dir, entry))
+        }
+
+        cache_directory: str = os.path.join(self.output_dir, ".cache")
+        self._folder_name_cache: Optional[FolderNameCache] = None
+        if self.app_config.folder_name_cache_max_entries > 0:
+            self._folder_name_cache = FolderNameCache(cache_directory, self.app_config.folder_name_cache_max_entries)
+
+        self._processed_section_index: Optional[ProcessedSectionIndex] = None
+        if self.app_config.backlog_intake_mode == "incremental":
+            self._processed_section_index = ProcessedSectionIndex(cache_directory)
+
+    def _folder_name_cache_key(self, task_title: str, task_description: str) -> str:
+        return FolderNameCache.make_key(task_title, task_description, self.app_config.default_llm_model_name)
+
     async def _sanitize_title_with_llm(self, task_description: str, task_title: str) -> str:
         """
         Uses the LlmPromptService to generate a sanitized, filesystem-friendly
@@ -55,6 +97,12 @@ class BacklogProcessor:
         Returns:
             A sanitized folder name string.
         """
+        if self._folder_name_cache:
+            cached_folder_name: Optional[str] = self._folder_name_cache.get(self._folder_name_cache_key(task_title, task_description))
+            if cached_folder_name:
+                logger.info(f"Using cached folder name '{cached_folder_name}' for task: '{task_title[:50]}...'")
+                return cached_folder_name
+
         # Use externalized prompts
         prompt_content: str = prompts.get_sanitize_folder_name_user_prompt(task_description, task_title)
         messages: List[dict[str, str]] = [
@@ -73,9 +121,10 @@ class BacklogProcessor:
         folder_name: str = ""
         if structured_output and structured_output.folder_name and structured_output.folder_name.strip():
             logger.info(f"LLM generated folder name: '{structured_output.folder_name}' for task: '{task_title[:50]}...'")
-            # Apply basic sanitization even to LLM output for safety
-            folder_name = re.sub(r'[^\w\-]+', '', structured_output.folder_name.lower().replace(' ', '-'))
+            folder_name = self._clean_llm_folder_name(structured_output.folder_name)
             if folder_name.strip(): # Ensure not empty after sanitization
+                 if self._folder_name_cache:
+                     self._folder_name_cache.put(self._folder_name_cache_key(task_title, task_description), folder_name)
                  return folder_name
             else:
                  logger.warning(f"LLM generated folder name became empty after sanitization for task: '{task_title[:50]}...'. Using fallback.")
@@ -93,153 +142,341 @@ class BacklogProcessor:
         timestamp: str = datetime.now().strftime("%Y-%m-%d_%H-%M-%S-%f")[:-3] # Format: YYYY-MM-DD_HH-MM-SS-mmm
         return f"{base_name_sanitized}_{timestamp}"
 
-    def _parse_task_from_section(self, task_section_content: str) -> Optional[Tuple[str, str]]:
+    def _clean_llm_folder_name(self, folder_name: str) -> str:
+        # Apply basic sanitization even to LLM output for safety
+        return re.sub(r'[^\w\-]+', '', folder_name.lower().replace(' ', '-'))
+
+    async def _sanitize_titles_with_llm_batch(self, tasks: List[Tuple[int, str, str]]) -> dict[int, str]:
         """
-        Extracts the title and description from a markdown task section.
-        A task section is expected to start with '## ' for the title.
+        Generates folder names for several tasks with a single LLM request.
 
         Args:
-            task_section_content: A string block representing a single task.
+            tasks: (section_index, task_title, task_description) for every task in the batch.
 
         Returns:
-            A tuple (title, description), or None if parsing fails.
+            Folder names by section index. Tasks the LLM skipped or named unusably are left out,
+            so the caller can fall back to `_sanitize_title_with_llm` for them.
         """
-        lines: List[str] = task_section_content.strip().split('\n')
-        if not lines:
-            return None
+        messages: List[dict[str, str]] = [
+            {"role": "system", "content": prompts.SANITIZE_FOLDER_NAMES_BATCH_SYSTEM_PROMPT},
+            {"role": "user", "content": prompts.get_sanitize_folder_names_batch_user_prompt(tasks)}
+        ]
 
-        title: str = ""
-        description_lines: List[str] = []
+        async with self._llm_semaphore:
+            structured_output: Optional[SanitizedGoalInfoBatch] = await self.llm_service.get_structured_output(
+                messages=messages,
+                output_pydantic_model_type=SanitizedGoalInfoBatch,
+                llm_model_name=self.app_config.default_llm_model_name
+            )
 
-        if lines[0].startswith("## "):
-            title = lines[0][3:].strip()
-            description_lines = lines[1:]
+        if not structured_output:
+            logger.error(f"Batched folder name request for {len(tasks)} task(s) failed. Falling back to one request per task.")
+            return {}
+
+        requested_tasks = {section_index: (task_title, task_description) for section_index, task_title, task_description in tasks}
+        folder_names: dict[int, str] = {}
+        for item in structured_output.goals:
+            folder_name = self._clean_llm_folder_name(item.folder_name)
+            if item.task_index in requested_tasks and folder_name and item.task_index not in folder_names:
+                folder_names[item.task_index] = folder_name
+                if self._folder_name_cache:
+                    self._folder_name_cache.put(self._folder_name_cache_key(*requested_tasks[item.task_index]), folder_name)
+
+        if len(folder_names) < len(tasks):
+            logger.warning(f"Batched folder name request returned {len(folder_names)}/{len(tasks)} usable name(s).")
         else:
-            # This case should ideally be caught before calling this method if sections are pre-filtered
-            logger.warning(f"Task section content does not start with '## ': '{task_section_content[:100]}...'")
-            return None
+            logger.info(f"Batched folder name request returned names for all {len(tasks)} task(s).")
+        return folder_names
 
-        if not title: # Handle cases like "## " (empty title)
-            logger.warning(f"Task section has '## ' but no title text: '{task_section_content[:100]}...'")
-            return None 
+    def _generate_local_folder_names(self, sections_to_process: List[BacklogSection]) -> dict[int, str]:
+        """
+        Slugs task titles locally, without the LLM.
 
-        description: str = "\n".join(description_lines).strip()
-        return title, description
+        Returns:
+            Folder names by section index; titles that do not slug well are left out for the LLM.
+        """
+        folder_names: dict[int, str] = {}
+        for section in sections_to_process:
+            slug = slugify_title(section.title)
+            if slug:
+                folder_names[section.index] = slug
+            else:
+                logger.info(f"Title '{section.title[:50]}' is not a good fit for a local folder name; using the LLM.")
+        logger.info(f"Named {len(folder_names)}/{len(sections_to_process)} task(s) locally.")
+        return folder_names
 
-    def _read_backlog_content(self, backlog_filepath: str) -> Optional[str]:
+    def _get_cached_folder_names(self, sections_to_process: List[BacklogSection]) -> dict[int, str]:
         """
-        Reads the content of the backlog file.
+        Looks up folder names the LLM already generated for identical tasks in earlier runs.
 
-        Args:
-            backlog_filepath: Path to the backlog markdown file.
+        Returns:
+            Folder names by section index; sections without a cached name are left out.
+        """
+        folder_names: dict[int, str] = {}
+        if not self._folder_name_cache:
+            return folder_names
+        for section in sections_to_process:
+            cached_folder_name = self._folder_name_cache.get(self._folder_name_cache_key(section.title, section.description))
+            if cached_folder_name:
+                folder_names[section.index] = cached_folder_name
+        logger.info(f"Found cached folder names for {len(folder_names)}/{len(sections_to_process)} task(s).")
+        return folder_names
+
+    async def _generate_folder_names(self, sections: List[BacklogSection]) -> dict[int, str]:
+        """
+        Names sections locally, from the cache, or with batched LLM requests, in that order.
 
         Returns:
-            The file content as a string, or None if an error occurs.
+            Folder names by section index; sections left out get a single LLM request when processed.
         """
-        logger.info(f"Reading backlog file: {backlog_filepath}")
-        try:
-            with open(backlog_filepath, encoding='utf-8') as f:
-                return f.read()
-        except FileNotFoundError:
-            logger.error(f"Backlog file not found: {backlog_filepath}")
-            return None
-        except Exception as e:
-            logger.error(f"Error reading backlog file {backlog_filepath}: {e}", exc_info=True)
-            return None
+        folder_names: dict[int, str] = {}
+        if self.app_config.use_local_slugs:
+            folder_names = self._generate_local_folder_names(sections)
+
+        sections_needing_llm: List[BacklogSection] = [section for section in sections if section.index not in folder_names]
+        if sections_needing_llm:
+            folder_names.update(self._get_cached_folder_names(sections_needing_llm))
+            sections_needing_llm = [section for section in sections_needing_llm if section.index not in folder_names]
+        if self.app_config.folder_name_batch_size > 0 and sections_needing_llm:
+            folder_names.update(await self._generate_folder_names_in_batches(sections_needing_llm))
+        return folder_names
+
+    async def _generate_folder_names_in_batches(self, sections_to_process: List[BacklogSection]) -> dict[int, str]:
+        """
+        Generates folder names for all sections in chunks of `folder_name_batch_size`, one LLM request per chunk.
+
+        Returns:
+            Folder names by section index; sections without a usable name are left out.
+        """
+        tasks: List[Tuple[int, str, str]] = [(section.index, section.title, section.description) for section in sections_to_process]
+
+        batch_size: int = self.app_config.folder_name_batch_size
+        batches = [tasks[start:start + batch_size] for start in range(0, len(tasks), batch_size)]
+        logger.info(f"Requesting folder names for {len(tasks)} task(s) in {len(batches)} batch(es).")
+
+        folder_names: dict[int, str] = {}
+        for batch_folder_names in await asyncio.gather(*(self._sanitize_titles_with_llm_batch(batch) for batch in batches)):
+            folder_names.update(batch_folder_names)
+        return folder_names
+
+    def _write_task_sidecar(self, task_folder_path: str, folder_name: str, task_title: str, task_description: str) -> None:
+        """
+        Writes the goal's structured record next to its task description. Skipped when the
+        target file cannot be determined, in which case Army Man extracts it with an LLM.
+        """
+        small_tweak_file_path: Optional[str] = find_task_file_path(task_description, self.app_config.project_git_path)
+        if not small_tweak_file_path:
+            logger.info(f"No single existing file path found in task '{task_title[:50]}'; not writing a task sidecar.")
+            return
+
+        task_record = GoalTaskRecord(
+            goal_title=task_title,
+            task_description=task_description,
+            small_tweak_file_path=small_tweak_file_path,
+            folder_name=folder_name
+        )
+        sidecar_filepath: str = os.path.join(task_folder_path, self.app_config.task_sidecar_filename)
+        with open(sidecar_filepath, 'w', encoding='utf-8') as f:
+            f.write(task_record.model_dump_json(indent=2) + "\n")
+        logger.info(f"Wrote task sidecar to: {sidecar_filepath}")
 
     async def _process_single_task_section(
         self, 
-        task_section_content: str, 
-        section_index: int, 
-        full_content_for_context: str # Used to calculate approx line number
-    ) -> bool:
+        section: BacklogSection,
+        folder_name: Optional[str] = None
+    ) -> Optional[str]:
         """
-        Processes a single task section: parses, sanitizes title, creates folder & file.
+        Processes a single task section: sanitizes title, creates folder & file.
+        Sections are processed concurrently, so the caller records created folders in backlog order.
 
         Args:
-            task_section_content: The content of the individual task section.
-            section_index: Index of the section for logging/error context.
-            full_content_for_context: Full backlog content to help locate section for error reporting.
+            section: The parsed task section.
+            folder_name: Folder name generated ahead of time (local slug or batched request), if any.
 
         Returns:
-            True if successful, False otherwise.
+            The created task folder path if successful, None otherwise.
         """
-        parsed_info: Optional[Tuple[str, str]] = self._parse_task_from_section(task_section_content)
-        
-        if not parsed_info:
-            return False
-
-        task_title, task_description = parsed_info
-        logger.info(f"Processing task (section {section_index + 1}): '{task_title}' (description length: {len(task_description)} chars)")
+        task_title, task_description = section.title, section.description
+        logger.info(
+            f"Processing task (section {section.index + 1}, line {section.start_line}): '{task_title}' "
+            f"(description length: {len(task_description)} chars)"
+        )
 
-        folder_name: str = await self._sanitize_title_with_llm(task_description, task_title)
+        if not folder_name:
+            async with self._llm_semaphore:
+                folder_name = await self._sanitize_title_with_llm(task_description, task_title)
         
         if not folder_name: 
              logger.error(f"sanitize_title_with_llm unexpectedly returned empty for task: '{task_title}'. Skipping file creation for this task.")
-             return False
+             return None
+
+        # No await between checking and reserving the name, so concurrent sections cannot claim the same one
+        unique_folder_name: str = make_unique_folder_name(folder_name, self._taken_folder_names)
+        if unique_folder_name != folder_name:
+            logger.info(f"Folder name '{folder_name}' is already taken; using '{unique_folder_name}'.")
+        folder_name = unique_folder_name
 
         task_folder_path: str = os.path.join(self.output_dir, folder_name)
 
         try:
-            if not os.path.exists(task_folder_path):
-                os.makedirs(task_folder_path)
-                logger.info(f"Created task folder: {task_folder_path}")
-            else:
-                logger.warning(f"Task folder already exists (overwriting): {task_folder_path}")
-
-            self.created_folders.append(task_folder_path)
+            os.makedirs(task_folder_path)
+            logger.info(f"Created task folder: {task_folder_path}")
 
             description_filepath: str = os.path.join(task_folder_path, self.app_config.task_description_filename)
             with open(description_filepath, 'w', encoding='utf-8') as f:
                 f.write(task_description + "\n")
             logger.info(f"Wrote task description to: {description_filepath}")
-            return True
+
+            if self.app_config.task_sidecar_filename:
+                self._write_task_sidecar(task_folder_path, folder_name, task_title, task_description)
         except Exception as e:
             logger.error(f"Error creating folder or file for task '{task_title}': {e}", exc_info=True)
-            return False
+            return None
+
+        if self.on_goal_created:
+            try:
+                self.on_goal_created(task_folder_path)
+            except Exception as e:
+                logger.error(f"Goal created callback failed for '{task_folder_path}': {e}", exc_info=True)
+        return task_folder_path
 
     async def process_backlog_file(self, backlog_filepath: str) -> None:
         """
         Reads the backlog file, parses tasks, generates folder names using LLM,
         and creates the directory structure.
 
+        Sections are named in chunks of `folder_name_batch_size` as the file is read and handed
+        to `max_concurrent_llm_calls` workers through a bounded queue, so only a few sections
+        are held in memory however long the backlog is.
+
+        In incremental intake mode only sections not processed before are handled
+        and the backlog file is left untouched.
+
         Args:
             backlog_filepath: Path to the backlog markdown file.
         """
-        content: Optional[str] = self._read_backlog_content(backlog_filepath)
-        if content is None:
-            return 
-        
+        processed_section_index: Optional[ProcessedSectionIndex] = self._processed_section_index
+        # Taken before reading, so edits made during the run make the next run look again
+        backlog_file_state: Optional[list[int]] = ProcessedSectionIndex.get_backlog_file_state(backlog_filepath)
+        if processed_section_index and processed_section_index.is_backlog_unchanged(backlog_file_state):
+            logger.info(f"Backlog file '{backlog_filepath}' has not changed since the last run. Nothing to do.")
+            return
+
         # define task name placeholder string
         task_name_placeholder: str = "Insert Task Name Here"
 
-        task_sections: List[str] = re.split(r'(?=^## )', content, flags=re.MULTILINE)
-        
         processed_tasks_count: int = 0
         parsing_errors: List[str] = []
-
-        for i, section_content in enumerate(task_sections):
-            section_content = section_content.strip()
-            if not section_content: 
-                continue
-
-            if not section_content.startswith("## "):
-                if section_content: 
-                    approx_line_start: int = content.count('\n', 0, content.find(section_content)) + 1 if content.find(section_content) != -1 else -1
-                    error_detail: str = f"Section {i+1} (near line {approx_line_start}, content: '{section_content[:100]}...')"
+        section_hashes: set[str] = set()
+        section_count: int = 0
+        num_already_processed: int = 0
+        has_failed_sections: bool = False
+        read_failed: bool = False
+        # Created folders by section index, so created_folders follows the backlog order
+        created_folders_by_index: dict[int, str] = {}
+        # Added to the index after the run, so a section repeated later in the backlog is not skipped as processed
+        processed_hashes: List[str] = []
+
+        num_workers: int = self.app_config.max_concurrent_llm_calls
+        chunk_size: int = max(self.app_config.folder_name_batch_size, 1)
+        # Bounded, so reading the backlog waits for the workers instead of holding every section
+        section_queue: asyncio.Queue = asyncio.Queue(maxsize=num_workers + chunk_size)
+
+        def read_sections() -> Iterator[Tuple[BacklogSection, Optional[str]]]:
+            nonlocal section_count, num_already_processed
+            for section in parse_backlog_file(backlog_filepath):
+                section_count += 1
+
+                if section.title is None:
+                    error_detail: str = f"Section {section.index + 1} (line {section.start_line}, content: '{section.content[:100]}...')"
                     parsing_errors.append(error_detail)
                     logger.warning(f"Skipping section not starting with '## ': {error_detail}")
-                continue
-
-            if task_name_placeholder in section_content:
-                logger.info(f"Skipping section with placeholder task name: {section_content[:100]}...")
-                continue
-            
-            if await self._process_single_task_section(section_content, i, content):
+                    continue
+
+                if not section.title: # Handle cases like "## " (empty title)
+                    logger.warning(f"Task section on line {section.start_line} has '## ' but no title text: '{section.content[:100]}...'")
+                    continue
+
+                if task_name_placeholder in section.content:
+                    logger.info(f"Skipping section with placeholder task name: {section.content[:100]}...")
+                    continue
+
+                section_hash: Optional[str] = None
+                if processed_section_index:
+                    section_hash = ProcessedSectionIndex.hash_section(section.content)
+                    section_hashes.add(section_hash)
+                    if processed_section_index.contains(section_hash):
+                        num_already_processed += 1
+                        continue
+
+                yield section, section_hash
+
+        async def queue_named_sections() -> None:
+            nonlocal read_failed
+            try:
+                for chunk in _chunked(read_sections(), chunk_size):
+                    folder_names: dict[int, str] = await self._generate_folder_names([section for section, _ in chunk])
+                    for section, section_hash in chunk:
+                        await section_queue.put((section, section_hash, folder_names.get(section.index)))
+            except FileNotFoundError:
+                logger.error(f"Backlog file not found: {backlog_filepath}")
+                read_failed = True
+            except Exception as e:
+                logger.error(f"Error reading backlog file {backlog_filepath}: {e}", exc_info=True)
+                read_failed = True
+            finally:
+                for _ in range(num_workers):
+                    await section_queue.put(None)
+
+        async def process_queued_sections() -> None:
+            nonlocal processed_tasks_count, has_failed_sections
+            while True:
+                item = await section_queue.get()
+                if item is None:
+                    return
+                section, section_hash, folder_name = item
+                try:
+                    task_folder_path: Optional[str] = await self._process_single_task_section(section, folder_name)
+                except Exception as e:
+                    logger.error(f"Unexpected error while processing task section {section.index + 1} (line {section.start_line}): {e}", exc_info=True)
+                    task_folder_path = None
+                if not task_folder_path:
+                    has_failed_sections = True
+                    continue
+                created_folders_by_index[section.index] = task_folder_path
                 processed_tasks_count += 1
+                if section_hash:
+                    processed_hashes.append(section_hash)
+
+        logger.info(f"Reading backlog file: {backlog_filepath}")
+        logger.info(f"Processing task sections as they are read, with up to {num_workers} concurrent LLM call(s).")
+        await asyncio.gather(queue_named_sections(), *(process_queued_sections() for _ in range(num_workers)))
+        self.created_folders.extend(created_folders_by_index[index] for index in sorted(created_folders_by_index))
+        if self._folder_name_cache:
+            self._folder_name_cache.save()
+
+        if processed_section_index:
+            for section_hash in processed_hashes:
+                processed_section_index.add(section_hash)
+            logger.info(
+                f"Incremental intake: {len(section_hashes) - num_already_processed} new or changed section(s), "
+                f"{num_already_processed} already processed."
+            )
+
+        if read_failed:
+            # Sections after the failure were never seen, so neither record the file as done nor clear it
+            if processed_section_index:
+                processed_section_index.save(None)
+            return
 
         logger.info("\n\n")
 
+        if processed_section_index:
+            # Failed sections stay out of the index and are retried on the next run; forgetting the
+            # file state keeps an unchanged backlog from being skipped before they are
+            processed_section_index.retain_only(section_hashes)
+            processed_section_index.save(None if has_failed_sections else backlog_file_state)
+
         # Clear out BACKLOG.md so its now an empty file
         clear_backlog = False
 
@@ -256,13 +493,15 @@ class BacklogProcessor:
             )
         
         if processed_tasks_count == 0 and not parsing_errors:
-            if not any(s.strip() for s in task_sections if s.strip()): 
+            if section_count == 0: 
                  logger.info(f"Backlog file '{backlog_filepath}' is empty or contains no processable content.")
                  clear_backlog = True
             else: 
                  logger.info(f"No valid task sections (starting with '##') found in '{backlog_filepath}'.")
 
-        if clear_backlog:
+        if clear_backlog and processed_section_index:
+            logger.info("Incremental intake leaves the backlog file unchanged.")
+        elif clear_backlog:
             # Clear out BACKLOG.md so its now just the template
             with open(backlog_filepath, 'w', encoding='utf-8') as f:
                 f.write(f"## {task_name_placeholder}\n\nInsert Task Description Here")
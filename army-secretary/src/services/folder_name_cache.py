@@ -0,0 +1,95 @@
+"""
+FolderNameCache class, an on-disk cache of LLM-generated folder names so
+re-submitted tasks do not pay for another LLM round trip.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from collections import OrderedDict
+from typing import Optional
+
+from utils.cache_directory import ensure_cache_directory
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+class FolderNameCache:
+    """
+    Maps a hash of (normalized title, normalized description, model name) to the
+    folder name the LLM generated for it. Entries are kept in least-recently-used
+    order and the oldest ones are evicted once `max_entries` is exceeded.
+    """
+
+    def __init__(self, cache_directory: str, max_entries: int) -> None:
+        """
+        Initializes the FolderNameCache and loads any existing entries.
+
+        Args:
+            cache_directory: Directory holding the cache file, e.g. `ai-goals/.cache`.
+            max_entries: Maximum number of folder names kept.
+        """
+        self.cache_directory: str = cache_directory
+        self.cache_file_path: str = os.path.join(cache_directory, "folder_names.json")
+        self.max_entries: int = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._is_dirty: bool = False
+        self._load()
+
+    @staticmethod
+    def make_key(task_title: str, task_description: str, llm_model_name: str) -> str:
+        """
+        Builds the cache key. Case and whitespace differences do not produce a new key.
+        """
+        def normalize(text: str) -> str:
+            return re.sub(r"\s+", " ", text or "").strip().lower()
+
+        key_source = "\x1f".join([normalize(task_title), normalize(task_description), llm_model_name])
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.cache_file_path):
+            return
+        try:
+            with open(self.cache_file_path, "r", encoding="utf-8") as f:
+                stored_entries = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read folder name cache at '{self.cache_file_path}', starting empty: {e}")
+            return
+        if isinstance(stored_entries, dict):
+            self._entries = OrderedDict(
+                (key, value) for key, value in stored_entries.items() if isinstance(value, str) and value
+            )
+        logger.info(f"Loaded {len(self._entries)} cached folder name(s) from '{self.cache_file_path}'.")
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the cached folder name for `key` and marks it as recently used, or None."""
+        folder_name = self._entries.get(key)
+        if folder_name is not None:
+            self._entries.move_to_end(key)
+            self._is_dirty = True
+        return folder_name
+
+    def put(self, key: str, folder_name: str) -> None:
+        """Stores a folder name, evicting the least recently used entries if the cache is full."""
+        self._entries[key] = folder_name
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._is_dirty = True
+
+    def save(self) -> None:
+        """Writes the cache to disk if it changed. Failures are logged, never raised."""
+        if not self._is_dirty:
+            return
+        try:
+            ensure_cache_directory(self.cache_directory)
+            temporary_file_path = self.cache_file_path + ".tmp"
+            with open(temporary_file_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, indent=2)
+            os.replace(temporary_file_path, self.cache_file_path)
+            self._is_dirty = False
+            logger.info(f"Saved {len(self._entries)} cached folder name(s) to '{self.cache_file_path}'.")
+        except OSError as e:
+            logger.warning(f"Could not save folder name cache to '{self.cache_file_path}': {e}")
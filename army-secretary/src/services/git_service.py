@@ -49,6 +49,19 @@ class GitService:
         except (subprocess.CalledProcessError, ValueError):
             return None
 
+    def commit_paths(self, paths: list[str], commit_message: str) -> bool:
+        """Commits only the given paths, leaving any other changes in the working tree untouched."""
+        try:
+            self._run_git_command(["add", "--"] + paths)
+            self._run_git_command(["commit", "-m", commit_message, "--"] + paths)
+            return True
+        except subprocess.CalledProcessError as e:
+            print(f"Git command failed: {e}")
+            return False
+        except FileNotFoundError:
+            print("Git command not found. Ensure Git is installed and in PATH.")
+            return False
+
     def commit_changes(self, commit_message: str) -> bool:
         try:
             # TODO: Add a check to see if there's any files to commit. If there's not, then return gracefully while returning True but log a warning
@@ -1,8 +1,10 @@
+import asyncio
 import logging
 import os
 import re
 from typing import Any, Optional, TypeVar
 
+import httpx
 from pydantic import BaseModel
 from pydantic_ai.direct import model_request
 from pydantic_ai.messages import (
@@ -11,22 +13,36 @@ from pydantic_ai.messages import (
     ModelResponse,
     SystemPromptPart,
     TextPart,
+    ToolCallPart,
     UserPromptPart,
 )
-from pydantic_ai.models import ModelRequestParameters  # For temperature, etc.
+from pydantic_ai.models import Model, ModelRequestParameters  # For temperature, etc.
+from pydantic_ai.models.gemini import GeminiModel
+from pydantic_ai.providers.google_gla import GoogleGLAProvider
+from pydantic_ai.tools import ToolDefinition
 
 from src.config import AppConfig
+from .llm_response_cache import LlmResponseCache
+from .llm_retry import compute_retry_delay, get_retry_after_seconds, is_retryable_error
 
 logger = logging.getLogger(__name__)
 
 # Define a TypeVar for more precise return type hinting
 T = TypeVar('T', bound=BaseModel)
 
+# Name of the tool the model must call with its answer in "tool" structured output mode
+OUTPUT_TOOL_NAME = "final_result"
+
+# Same timeouts pydantic-ai uses for its own provider clients
+HTTP_CLIENT_TIMEOUT = httpx.Timeout(timeout=600, connect=5)
+
 class LlmPromptService:
     """
     Service for interacting with LLMs (specifically Google Gemini via pydantic-ai)
     to get structured output based on Pydantic models.
-    Uses pydantic_ai.direct.model_request.
+    Uses pydantic_ai.direct.model_request with model instances that share one
+    keep-alive HTTP client, so connections are reused across calls. Call `aclose`
+    before the event loop the requests ran on ends.
     """
     def __init__(self, app_config: AppConfig):
         """
@@ -38,6 +54,131 @@ class LlmPromptService:
         self.app_config = app_config
         self.gemini_model_prefix = "google-gla:" # Standard prefix for pydantic-ai with Gemini
 
+        self.response_cache: Optional[LlmResponseCache] = None
+        if app_config.llm_response_cache_enabled:
+            self.response_cache = LlmResponseCache(
+                database_path=app_config.llm_response_cache_path,
+                ttl_seconds=app_config.llm_response_cache_ttl_hours * 3600,
+                max_bytes=app_config.llm_response_cache_max_bytes
+            )
+            logger.info(f"LLM response cache enabled: {app_config.llm_response_cache_path}")
+
+        # Totals across all requests made by this service, for the logs
+        self.retry_count = 0
+        self.retry_sleep_seconds = 0.0
+
+        # Created lazily by _get_model and reused for every request on the same event loop
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._models: dict[str, Model] = {}
+
+    def _get_model(self, model_name: str) -> Model:
+        """
+        Returns the model instance for `model_name`, creating it and the shared keep-alive
+        HTTP client on first use. An httpx client cannot outlive the event loop it was used
+        on, so a request on a different loop starts a new client.
+        """
+        current_loop = asyncio.get_running_loop()
+        if self._http_client is None or self._http_client_loop is not current_loop:
+            if self._http_client is not None:
+                logger.debug("Event loop changed since the last LLM request; creating a new HTTP client.")
+            self._http_client = httpx.AsyncClient(timeout=HTTP_CLIENT_TIMEOUT)
+            self._http_client_loop = current_loop
+            self._models = {}
+
+        model = self._models.get(model_name)
+        if model is None:
+            provider = GoogleGLAProvider(api_key=os.getenv("GEMINI_API_KEY"), http_client=self._http_client)
+            model = GeminiModel(model_name, provider=provider)
+            self._models[model_name] = model
+            logger.debug(f"Created pooled LLM model {self.gemini_model_prefix}{model_name}.")
+        return model
+
+    async def aclose(self) -> None:
+        """
+        Closes the shared HTTP client. Must be awaited on the event loop the requests ran on;
+        a later request creates a new client.
+        """
+        http_client = self._http_client
+        self._http_client = None
+        self._http_client_loop = None
+        self._models = {}
+        if http_client is not None:
+            await http_client.aclose()
+            logger.debug("Closed the pooled LLM HTTP client.")
+
+    async def _model_request_with_retries(
+        self,
+        model_name: str,
+        messages: list[ModelRequest],
+        model_request_parameters: Optional[ModelRequestParameters]
+    ) -> ModelResponse:
+        """
+        Calls model_request, retrying rate limits, timeouts and 5xx errors with exponential
+        backoff and jitter. Any other error, or the last failed attempt, is raised.
+        """
+        max_attempts = self.app_config.llm_max_retries + 1
+        request_sleep_seconds = 0.0
+        for attempt in range(1, max_attempts + 1):
+            try:
+                response = await model_request(
+                    model=self._get_model(model_name),
+                    messages=messages,
+                    model_request_parameters=model_request_parameters
+                )
+                if attempt > 1:
+                    logger.info(
+                        f"LLM request to {model_name} succeeded on attempt {attempt}/{max_attempts} "
+                        f"after sleeping {request_sleep_seconds:.1f}s."
+                    )
+                return response
+            except Exception as e:
+                if not is_retryable_error(e):
+                    logger.error(f"LLM request to {model_name} failed with a non-retryable error: {e}")
+                    raise
+                if attempt == max_attempts:
+                    logger.error(
+                        f"LLM request to {model_name} failed after {attempt} attempt(s) "
+                        f"and {request_sleep_seconds:.1f}s of backoff: {e}"
+                    )
+                    raise
+
+                delay_seconds = compute_retry_delay(
+                    attempt,
+                    self.app_config.llm_retry_base_delay_seconds,
+                    self.app_config.llm_retry_max_delay_seconds,
+                    get_retry_after_seconds(e)
+                )
+                self.retry_count += 1
+                self.retry_sleep_seconds += delay_seconds
+                request_sleep_seconds += delay_seconds
+                logger.warning(
+                    f"LLM request to {model_name} failed on attempt {attempt}/{max_attempts} ({e}). "
+                    f"Retrying in {delay_seconds:.1f}s (retries so far: {self.retry_count}, "
+                    f"total backoff: {self.retry_sleep_seconds:.1f}s)."
+                )
+                await asyncio.sleep(delay_seconds)
+
+    def _get_schema_instructions(self, output_pydantic_model_type: type[BaseModel]) -> str:
+        """
+        Schema text appended to the system prompt in "prompt" mode, where the reply is free text.
+        """
+        return (
+            f"The JSON schema to use for your response is:\n{output_pydantic_model_type.model_json_schema()}\n"
+            "Ensure your output is a valid JSON object that conforms to this schema."
+        )
+
+    def _get_output_tool(self, output_pydantic_model_type: type[BaseModel]) -> ToolDefinition:
+        """
+        Tool definition the model is forced to call in "tool" mode, so the provider constrains
+        the reply to the schema instead of the prompt describing it.
+        """
+        return ToolDefinition(
+            name=OUTPUT_TOOL_NAME,
+            description=f"Return the final {output_pydantic_model_type.__name__} result.",
+            parameters_json_schema=output_pydantic_model_type.model_json_schema()
+        )
+
     def _strip_json_fencing(self, text_content: str) -> str:
         """
         Strips Markdown JSON fencing (```json ... ```) from a string.
@@ -74,15 +215,27 @@ class LlmPromptService:
             An instance of `output_pydantic_model_type` populated by the LLM, or None if an error occurs
             or the API key is not set.
         """
+        if not llm_model_name:
+            logger.error("LLM model name not provided to get_structured_output. Cannot proceed.")
+            return None
+
+        cache_key: Optional[str] = None
+        if self.response_cache:
+            cache_key = LlmResponseCache.make_key(
+                llm_model_name, messages, output_pydantic_model_type.model_json_schema(), model_parameters
+            )
+            cached_response = self.response_cache.get(cache_key)
+            if cached_response is not None:
+                try:
+                    return output_pydantic_model_type.model_validate_json(cached_response)
+                except Exception as e:
+                    logger.warning(f"Ignoring cached response that no longer parses into {output_pydantic_model_type.__name__}: {e}")
+
         if not os.getenv("GEMINI_API_KEY"):
             logger.error("GEMINI_API_KEY environment variable not set. Cannot make LLM calls.")
             print("GEMINI_API_KEY environment variable not set. Please set it to use the LLM service.")
             return None
 
-        if not llm_model_name:
-            logger.error("LLM model name not provided to get_structured_output. Cannot proceed.")
-            return None
-
         prefixed_model_name = f"{self.gemini_model_prefix}{llm_model_name}"
         logger.debug(f"Using LLM model: {prefixed_model_name}")
 
@@ -112,6 +265,10 @@ class LlmPromptService:
             logger.error("No valid ModelRequestParts to send to LLM after conversion.")
             return None
 
+        use_output_tool = self.app_config.llm_structured_output_mode == "tool"
+        if not use_output_tool:
+            request_parts.append(SystemPromptPart(content=self._get_schema_instructions(output_pydantic_model_type)))
+
         mrp_instance: Optional[ModelRequestParameters] = None
         if model_parameters:
             try:
@@ -120,6 +277,11 @@ class LlmPromptService:
             except Exception as e:
                 logger.warning(f"Could not instantiate ModelRequestParameters from {model_parameters}: {e}. Proceeding without them.")
 
+        if use_output_tool:
+            mrp_instance = mrp_instance or ModelRequestParameters()
+            mrp_instance.output_tools = [self._get_output_tool(output_pydantic_model_type)]
+            mrp_instance.allow_text_output = False
+
         try:
             logger.debug(f"Sending request to LLM with {len(request_parts)} parts. Expecting {output_pydantic_model_type.__name__}.")
             for i, part in enumerate(request_parts):
@@ -130,37 +292,45 @@ class LlmPromptService:
             # For now, assuming instructions are handled by SystemPromptParts or globally
             model_req_object = ModelRequest(parts=request_parts, instructions=None)
 
-            response: ModelResponse = await model_request(
-                model=prefixed_model_name,
-                messages=[model_req_object], # Pass a list containing one ModelRequest
-                model_request_parameters=mrp_instance
+            response: ModelResponse = await self._model_request_with_retries(
+                llm_model_name,
+                [model_req_object], # Pass a list containing one ModelRequest
+                mrp_instance
             )
 
             # Extract the data from ModelResponse and parse it into the Pydantic model
-            if response and response.parts:
-                # Assuming the first part is the relevant one for parsing
-                first_part = response.parts[0]
-                if isinstance(first_part, TextPart):
+            if not response or not response.parts:
+                logger.warning("No valid parts in LLM response. Cannot parse.")
+                return None
+
+            output_tool_call = next(
+                (part for part in response.parts if isinstance(part, ToolCallPart) and part.tool_name == OUTPUT_TOOL_NAME),
+                None
+            )
+            # Assuming the first part is the relevant one when the model answered in text
+            first_part = response.parts[0]
+            try:
+                if output_tool_call:
+                    logger.debug(f"Received output tool call from LLM: {output_tool_call.args}")
+                    parsed_result = output_pydantic_model_type.model_validate(output_tool_call.args_as_dict())
+                elif isinstance(first_part, TextPart):
                     logger.debug(f"Received response from LLM: {first_part.content}")
                     # Strip any json fencing characters if needed
                     stripped_content = self._strip_json_fencing(first_part.content)
                     logger.debug(f"Received response from LLM (stripped): {stripped_content}")
-
-                    # Attempt to parse the content into the specified Pydantic model
-                    try:
-                        parsed_result = output_pydantic_model_type.model_validate_json(stripped_content)
-                        logger.debug(f"Parsed result: {parsed_result}")
-                        return parsed_result
-                    except Exception as e:
-                        logger.error(f"Failed to parse LLM response into {output_pydantic_model_type.__name__}: {e}")
-                        return None
+                    parsed_result = output_pydantic_model_type.model_validate_json(stripped_content)
                 else:
-                    logger.warning("First part of the response is not a TextPart. Cannot parse.")
+                    logger.warning("Response contains neither the output tool call nor a TextPart. Cannot parse.")
                     return None
-            else:
-                logger.warning("No valid parts in LLM response. Cannot parse.")
+            except Exception as e:
+                logger.error(f"Failed to parse LLM response into {output_pydantic_model_type.__name__}: {e}")
                 return None
 
+            logger.debug(f"Parsed result: {parsed_result}")
+            if self.response_cache and cache_key:
+                self.response_cache.put(cache_key, llm_model_name, parsed_result.model_dump_json())
+            return parsed_result
+
         except Exception as e:
             logger.error(f"An error occurred during LLM request or processing: {e}", exc_info=True)
             print(f"\nAn error occurred with the LLM service: {e}")
@@ -0,0 +1,54 @@
+import asyncio
+import json
+import random
+import re
+from typing import Optional
+
+import httpx
+from pydantic_ai.exceptions import ModelHTTPError
+
+# Request timeout, rate limit and the server-side errors worth another attempt
+RETRYABLE_STATUS_CODES = {408, 429}
+RETRY_DELAY_PATTERN = re.compile(r'"?retryDelay"?\s*:\s*"(\d+(?:\.\d+)?)s"', re.IGNORECASE)
+RETRY_AFTER_PATTERN = re.compile(r"retry-after\"?\s*[:=]\s*\"?(\d+(?:\.\d+)?)", re.IGNORECASE)
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """
+    True for rate limits, timeouts, connection problems and 5xx responses.
+    Authentication, permission and request/schema errors (other 4xx) are not retried.
+    """
+    if isinstance(error, ModelHTTPError):
+        return error.status_code in RETRYABLE_STATUS_CODES or error.status_code >= 500
+    return isinstance(error, (httpx.TimeoutException, httpx.TransportError, asyncio.TimeoutError, TimeoutError))
+
+
+def get_retry_after_seconds(error: BaseException) -> Optional[float]:
+    """
+    Reads the delay the provider asked for, e.g. Gemini's `"retryDelay": "30s"` in the
+    error body or a `Retry-After` value.
+    """
+    if not isinstance(error, ModelHTTPError) or error.body is None:
+        return None
+    body_text = error.body if isinstance(error.body, str) else json.dumps(error.body, default=str)
+    for pattern in (RETRY_DELAY_PATTERN, RETRY_AFTER_PATTERN):
+        match = pattern.search(body_text)
+        if match:
+            return float(match.group(1))
+    return None
+
+
+def compute_retry_delay(
+    attempt: int,
+    base_delay_seconds: float,
+    max_delay_seconds: float,
+    retry_after_seconds: Optional[float] = None
+) -> float:
+    """
+    Exponential backoff with full jitter for the given (1-based) failed attempt. A delay
+    requested by the provider is honored, with a little jitter so parallel workers spread out,
+    but never beyond `max_delay_seconds` so a long provider delay cannot stall the goal.
+    """
+    if retry_after_seconds is not None:
+        return min(max_delay_seconds, retry_after_seconds + random.uniform(0, base_delay_seconds))
+    return random.uniform(0, min(max_delay_seconds, base_delay_seconds * (2 ** (attempt - 1))))
@@ -0,0 +1,95 @@
+"""
+ProcessedSectionIndex class, which remembers which backlog sections have already
+been turned into goals so incremental intake only handles new or changed ones.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Optional
+
+from utils.cache_directory import ensure_cache_directory
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+class ProcessedSectionIndex:
+    """
+    Stores the hashes of processed `## ` sections together with the backlog file's
+    size and modification time, so an untouched backlog is skipped without reading it.
+    """
+
+    def __init__(self, cache_directory: str) -> None:
+        """
+        Initializes the ProcessedSectionIndex and loads any existing index.
+
+        Args:
+            cache_directory: Directory holding the index file, e.g. `ai-goals/.cache`.
+        """
+        self.cache_directory: str = cache_directory
+        self.index_file_path: str = os.path.join(cache_directory, "processed_sections.json")
+        self._section_hashes: set[str] = set()
+        self._backlog_file_state: Optional[list[int]] = None
+        self._load()
+
+    @staticmethod
+    def hash_section(section_content: str) -> str:
+        return hashlib.sha256(section_content.strip().encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def get_backlog_file_state(backlog_filepath: str) -> Optional[list[int]]:
+        """Returns [size, mtime_ns] of the backlog file, or None if it cannot be read."""
+        try:
+            file_stat = os.stat(backlog_filepath)
+        except OSError:
+            return None
+        return [file_stat.st_size, file_stat.st_mtime_ns]
+
+    def _load(self) -> None:
+        if not os.path.exists(self.index_file_path):
+            return
+        try:
+            with open(self.index_file_path, "r", encoding="utf-8") as f:
+                stored_index = json.load(f)
+            self._section_hashes = set(stored_index.get("section_hashes", []))
+            self._backlog_file_state = stored_index.get("backlog_file_state")
+        except (OSError, json.JSONDecodeError, AttributeError) as e:
+            logger.warning(f"Could not read processed section index at '{self.index_file_path}', starting empty: {e}")
+            self._section_hashes = set()
+            self._backlog_file_state = None
+
+    def is_backlog_unchanged(self, backlog_file_state: Optional[list[int]]) -> bool:
+        """True if the backlog has the same size and modification time as when the index was last saved."""
+        return backlog_file_state is not None and backlog_file_state == self._backlog_file_state
+
+    def contains(self, section_hash: str) -> bool:
+        return section_hash in self._section_hashes
+
+    def add(self, section_hash: str) -> None:
+        self._section_hashes.add(section_hash)
+
+    def retain_only(self, section_hashes: set[str]) -> None:
+        """Forgets sections no longer in the backlog, keeping the index as small as the backlog."""
+        self._section_hashes &= section_hashes
+
+    def save(self, backlog_file_state: Optional[list[int]]) -> None:
+        """
+        Writes the index to disk. Failures are logged, never raised.
+
+        Args:
+            backlog_file_state: The backlog's [size, mtime_ns] as read at the start of the run,
+                                so edits made while the run was in progress are picked up next time.
+        """
+        self._backlog_file_state = backlog_file_state
+        try:
+            ensure_cache_directory(self.cache_directory)
+            temporary_file_path = self.index_file_path + ".tmp"
+            with open(temporary_file_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"backlog_file_state": backlog_file_state, "section_hashes": sorted(self._section_hashes)},
+                    f,
+                    indent=2
+                )
+            os.replace(temporary_file_path, self.index_file_path)
+        except OSError as e:
+            logger.warning(f"Could not save processed section index to '{self.index_file_path}': {e}")
@@ -1,3 +1,6 @@
+from .cache_directory import ensure_cache_directory
 from .logging_setup import LoggingSetup
+from .slugger import make_unique_folder_name, slugify_title
+from .task_file_paths import find_task_file_path
 
-__all__ = ["LoggingSetup"]
+__all__ = ["LoggingSetup", "ensure_cache_directory", "find_task_file_path", "make_unique_folder_name", "slugify_title"]
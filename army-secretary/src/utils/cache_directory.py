@@ -0,0 +1,13 @@
+import os
+
+
+def ensure_cache_directory(cache_directory: str) -> None:
+    """
+    Creates the cache directory with a `.gitignore` that ignores everything in it,
+    so committing the goals folder never picks up cache files.
+    """
+    os.makedirs(cache_directory, exist_ok=True)
+    gitignore_path = os.path.join(cache_directory, ".gitignore")
+    if not os.path.exists(gitignore_path):
+        with open(gitignore_path, "w", encoding="utf-8") as f:
+            f.write("*\n")
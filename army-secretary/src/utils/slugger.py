@@ -0,0 +1,58 @@
+"""
+Local, deterministic folder names for backlog tasks.
+
+Most backlog titles are already short plain English, so turning them into a
+folder name does not need an LLM round trip. Titles that do not slug well are
+reported as such so the caller can still ask the LLM.
+"""
+import re
+from typing import Optional
+
+# Filler words that add length without helping tell goals apart
+STOPWORDS: frozenset[str] = frozenset({
+    "a", "an", "the", "and", "or", "of", "to", "in", "on", "for", "with", "by",
+    "at", "from", "into", "as", "is", "are", "be", "this", "that", "it", "its",
+})
+
+MAX_SLUG_LENGTH: int = 50
+MAX_SLUG_WORDS: int = 8
+
+
+def slugify_title(title: str, max_length: int = MAX_SLUG_LENGTH, max_words: int = MAX_SLUG_WORDS) -> Optional[str]:
+    """
+    Turns a task title into a lowercase, hyphen-separated folder name without stopwords.
+
+    Args:
+        title: The task title from the backlog.
+        max_length: Longest slug accepted.
+        max_words: Most words accepted after stopwords are removed.
+
+    Returns:
+        The slug, or None when the title is a poor fit for a local slug (non-ASCII,
+        too long, or empty after sanitizing) and should go to the LLM instead.
+    """
+    if not title or not title.isascii():
+        return None
+
+    words = re.findall(r"[a-z0-9]+", title.lower())
+    meaningful_words = [word for word in words if word not in STOPWORDS]
+    if not meaningful_words or len(meaningful_words) > max_words:
+        return None
+
+    slug = "-".join(meaningful_words)
+    if len(slug) > max_length:
+        return None
+    return slug
+
+
+def make_unique_folder_name(folder_name: str, taken_folder_names: set[str]) -> str:
+    """
+    Appends -2, -3, ... until the name is not in `taken_folder_names`, then records it as taken.
+    """
+    unique_folder_name = folder_name
+    suffix = 2
+    while unique_folder_name in taken_folder_names:
+        unique_folder_name = f"{folder_name}-{suffix}"
+        suffix += 1
+    taken_folder_names.add(unique_folder_name)
+    return unique_folder_name
@@ -0,0 +1,33 @@
+import os
+import re
+from typing import Optional
+
+BACKTICK_SPAN_PATTERN = re.compile(r"`([^`\n]+)`")
+
+
+def find_task_file_path(task_description: str, project_git_path: Optional[str]) -> Optional[str]:
+    """
+    Finds the file a task targets from the backtick-quoted paths in its description.
+
+    Args:
+        task_description: The task description from the backlog.
+        project_git_path: Root of the project the paths are relative to.
+
+    Returns:
+        The path relative to the project root with forward slashes, or None when no quoted
+        path exists in the project or several different ones do.
+    """
+    if not project_git_path:
+        return None
+
+    found_paths: list[str] = []
+    for span in BACKTICK_SPAN_PATTERN.findall(task_description):
+        candidate = span.strip().replace("\\", "/")
+        if candidate.startswith("./"):
+            candidate = candidate[2:]
+        if not candidate or os.path.isabs(candidate) or ".." in candidate.split("/"):
+            continue
+        if candidate not in found_paths and os.path.isfile(os.path.join(project_git_path, *candidate.split("/"))):
+            found_paths.append(candidate)
+
+    return found_paths[0] if len(found_paths) == 1 else None
@@ -0,0 +1,30 @@
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# The Secretary runs from src/ and imports its packages top-level (`from config import ...`)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+
+# The BacklogProcessor settings config.yaml would provide
+PROCESSOR_CONFIG_FIELDS = {
+    "max_concurrent_llm_calls": 1,
+    "folder_name_cache_max_entries": 0,
+    "backlog_intake_mode": "incremental",
+    "use_local_slugs": True,
+    "folder_name_batch_size": 0,
+    "default_llm_model_name": "gemini-flash",
+    "task_description_filename": "task-description.md",
+    "task_sidecar_filename": None,
+    "project_git_path": None,
+}
+
+
+@pytest.fixture
+def make_processor_config():
+    """Builds the config a BacklogProcessor reads, without loading config.yaml; keyword arguments override fields."""
+    def make(**overrides) -> SimpleNamespace:
+        return SimpleNamespace(**{**PROCESSOR_CONFIG_FIELDS, **overrides})
+    return make
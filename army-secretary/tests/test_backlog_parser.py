@@ -0,0 +1,37 @@
+from services.backlog_parser import parse_backlog_file, parse_backlog_lines
+
+BACKLOG_TEXT = "Intro text\n\n\n## Add login page\n\nFirst task.\n\n\n\n## \n\n## Fix footer\nSecond task.\n"
+
+
+def test_sections_report_their_exact_start_lines():
+    sections = list(parse_backlog_lines(BACKLOG_TEXT.splitlines(keepends=True)))
+
+    assert [(section.index, section.start_line, section.title) for section in sections] == [
+        (0, 1, None),
+        (1, 4, "Add login page"),
+        (2, 10, ""),
+        (3, 12, "Fix footer"),
+    ]
+    assert sections[1].description == "First task."
+    assert sections[3].description == "Second task."
+
+
+def test_leading_blank_lines_and_crlf_line_endings(tmp_path):
+    crlf_text = "\n\n" + BACKLOG_TEXT.replace("Intro text\n", "").replace("\n", "\r\n")
+    backlog_path = tmp_path / "BACKLOG.md"
+    backlog_path.write_bytes(crlf_text.encode("utf-8"))
+
+    raw_sections = list(parse_backlog_lines(crlf_text.splitlines(keepends=True)))
+    file_sections = list(parse_backlog_file(str(backlog_path)))
+
+    for sections in (raw_sections, file_sections):
+        assert [(section.start_line, section.title) for section in sections] == [(5, "Add login page"), (11, ""), (13, "Fix footer")]
+        assert sections[0].description == "First task."
+    assert raw_sections[2].content == "## Fix footer\r\nSecond task."
+    assert file_sections[2].content == "## Fix footer\nSecond task."
+
+
+def test_text_before_the_first_heading_points_at_its_first_line():
+    sections = list(parse_backlog_lines(["\n", "\n", "Stray note\n", "## Task\n", "Body\n"]))
+
+    assert [(section.start_line, section.title) for section in sections] == [(3, None), (4, "Task")]
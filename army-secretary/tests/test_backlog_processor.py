@@ -0,0 +1,119 @@
+import asyncio
+import os
+
+from models.goal_models import SanitizedGoalInfo, SanitizedGoalInfoBatch, SanitizedGoalInfoBatchItem
+import services.backlog_processor as backlog_processor_module
+from services.backlog_parser import BacklogSection, parse_backlog_lines
+from services.backlog_processor import BacklogProcessor
+
+
+def test_failed_section_is_retried_when_backlog_is_unchanged(tmp_path, make_processor_config):
+    backlog_path = tmp_path / "BACKLOG.md"
+    backlog_path.write_text("## Add login page\n\nFirst task.\n\n## Fix footer\n\nSecond task.\n", encoding="utf-8")
+    output_dir = str(tmp_path / "ai-goals")
+    attempted_titles: list[list[str]] = []
+
+    def run(failing_title):
+        processor = BacklogProcessor(llm_service=None, output_dir=output_dir, app_config=make_processor_config())
+        titles: list[str] = []
+
+        async def process_section(section, folder_name=None):
+            titles.append(section.title)
+            return None if section.title == failing_title else os.path.join(output_dir, folder_name)
+
+        processor._process_single_task_section = process_section
+        asyncio.run(processor.process_backlog_file(str(backlog_path)))
+        attempted_titles.append(titles)
+
+    run(failing_title="Fix footer")
+    run(failing_title=None)
+    run(failing_title=None)
+
+    assert attempted_titles == [["Add login page", "Fix footer"], ["Fix footer"], []]
+
+
+def test_existing_goal_folder_is_not_overwritten(tmp_path, make_processor_config):
+    output_dir = tmp_path / "ai-goals"
+    (output_dir / "fix-footer").mkdir(parents=True)
+    (output_dir / "fix-footer" / "task-description.md").write_text("Earlier goal.\n", encoding="utf-8")
+    processor = BacklogProcessor(llm_service=None, output_dir=str(output_dir), app_config=make_processor_config())
+    section = next(parse_backlog_lines(["## Fix footer\n", "\n", "Second task.\n"]))
+
+    task_folder_path = asyncio.run(processor._process_single_task_section(section, "fix-footer"))
+
+    assert task_folder_path == str(output_dir / "fix-footer-2")
+    assert (output_dir / "fix-footer" / "task-description.md").read_text(encoding="utf-8") == "Earlier goal.\n"
+    assert (output_dir / "fix-footer-2" / "task-description.md").read_text(encoding="utf-8") == "Second task.\n"
+
+
+class FakeFolderNameLlm:
+    """Answers batched folder-name requests with `batch_reply` and numbers the names of single requests."""
+
+    def __init__(self, batch_reply):
+        self.batch_reply = batch_reply
+        self.num_single_requests = 0
+
+    async def get_structured_output(self, messages, output_pydantic_model_type, llm_model_name):
+        if output_pydantic_model_type is SanitizedGoalInfoBatch:
+            return self.batch_reply
+        self.num_single_requests += 1
+        return SanitizedGoalInfo(folder_name=f"single-{self.num_single_requests}")
+
+
+def _run_batched_intake(tmp_path, make_processor_config, batch_reply):
+    backlog_path = tmp_path / "BACKLOG.md"
+    backlog_path.write_text("## Add login page\n\nOne.\n\n## Fix footer\n\nTwo.\n\n## Fix header\n\nThree.\n", encoding="utf-8")
+    app_config = make_processor_config(use_local_slugs=False, folder_name_batch_size=3, backlog_intake_mode="all")
+    llm_service = FakeFolderNameLlm(batch_reply)
+    processor = BacklogProcessor(llm_service=llm_service, output_dir=str(tmp_path / "ai-goals"), app_config=app_config)
+    asyncio.run(processor.process_backlog_file(str(backlog_path)))
+    return [os.path.basename(folder) for folder in processor.created_folders], llm_service
+
+
+def test_batched_names_fall_back_per_task_when_the_reply_is_partial(tmp_path, make_processor_config):
+    batch_reply = SanitizedGoalInfoBatch(goals=[
+        SanitizedGoalInfoBatchItem(task_index=1, folder_name="fix-site-part"),
+        SanitizedGoalInfoBatchItem(task_index=2, folder_name="fix-site-part"),
+        SanitizedGoalInfoBatchItem(task_index=2, folder_name="ignored-second-name"),
+        SanitizedGoalInfoBatchItem(task_index=7, folder_name="not-a-requested-task"),
+    ])
+
+    created_folder_names, llm_service = _run_batched_intake(tmp_path, make_processor_config, batch_reply)
+
+    assert created_folder_names == ["single-1", "fix-site-part", "fix-site-part-2"]
+    assert llm_service.num_single_requests == 1
+
+
+def test_batched_names_fall_back_per_task_when_the_reply_is_unusable(tmp_path, make_processor_config):
+    created_folder_names, llm_service = _run_batched_intake(tmp_path, make_processor_config, batch_reply=None)
+
+    assert sorted(created_folder_names) == ["single-1", "single-2", "single-3"]
+    assert llm_service.num_single_requests == 3
+
+
+def test_sections_are_processed_while_the_backlog_is_still_being_read(tmp_path, monkeypatch, make_processor_config):
+    num_sections_read = 0
+    read_ahead_counts: list[int] = []
+
+    def parse_long_backlog(backlog_filepath):
+        nonlocal num_sections_read
+        for index in range(200):
+            num_sections_read += 1
+            yield BacklogSection(index, index * 3 + 1, f"Task {index}", "Do it.", f"## Task {index}\n\nDo it.")
+
+    monkeypatch.setattr(backlog_processor_module, "parse_backlog_file", parse_long_backlog)
+    app_config = make_processor_config(max_concurrent_llm_calls=2, backlog_intake_mode="all")
+    processor = BacklogProcessor(llm_service=None, output_dir=str(tmp_path / "ai-goals"), app_config=app_config)
+
+    async def process_section(section, folder_name=None):
+        read_ahead_counts.append(num_sections_read - section.index)
+        await asyncio.sleep(0)
+        return str(tmp_path / "ai-goals" / folder_name)
+
+    processor._process_single_task_section = process_section
+    (tmp_path / "BACKLOG.md").write_text("", encoding="utf-8")
+    asyncio.run(processor.process_backlog_file(str(tmp_path / "BACKLOG.md")))
+
+    assert len(processor.created_folders) == 200
+    assert processor.created_folders[:2] == [str(tmp_path / "ai-goals" / "task-0"), str(tmp_path / "ai-goals" / "task-1")]
+    assert max(read_ahead_counts) <= 5
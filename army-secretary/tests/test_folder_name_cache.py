@@ -0,0 +1,49 @@
+import asyncio
+
+from models.goal_models import SanitizedGoalInfo
+from services.backlog_processor import BacklogProcessor
+from services.folder_name_cache import FolderNameCache
+
+
+class FakeLlmService:
+    def __init__(self, folder_name):
+        self.folder_name = folder_name
+        self.num_calls = 0
+
+    async def get_structured_output(self, messages, output_pydantic_model_type, llm_model_name):
+        self.num_calls += 1
+        return SanitizedGoalInfo(folder_name=self.folder_name)
+
+
+def test_key_ignores_case_and_whitespace_but_not_model():
+    key = FolderNameCache.make_key("Fix footer", "Move the  links\ninto the footer.", "gemini-flash")
+
+    assert FolderNameCache.make_key("  fix FOOTER ", "move the links into the footer.", "gemini-flash") == key
+    assert FolderNameCache.make_key("Fix footer", "Move the links into the header.", "gemini-flash") != key
+    assert FolderNameCache.make_key("Fix footer", "Move the  links\ninto the footer.", "gemini-pro") != key
+
+
+def test_least_recently_used_entries_are_evicted_and_order_survives_reload(tmp_path):
+    cache = FolderNameCache(str(tmp_path / ".cache"), max_entries=2)
+    cache.put("a", "goal-a")
+    cache.put("b", "goal-b")
+    assert cache.get("a") == "goal-a"
+    cache.put("c", "goal-c")
+    cache.save()
+
+    reloaded_cache = FolderNameCache(str(tmp_path / ".cache"), max_entries=2)
+    assert reloaded_cache.get("b") is None
+    reloaded_cache.put("d", "goal-d")
+    assert (reloaded_cache.get("a"), reloaded_cache.get("c"), reloaded_cache.get("d")) == (None, "goal-c", "goal-d")
+
+
+def test_cache_hit_skips_the_llm(tmp_path, make_processor_config):
+    llm_service = FakeLlmService("fix-site-footer")
+    app_config = make_processor_config(folder_name_cache_max_entries=10, backlog_intake_mode="all")
+    processor = BacklogProcessor(llm_service=llm_service, output_dir=str(tmp_path / "ai-goals"), app_config=app_config)
+
+    first_folder_name = asyncio.run(processor._sanitize_title_with_llm("Move the links into the footer.", "Fix footer"))
+    second_folder_name = asyncio.run(processor._sanitize_title_with_llm("move the links  into the footer.", "FIX FOOTER"))
+
+    assert first_folder_name == second_folder_name == "fix-site-footer"
+    assert llm_service.num_calls == 1
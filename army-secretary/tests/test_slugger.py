@@ -0,0 +1,29 @@
+from utils.slugger import make_unique_folder_name, slugify_title
+
+
+def test_plain_titles_become_slugs_without_stopwords():
+    assert slugify_title("Fix the footer on the About page") == "fix-footer-about-page"
+    assert slugify_title("Add `--dry-run` flag to main.py!") == "add-dry-run-flag-main-py"
+
+
+def test_unicode_and_empty_titles_are_left_to_the_llm():
+    assert slugify_title("Übersetze die Startseite") is None
+    assert slugify_title("修复页脚") is None
+    assert slugify_title("") is None
+    assert slugify_title("The and of") is None
+
+
+def test_long_titles_are_left_to_the_llm():
+    assert slugify_title("one two three four five six seven eight") == "one-two-three-four-five-six-seven-eight"
+    assert slugify_title("one two three four five six seven eight nine") is None
+    assert slugify_title("internationalization " * 3) is None
+    assert slugify_title("internationalization localization", max_length=20) is None
+
+
+def test_colliding_names_get_numbered_suffixes():
+    taken_folder_names = {"fix-footer", "fix-footer-2"}
+
+    assert make_unique_folder_name("fix-footer", taken_folder_names) == "fix-footer-3"
+    assert make_unique_folder_name("fix-footer", taken_folder_names) == "fix-footer-4"
+    assert make_unique_folder_name("add-login", taken_folder_names) == "add-login"
+    assert taken_folder_names == {"fix-footer", "fix-footer-2", "fix-footer-3", "fix-footer-4", "add-login"}